@@ -6,8 +6,9 @@ tracking player statistics and league management for the 2025/26 season.
 """
 
 import streamlit as st
-import pandas as pd
-from src.data_processor import get_player_stats, get_medal_emoji
+from src.data_fetcher import format_snapshot_age
+from src.data_processor import get_leaderboard
+from src.pagination import page_picker
 from src.style import load_css
 
 
@@ -23,38 +24,20 @@ st.set_page_config(
 load_css()
 
 
-def style_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Apply styling to the player stats dataframe.
-
-    Args:
-        df: DataFrame with player stats
-
-    Returns:
-        Styled DataFrame
-    """
-    # Add rank column with medals
-    df_display = df.copy()
-    df_display.insert(0, "Rank", [get_medal_emoji(i) for i in range(len(df))])
-
-    # Rename columns for display
-    column_mapping = {
-        "name": "Player",
-        "appearances": "Apps",
-        "goals": "Goals",
-        "assists": "Assists",
-        "clean_sheets": "Clean Sheets",
-        "mom1": "MoM 1",
-        "mom2": "MoM 2",
-        "mom3": "MoM 3",
-        "dod": "DoD",
-        "yellow_cards": "Yellow Cards",
-        "red_cards": "Red Cards",
-        "fantasy_points": "Fantasy Points",
-    }
-    df_display = df_display.rename(columns=column_mapping)
-
-    return df_display
+# Leaderboard columns: stat -> (label, number format)
+STAT_COLUMNS = {
+    "appearances": ("Apps", "%d"),
+    "goals": ("Goals", "%d"),
+    "assists": ("Assists", "%d"),
+    "clean_sheets": ("Clean Sheets", "%d"),
+    "yellow_cards": ("Yellow Cards", "%d"),
+    "red_cards": ("Red Cards", "%d"),
+    "mom1": ("MoM 1", "%d"),
+    "mom2": ("MoM 2", "%d"),
+    "mom3": ("MoM 3", "%d"),
+    "dod": ("DoD", "%d"),
+    "fantasy_points": ("Fantasy Points", "%.1f"),
+}
 
 
 def main():
@@ -89,9 +72,11 @@ def main():
     # Load data
     try:
         with st.spinner("Loading player statistics..."):
-            player_stats_df = get_player_stats()
+            leaderboard = get_leaderboard()
 
-        if player_stats_df.empty:
+        st.caption(f"🕒 {format_snapshot_age()}")
+
+        if not len(leaderboard):
             st.warning("No player stats available yet.")
             return
 
@@ -102,45 +87,55 @@ def main():
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("Total Players", len(player_stats_df))
+            st.metric("Total Players", len(leaderboard))
 
         with col2:
-            total_goals = int(player_stats_df["goals"].sum())
+            total_goals = int(leaderboard.totals["goals"])
             st.metric("Total Goals", total_goals)
 
         with col3:
-            total_assists = int(player_stats_df["assists"].sum())
+            total_assists = int(leaderboard.totals["assists"])
             st.metric("Total Assists", total_assists)
 
         with col4:
-            total_matches = int(player_stats_df["appearances"].max())
+            total_matches = int(leaderboard.leaders("appearances").iloc[0]["appearances"])
             st.metric("Matches Played", total_matches)
 
         st.markdown("---")
 
-        # Style the dataframe for display
-        df_display = style_dataframe(player_stats_df)
+        # Only the chosen columns of the visible page are sent to the browser
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            sort_by = st.selectbox(
+                "Sort by",
+                leaderboard.STATS,
+                format_func=lambda stat: STAT_COLUMNS[stat][0],
+            )
+
+        with col2:
+            columns = st.multiselect(
+                "Columns",
+                list(STAT_COLUMNS),
+                default=list(STAT_COLUMNS),
+                format_func=lambda stat: STAT_COLUMNS[stat][0],
+            )
+
+        start, end = page_picker(len(leaderboard), key="leaderboard_page")
 
         # Display the dataframe with custom formatting
         st.dataframe(
-            df_display,
+            leaderboard.page(sort_by, columns, start, end),
             hide_index=True,
             use_container_width=True,
-            height=600,
             column_config={
-                "Rank": st.column_config.TextColumn("Rank", width="small"),
-                "Player": st.column_config.TextColumn("Player", width="medium"),
-                "Apps": st.column_config.NumberColumn("Apps", format="%d"),
-                "Goals": st.column_config.NumberColumn("Goals", format="%d"),
-                "Assists": st.column_config.NumberColumn("Assists", format="%d"),
-                "Clean Sheets": st.column_config.NumberColumn("Clean Sheets", format="%d"),
-                "MoM 1": st.column_config.NumberColumn("MoM 1", format="%d"),
-                "MoM 2": st.column_config.NumberColumn("MoM 2", format="%d"),
-                "MoM 3": st.column_config.NumberColumn("MoM 3", format="%d"),
-                "DoD": st.column_config.NumberColumn("DoD", format="%d"),
-                "Yellow Cards": st.column_config.NumberColumn("Yellow Cards", format="%d"),
-                "Red Cards": st.column_config.NumberColumn("Red Cards", format="%d"),
-                "Fantasy Points": st.column_config.NumberColumn(
+                "rank": st.column_config.TextColumn("Rank", width="small"),
+                "name": st.column_config.TextColumn("Player", width="medium"),
+                **{
+                    stat: st.column_config.NumberColumn(label, format=number_format)
+                    for stat, (label, number_format) in STAT_COLUMNS.items()
+                },
+                "fantasy_points": st.column_config.NumberColumn(
                     "Fantasy Points",
                     format="%.1f",
                     help="Total fantasy points earned this season",
@@ -156,7 +151,7 @@ def main():
 
         with col1:
             st.markdown("### 🥇 Top Scorer")
-            top_scorer = player_stats_df.nlargest(1, "goals")
+            top_scorer = leaderboard.leaders("goals")
             if not top_scorer.empty:
                 st.markdown(
                     f"**{top_scorer.iloc[0]['name']}**  \n{int(top_scorer.iloc[0]['goals'])} goals"
@@ -164,7 +159,7 @@ def main():
 
         with col2:
             st.markdown("### 🅰️ Top Assister")
-            top_assister = player_stats_df.nlargest(1, "assists")
+            top_assister = leaderboard.leaders("assists")
             if not top_assister.empty:
                 st.markdown(
                     f"**{top_assister.iloc[0]['name']}**  \n{int(top_assister.iloc[0]['assists'])} assists"
@@ -172,7 +167,7 @@ def main():
 
         with col3:
             st.markdown("### 🛡️ Most Clean Sheets")
-            top_defender = player_stats_df.nlargest(1, "clean_sheets")
+            top_defender = leaderboard.leaders("clean_sheets")
             if not top_defender.empty:
                 st.markdown(
                     f"**{top_defender.iloc[0]['name']}**  \n{int(top_defender.iloc[0]['clean_sheets'])} clean sheets"
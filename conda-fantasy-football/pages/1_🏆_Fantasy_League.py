@@ -2,7 +2,9 @@
 
 import streamlit as st
 import pandas as pd
-from src.fantasy_processor import get_fantasy_league, get_team_players_df
+from src.data_fetcher import format_snapshot_age
+from src.fantasy_processor import get_fantasy_standings, get_fantasy_tables, get_team_squad
+from src.season_model import get_season_model
 from src.style import load_css
 
 
@@ -16,6 +18,44 @@ st.set_page_config(
 load_css()
 
 
+@st.fragment
+def team_squad(teams_df: pd.DataFrame, squads_df: pd.DataFrame):
+    """
+    Squad table for the selected team (the leader by default).
+
+    Runs as a fragment, so switching teams only reruns this part of the page,
+    and only the selected team's squad is sent to the browser.
+    """
+    position = st.selectbox(
+        "Team squad",
+        range(len(teams_df)),
+        format_func=lambda i: f"{teams_df['team_name'].iloc[i]} - {teams_df['manager_name'].iloc[i]}",
+    )
+    team = teams_df.iloc[position]
+    players_df = get_team_squad(squads_df, team)
+
+    st.markdown(f"#### {team['team_name']} ({team['total_points']:.1f} pts)")
+    if not players_df.empty:
+        st.markdown(f"**Squad ({len(players_df)} players)**")
+
+        # Display players table
+        st.dataframe(
+            players_df,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "name": st.column_config.TextColumn("Player", width="medium"),
+                "position": st.column_config.TextColumn("Position", width="small"),
+                "price": st.column_config.NumberColumn("Price", format="£%.1f"),
+                "points": st.column_config.NumberColumn(
+                    "Points", format="%.1f"
+                ),
+            },
+        )
+    else:
+        st.info("No players in this team yet.")
+
+
 def main():
     """Fantasy League page."""
 
@@ -25,7 +65,11 @@ def main():
 
     try:
         with st.spinner("Loading fantasy league data..."):
-            teams_df = get_fantasy_league()
+            # One model per rerun, so the standings line up with the teams table
+            model = get_season_model()
+            teams_df, squads_df = get_fantasy_tables(model)
+
+        st.caption(f"🕒 {format_snapshot_age()}")
 
         if teams_df.empty:
             st.warning("No fantasy teams found yet.")
@@ -44,60 +88,29 @@ def main():
 
         st.markdown("---")
 
-        # Display teams with expanders
-        for idx, team in teams_df.iterrows():
-            rank = team["rank"]
-            team_name = team["team_name"]
-            manager_name = team["manager_name"]
-            total_points = team["total_points"]
-            players = team["players"]
-
-            # Determine medal or rank
-            if rank == 1:
-                rank_display = "🥇"
-                bg_color = "#fbbf24"  # gold
-            elif rank == 2:
-                rank_display = "🥈"
-                bg_color = "#9ca3af"  # silver
-            elif rank == 3:
-                rank_display = "🥉"
-                bg_color = "#d97706"  # bronze
-            else:
-                rank_display = f"#{rank}"
-                bg_color = "#334155"  # slate
-
-            # Create expander for each team
-            with st.expander(
-                f"{rank_display} **{team_name}** - {manager_name} ({total_points:.1f} pts)",
-                expanded=(rank == 1),  # Expand first place by default
-            ):
-                if players:
-                    players_df = get_team_players_df(players)
-
-                    st.markdown(f"**Squad ({len(players)} players)**")
-
-                    # Display players table
-                    st.dataframe(
-                        players_df,
-                        hide_index=True,
-                        use_container_width=True,
-                        column_config={
-                            "name": st.column_config.TextColumn("Player", width="medium"),
-                            "position": st.column_config.TextColumn("Position", width="small"),
-                            "price": st.column_config.NumberColumn("Price", format="£%.1f"),
-                            "points": st.column_config.NumberColumn(
-                                "Points", format="%.1f"
-                            ),
-                        },
-                    )
-                else:
-                    st.info("No players in this team yet.")
+        # Standings
+        st.dataframe(
+            get_fantasy_standings(model),
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "rank": st.column_config.TextColumn("Rank", width="small"),
+                "team_name": "Team",
+                "manager_name": "Manager",
+                "players": st.column_config.NumberColumn("Players", format="%d"),
+                "total_points": st.column_config.NumberColumn("Points", format="%.1f"),
+            },
+        )
+
+        st.markdown("---")
+
+        team_squad(teams_df, squads_df)
 
         # Footer
         st.markdown("---")
         st.markdown(
             "<div style='text-align: center; color: #64748b;'>"
-            "<p>Expand any team to view their full roster and player points</p>"
+            "<p>Pick any team to view their full roster and player points</p>"
             "<p>Data updates automatically on page refresh</p>"
             "</div>",
             unsafe_allow_html=True,
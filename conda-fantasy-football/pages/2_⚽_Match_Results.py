@@ -1,8 +1,9 @@
 """Match Results page - All matches from the season."""
 
 import streamlit as st
-import pandas as pd
-from src.match_processor import get_matches, get_match_result_badge
+from src.data_fetcher import format_snapshot_age
+from src.match_processor import get_match_index, get_match_result_badge
+from src.pagination import paginate
 from src.style import load_css
 
 
@@ -25,35 +26,55 @@ def main():
 
     try:
         with st.spinner("Loading match data..."):
-            matches = get_matches()
+            index = get_match_index()
 
-        if not matches:
+        st.caption(f"🕒 {format_snapshot_age()}")
+
+        if index.matches.empty:
             st.warning("No matches found yet.")
             st.info("Match results will appear here once games are played.")
             return
 
-        # Filter by team
-        teams = sorted(set(m["team"] for m in matches))
-        if len(teams) > 1:
-            selected_team = st.selectbox(
-                "Filter by team:",
-                ["All"] + teams,
-                index=0,
+        # Filters (each is a lookup in the prebuilt index)
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            team = st.selectbox("Team", index.options("team"), index=None, placeholder="All teams")
+
+        with col2:
+            opponent = st.selectbox("Opponent", index.options("opponent"), index=None, placeholder="All opponents")
+
+        with col3:
+            gameweek = st.selectbox("Gameweek", index.options("gameweek"), index=None, placeholder="All gameweeks")
+
+        with col4:
+            player_id = st.selectbox(
+                "Player",
+                index.options("player_id"),
+                index=None,
+                format_func=lambda player_id: index.player_names[player_id],
+                placeholder="All players",
             )
 
-            if selected_team != "All":
-                matches = [m for m in matches if m["team"] == selected_team]
+        start = end = None
+        date_range = index.date_range()
+        if date_range is not None:
+            first, last = (date.date() for date in date_range)
+            with col5:
+                picked = st.date_input("Dates", value=(first, last), min_value=first, max_value=last)
+            # Only filter on dates once a full range other than the whole season is picked
+            if len(picked) == 2 and tuple(picked) != (first, last):
+                start, end = picked
+
+        positions, (wins, draws, losses) = index.select(
+            start=start, end=end, team=team, opponent=opponent, gameweek=gameweek, player_id=player_id
+        )
 
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
 
-        total_matches = len(matches)
-        wins = sum(1 for m in matches if m["cpr_score"] > m["opponent_score"])
-        draws = sum(1 for m in matches if m["cpr_score"] == m["opponent_score"])
-        losses = sum(1 for m in matches if m["cpr_score"] < m["opponent_score"])
-
         with col1:
-            st.metric("Matches", total_matches)
+            st.metric("Matches", len(positions))
 
         with col2:
             st.metric("Wins", wins)
@@ -66,16 +87,14 @@ def main():
 
         st.markdown("---")
 
-        # Display matches with expanders
-        for match in matches:
-            date = match["date"]
-            team = match["team"]
-            opponent = match["opponent"]
-            score = match["score"]
-            cpr_score = match["cpr_score"]
-            opponent_score = match["opponent_score"]
-            gameweek = match["gameweek"]
-            players = match["players"]
+        if not len(positions):
+            st.info("No matches match these filters.")
+
+        # Display one page of matches with expanders
+        page = paginate(index.matches.iloc[positions], key="matches_page")
+        for match in page.itertuples(index=False):
+            cpr_score = match.cpr_score
+            opponent_score = match.opponent_score
 
             # Result badge
             result = get_match_result_badge(cpr_score, opponent_score)
@@ -83,33 +102,24 @@ def main():
             # Result text
             if cpr_score > opponent_score:
                 result_text = "WIN"
-                result_color = "green"
             elif cpr_score < opponent_score:
                 result_text = "LOSS"
-                result_color = "red"
             else:
                 result_text = "DRAW"
-                result_color = "orange"
 
             # Create expander for each match
             with st.expander(
-                f"{result} **{date}** - {team} {score} {opponent} - *{result_text}*",
+                f"{result} **{match.date}** - {match.team} {match.score} {match.opponent} - *{result_text}*",
                 expanded=False,
             ):
-                st.markdown(f"**Gameweek:** {gameweek}")
-                st.markdown(f"**Result:** {team} {score} {opponent}")
-
-                if players:
-                    # Convert players to DataFrame
-                    players_df = pd.DataFrame(players)
-
-                    # Sort by points (descending)
-                    players_df = players_df.sort_values(
-                        "points", ascending=False
-                    ).reset_index(drop=True)
+                st.markdown(f"**Gameweek:** {match.gameweek}")
+                st.markdown(f"**Result:** {match.team} {match.score} {match.opponent}")
 
+                # Already sorted by points (descending)
+                players_df = index.players(match.match_id)
+                if not players_df.empty:
                     st.markdown("---")
-                    st.markdown(f"**Player Performances ({len(players)} players)**")
+                    st.markdown(f"**Player Performances ({len(players_df)} players)**")
 
                     # Display players table
                     st.dataframe(
@@ -135,10 +145,11 @@ def main():
                     )
 
                     # Top performers
-                    top_scorer = players_df.nlargest(1, "goals")
-                    if not top_scorer.empty and top_scorer.iloc[0]["goals"] > 0:
+                    goals = players_df["goals"].to_numpy()
+                    if goals.size and goals.max() > 0:
+                        top_scorer = players_df.iloc[int(goals.argmax())]
                         st.success(
-                            f"⚽ **Top Scorer:** {top_scorer.iloc[0]['name']} ({int(top_scorer.iloc[0]['goals'])} goals)"
+                            f"⚽ **Top Scorer:** {top_scorer['name']} ({int(top_scorer['goals'])} goals)"
                         )
 
         # Footer
@@ -2,7 +2,9 @@
 
 import streamlit as st
 import pandas as pd
+from src.data_fetcher import format_snapshot_age
 from src.payment_processor import get_player_payments
+from src.pagination import paginate
 from src.style import load_css
 
 
@@ -21,6 +23,167 @@ def format_currency(amount: float) -> str:
     return f"£{amount:.2f}"
 
 
+def balance_text(balance: float) -> str:
+    """Describe a balance as owed, in credit or paid up."""
+    if balance > 0:
+        return f"Owes {format_currency(balance)}"
+    if balance < 0:
+        return f"Credit {format_currency(abs(balance))}"
+    return "Paid up"
+
+
+def show_player_details(player: pd.Series):
+    """Balance summary and fee, payment and fine tables for one player."""
+    name = player["name"]
+    balance = player["balance"]
+    total_owed = player["total_owed"]
+    paid = player["paid"]
+    match_fees = player["match_fees"]
+    season_fees = player["season_fees"]
+    match_details = player["match_details"]
+    payment_details = player["payment_details"]
+    fine_details = player["fine_details"]
+
+    st.markdown(f"#### {name}")
+
+    # Balance summary
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("**Total Owed**")
+        st.markdown(f"<h3>{format_currency(total_owed)}</h3>", unsafe_allow_html=True)
+        st.caption(
+            f"Match fees: {format_currency(match_fees)} • Season: {format_currency(season_fees)}"
+        )
+
+    with col2:
+        st.markdown("**Total Paid**")
+        st.markdown(f"<h3 style='color: green;'>{format_currency(paid)}</h3>", unsafe_allow_html=True)
+        st.caption(f"{len(payment_details)} payment(s)")
+
+    with col3:
+        st.markdown("**Balance**")
+        color = "red" if balance > 0 else "green" if balance < 0 else "gray"
+        st.markdown(
+            f"<h3 style='color: {color};'>{format_currency(abs(balance))}</h3>",
+            unsafe_allow_html=True,
+        )
+        st.caption(balance_text(balance))
+
+    st.markdown("---")
+
+    # Tabs for details
+    tab1, tab2, tab3 = st.tabs(["Match Fees", "Payments", "Fines"])
+
+    with tab1:
+        if match_details:
+            match_df = pd.DataFrame(match_details)
+            st.dataframe(
+                match_df,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "date": "Date",
+                    "game": "Match",
+                    "fee": st.column_config.NumberColumn("Fee", format="£%.2f"),
+                },
+            )
+            st.caption(
+                f"Total: {format_currency(sum(m['fee'] for m in match_details))}"
+            )
+        else:
+            st.info("No match fees recorded")
+
+    with tab2:
+        if payment_details:
+            payment_df = pd.DataFrame(payment_details)
+            st.dataframe(
+                payment_df,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "date": "Date",
+                    "description": "Description",
+                    "amount": st.column_config.NumberColumn(
+                        "Amount", format="£%.2f"
+                    ),
+                },
+            )
+            st.caption(
+                f"Total: {format_currency(sum(p['amount'] for p in payment_details))}"
+            )
+        else:
+            st.info("No payments recorded")
+
+    with tab3:
+        if fine_details:
+            fine_df = pd.DataFrame(fine_details)
+            st.dataframe(
+                fine_df,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "date": "Date",
+                    "description": "Description",
+                    "amount": st.column_config.NumberColumn(
+                        "Fine", format="£%.2f"
+                    ),
+                },
+            )
+            st.caption(
+                f"Total: {format_currency(sum(f['amount'] for f in fine_details))}"
+            )
+        else:
+            st.info("No fines")
+
+
+@st.fragment
+def player_browser(players_df: pd.DataFrame):
+    """
+    Paginated summary table, plus the breakdown of the selected player.
+
+    Runs as a fragment, so paging and picking a player only rerun this part of
+    the page, and detail tables are only built for the selected player.
+    """
+    page_df = paginate(players_df, key="payments_page")
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "rank": page_df.index + 1,
+                "name": page_df["name"],
+                "match_count": page_df["match_count"],
+                "total_owed": page_df["total_owed"],
+                "paid": page_df["paid"],
+                "balance": page_df["balance"],
+                "status": [balance_text(balance) for balance in page_df["balance"]],
+            }
+        ),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "rank": st.column_config.NumberColumn("#", format="%d"),
+            "name": "Player",
+            "match_count": st.column_config.NumberColumn("Matches", format="%d"),
+            "total_owed": st.column_config.NumberColumn("Owed", format="£%.2f"),
+            "paid": st.column_config.NumberColumn("Paid", format="£%.2f"),
+            "balance": st.column_config.NumberColumn("Balance", format="£%.2f"),
+            "status": "Status",
+        },
+    )
+
+    names = players_df["name"].astype(str).tolist()
+    position = st.selectbox(
+        "Payment breakdown",
+        range(len(names)),
+        index=None,
+        format_func=lambda i: names[i],
+        placeholder="Select a player...",
+    )
+    if position is not None:
+        st.markdown("---")
+        show_player_details(players_df.iloc[position])
+
+
 def main():
     """Payments page."""
 
@@ -32,6 +195,8 @@ def main():
         with st.spinner("Loading payment data..."):
             players_df = get_player_payments()
 
+        st.caption(f"🕒 {format_snapshot_age()}")
+
         if players_df.empty:
             st.warning("No payment data found yet.")
             return
@@ -59,131 +224,13 @@ def main():
 
         st.markdown("---")
 
-        # Display players with expanders
-        for idx, player in players_df.iterrows():
-            name = player["name"]
-            balance = player["balance"]
-            total_owed = player["total_owed"]
-            paid = player["paid"]
-            match_count = player["match_count"]
-            match_fees = player["match_fees"]
-            season_fees = player["season_fees"]
-            fines = player["fines"]
-            match_details = player["match_details"]
-            payment_details = player["payment_details"]
-            fine_details = player["fine_details"]
-
-            # Determine balance color and text
-            if balance > 0:
-                balance_text = f"Owes {format_currency(balance)}"
-                balance_color = "red"
-            elif balance < 0:
-                balance_text = f"Credit {format_currency(abs(balance))}"
-                balance_color = "green"
-            else:
-                balance_text = "Paid up"
-                balance_color = "gray"
-
-            # Create expander for each player
-            with st.expander(
-                f"#{idx + 1} **{name}** - {balance_text} ({match_count} matches)",
-                expanded=False,
-            ):
-                # Balance summary
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.markdown("**Total Owed**")
-                    st.markdown(f"<h3>{format_currency(total_owed)}</h3>", unsafe_allow_html=True)
-                    st.caption(
-                        f"Match fees: {format_currency(match_fees)} • Season: {format_currency(season_fees)}"
-                    )
-
-                with col2:
-                    st.markdown("**Total Paid**")
-                    st.markdown(f"<h3 style='color: green;'>{format_currency(paid)}</h3>", unsafe_allow_html=True)
-                    st.caption(f"{len(payment_details)} payment(s)")
-
-                with col3:
-                    st.markdown("**Balance**")
-                    color = "red" if balance > 0 else "green" if balance < 0 else "gray"
-                    st.markdown(
-                        f"<h3 style='color: {color};'>{format_currency(abs(balance))}</h3>",
-                        unsafe_allow_html=True,
-                    )
-                    st.caption(balance_text)
-
-                st.markdown("---")
-
-                # Tabs for details
-                tab1, tab2, tab3 = st.tabs(["Match Fees", "Payments", "Fines"])
-
-                with tab1:
-                    if match_details:
-                        match_df = pd.DataFrame(match_details)
-                        st.dataframe(
-                            match_df,
-                            hide_index=True,
-                            use_container_width=True,
-                            column_config={
-                                "date": "Date",
-                                "game": "Match",
-                                "fee": st.column_config.NumberColumn("Fee", format="£%.2f"),
-                            },
-                        )
-                        st.caption(
-                            f"Total: {format_currency(sum(m['fee'] for m in match_details))}"
-                        )
-                    else:
-                        st.info("No match fees recorded")
-
-                with tab2:
-                    if payment_details:
-                        payment_df = pd.DataFrame(payment_details)
-                        st.dataframe(
-                            payment_df,
-                            hide_index=True,
-                            use_container_width=True,
-                            column_config={
-                                "date": "Date",
-                                "description": "Description",
-                                "amount": st.column_config.NumberColumn(
-                                    "Amount", format="£%.2f"
-                                ),
-                            },
-                        )
-                        st.caption(
-                            f"Total: {format_currency(sum(p['amount'] for p in payment_details))}"
-                        )
-                    else:
-                        st.info("No payments recorded")
-
-                with tab3:
-                    if fine_details:
-                        fine_df = pd.DataFrame(fine_details)
-                        st.dataframe(
-                            fine_df,
-                            hide_index=True,
-                            use_container_width=True,
-                            column_config={
-                                "date": "Date",
-                                "description": "Description",
-                                "amount": st.column_config.NumberColumn(
-                                    "Fine", format="£%.2f"
-                                ),
-                            },
-                        )
-                        st.caption(
-                            f"Total: {format_currency(sum(f['amount'] for f in fine_details))}"
-                        )
-                    else:
-                        st.info("No fines")
+        player_browser(players_df)
 
         # Footer
         st.markdown("---")
         st.markdown(
             "<div style='text-align: center; color: #64748b;'>"
-            "<p>Expand any player to view detailed payment breakdown</p>"
+            "<p>Select a player to view their detailed payment breakdown</p>"
             "<p>Data updates automatically on page refresh</p>"
             "</div>",
             unsafe_allow_html=True,
@@ -2,7 +2,9 @@
 
 import streamlit as st
 import pandas as pd
-from src.fines_processor import get_player_fines, calculate_filtered_fines
+from src.data_fetcher import format_snapshot_age
+from src.fines_processor import get_player_fines, get_fines_index, get_fines_summary
+from src.season_model import get_season_model
 from src.style import load_css
 
 
@@ -15,6 +17,9 @@ st.set_page_config(
 # Load custom CSS
 load_css()
 
+# Default limit for regular fines; larger amounts count as Miscellaneous
+REGULAR_FINE_LIMIT = 5.0
+
 
 def format_currency(amount: float) -> str:
     """Format amount as currency."""
@@ -30,21 +35,33 @@ def main():
 
     try:
         with st.spinner("Loading fines data..."):
-            players_df = get_player_fines()
+            # One model per rerun, so the fines, index and summary rows line up
+            # even if a background refresh lands part way through
+            model = get_season_model()
+            players_df = get_player_fines(model)
+
+        st.caption(f"🕒 {format_snapshot_age()}")
 
         if players_df.empty:
             st.warning("No fines data found.")
             st.info("Player fines will appear here once recorded.")
             return
 
-        # Calculate summary stats (excluding fines above £5)
-        total_fines = 0.0
-        total_count = 0
-        for _, player in players_df.iterrows():
-            filtered = calculate_filtered_fines(player["fine_details"], max_amount=5.0)
-            total_fines += filtered["total"]
-            total_count += filtered["count"]
+        # Fines above the limit are shown as miscellaneous rather than counted
+        fines_index = get_fines_index(model)
+        max_amount = st.slider(
+            "Regular fine limit (£)",
+            min_value=0.0,
+            max_value=max(fines_index.max_amount, REGULAR_FINE_LIMIT),
+            value=REGULAR_FINE_LIMIT,
+            step=0.5,
+            help="Fines above this amount are listed as Miscellaneous",
+        )
+        summary = get_fines_summary(max_amount, model)
 
+        # Calculate summary stats (excluding fines above the limit)
+        total_fines = summary["total"].sum()
+        total_count = int(summary["count"].sum())
         average_fine = total_fines / total_count if total_count > 0 else 0.0
 
         # Summary metrics
@@ -61,15 +78,10 @@ def main():
 
         st.markdown("---")
 
-        # Sort players by filtered fines (≤ £5 only) for proper display order
-        def get_filtered_total(player_row):
-            filtered = calculate_filtered_fines(player_row["fine_details"], max_amount=5.0)
-            return filtered["total"]
-
-        players_df["_filtered_total"] = players_df.apply(get_filtered_total, axis=1)
-        players_df = players_df.sort_values("_filtered_total", ascending=False).reset_index(
-            drop=True
-        )
+        # Sort players by filtered fines (regular fines only) for proper display order
+        order = summary["total"].sort_values(ascending=False).index
+        players_df = players_df.loc[order].reset_index(drop=True)
+        summary = summary.loc[order].reset_index(drop=True)
 
         # Display players with expanders
         for idx, player in players_df.iterrows():
@@ -78,11 +90,10 @@ def main():
             fine_count = player["fine_count"]
             fine_details = player["fine_details"]
 
-            # Calculate filtered totals for display (≤ £5 only)
-            filtered = calculate_filtered_fines(fine_details, max_amount=5.0)
-            display_total = filtered["total"]
-            display_count = filtered["count"]
-            display_avg = filtered["average"]
+            # Filtered totals for display (regular fines only)
+            display_total = summary.at[idx, "total"]
+            display_count = int(summary.at[idx, "count"])
+            display_avg = summary.at[idx, "average"]
 
             # Create expander for each player
             with st.expander(
@@ -111,12 +122,11 @@ def main():
                     )
 
                 # Breakdown
-                regular_fines = sum(f["amount"] for f in fine_details if f["amount"] <= 5)
-                miscellaneous = sum(f["amount"] for f in fine_details if f["amount"] > 5)
+                miscellaneous = summary.at[idx, "miscellaneous"]
 
                 if miscellaneous > 0:
                     st.caption(
-                        f"{format_currency(regular_fines)} in fines + {format_currency(miscellaneous)} Miscellaneous"
+                        f"{format_currency(display_total)} in fines + {format_currency(miscellaneous)} Miscellaneous"
                     )
 
                 st.markdown("---")
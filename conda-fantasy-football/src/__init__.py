@@ -1,31 +1,102 @@
 """CPR Fantasy Football - Data processing and utilities."""
 
-from .config import CSV_URLS, MATCH_COLUMNS, BANK_COLUMNS, SEASON_CONFIG
-from .data_fetcher import fetch_csv, normalize_string, parse_number, clean_player_name
-from .data_processor import get_player_stats, get_medal_emoji
-from .fantasy_processor import get_fantasy_league, get_team_players_df
-from .match_processor import get_matches, get_match_result_badge
+from .config import CSV_URLS, CSV_READ_OPTIONS, MATCH_COLUMNS, BANK_COLUMNS, SEASON_CONFIG
+from .data_fetcher import (
+    fetch_csv,
+    fetch_source,
+    fetch_snapshot,
+    fetch_typed,
+    prefetch_all,
+    get_snapshot_age,
+    format_snapshot_age,
+    normalize_string,
+    normalize_strings,
+    parse_number,
+    parse_numbers,
+    parse_dates,
+    clean_player_name,
+)
+from .schemas import CsvSchema, MATCH_SCHEMA, BANK_SCHEMA
+from .player_registry import PlayerRegistry, build_player_registry
+from .season_model import SeasonModel, get_season_model
+from .derived_cache import DerivedCache, derived
+from .data_processor import get_player_stats, get_leaderboard, get_medal_emoji, Leaderboard
+from .fantasy_processor import (
+    get_fantasy_league,
+    get_fantasy_tables,
+    get_fantasy_standings,
+    get_team_squad,
+    get_team_players_df,
+)
+from .match_processor import (
+    get_matches,
+    get_match_tables,
+    get_match_index,
+    get_match_result_badge,
+    MatchIndex,
+)
 from .payment_processor import get_player_payments
-from .fines_processor import get_player_fines, calculate_filtered_fines
+from .fines_processor import (
+    get_player_fines,
+    get_fines_index,
+    get_fines_summary,
+    calculate_filtered_fines,
+    FinesIndex,
+)
+from .pagination import page_count, page_bounds, page_picker, paginate
 from .style import load_css
 
 __all__ = [
     "CSV_URLS",
+    "CSV_READ_OPTIONS",
     "MATCH_COLUMNS",
     "BANK_COLUMNS",
     "SEASON_CONFIG",
+    "CsvSchema",
+    "MATCH_SCHEMA",
+    "BANK_SCHEMA",
+    "PlayerRegistry",
+    "build_player_registry",
+    "SeasonModel",
+    "get_season_model",
+    "DerivedCache",
+    "derived",
     "fetch_csv",
+    "fetch_source",
+    "fetch_snapshot",
+    "fetch_typed",
+    "prefetch_all",
+    "get_snapshot_age",
+    "format_snapshot_age",
     "normalize_string",
+    "normalize_strings",
     "parse_number",
+    "parse_numbers",
+    "parse_dates",
     "clean_player_name",
     "get_player_stats",
+    "get_leaderboard",
+    "Leaderboard",
     "get_medal_emoji",
     "get_fantasy_league",
+    "get_fantasy_tables",
+    "get_fantasy_standings",
+    "get_team_squad",
     "get_team_players_df",
     "get_matches",
+    "get_match_tables",
+    "get_match_index",
     "get_match_result_badge",
+    "MatchIndex",
     "get_player_payments",
     "get_player_fines",
+    "get_fines_index",
+    "get_fines_summary",
     "calculate_filtered_fines",
+    "FinesIndex",
+    "page_count",
+    "page_bounds",
+    "page_picker",
+    "paginate",
     "load_css",
 ]
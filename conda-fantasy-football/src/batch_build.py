@@ -0,0 +1,161 @@
+"""
+Build every view once, without Streamlit, and write it to static files.
+
+Usage (from the conda-fantasy-football directory):
+
+    python -m src.batch_build site/
+    CPR_DATA_SOURCE=recordings/ python -m src.batch_build site/
+
+Each view is written as <view>.json (records) and <view>.parquet, together
+with index.html, a static snapshot of every page, and manifest.json, which
+records the source versions the build came from. The output directory can be
+served by any static host.
+"""
+
+import argparse
+import html
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from .config import CSV_URLS
+from .data_processor import get_player_stats
+from .fantasy_processor import get_fantasy_league, get_fantasy_standings, get_fantasy_tables
+from .fines_processor import get_fines_summary, get_player_fines
+from .match_processor import get_matches
+from .payment_processor import get_player_payments
+from .season_model import SeasonModel, load_fresh_season_model
+
+# Fine limit used for the static Fines summary (the page's default)
+REGULAR_FINE_LIMIT = 5.0
+
+# Sections of index.html: title, view and the columns shown
+HTML_SECTIONS = [
+    ("Player Stats", "player_stats", None),
+    ("Fantasy League", "fantasy_standings", None),
+    ("Match Results", "matches", ["date", "team", "score", "opponent", "gameweek"]),
+    ("Payments", "payments", ["name", "match_count", "total_owed", "paid", "balance"]),
+    ("Fines", "fines_summary", None),
+]
+
+
+def build_views(model: SeasonModel) -> Dict[str, pd.DataFrame]:
+    """
+    Collect every view from one season model.
+
+    Args:
+        model: Model to build every view from, so all views match one set of
+            source versions
+
+    Returns:
+        Views keyed by name. Nested views (fantasy_league, matches, payments,
+        fines) keep their per-row lists of players or details
+    """
+    teams, squads = get_fantasy_tables(model)
+    fines = get_player_fines(model)
+    summary = get_fines_summary(REGULAR_FINE_LIMIT, model)
+    return {
+        "player_stats": get_player_stats(model),
+        "fantasy_standings": get_fantasy_standings(model),
+        "fantasy_teams": teams,
+        "fantasy_squads": squads.reset_index(),
+        "fantasy_league": get_fantasy_league(model),
+        "matches": pd.DataFrame(get_matches(model)),
+        "payments": get_player_payments(model),
+        "fines": fines,
+        "fines_summary": pd.concat([fines.reindex(columns=["name"]), summary], axis=1).sort_values(
+            "total", ascending=False
+        ),
+    }
+
+
+def render_html(views: Dict[str, pd.DataFrame], built_at: str) -> str:
+    """
+    Render the static snapshot page.
+
+    Args:
+        views: Views from build_views
+        built_at: Build time shown on the page
+
+    Returns:
+        HTML document with one table per section in HTML_SECTIONS
+    """
+    sections = []
+    for title, view, columns in HTML_SECTIONS:
+        df = views[view]
+        if columns is not None:
+            df = df[[column for column in columns if column in df.columns]]
+        df = df.rename(columns=lambda column: column.replace("_", " ").title())
+        table = df.to_html(index=False, float_format="{:.2f}".format, na_rep="", border=0)
+        sections.append(f"<h2>{html.escape(title)}</h2>\n{table}")
+
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        "<title>CPR Fantasy Football</title>\n"
+        "<style>body{font-family:sans-serif;margin:2rem}table{border-collapse:collapse;margin-bottom:2rem}"
+        "th,td{padding:.25rem .75rem;text-align:left;border-bottom:1px solid #e2e8f0}</style>\n"
+        "</head>\n<body>\n<h1>⚽ CPR Fantasy Football</h1>\n"
+        f"<p>Built {html.escape(built_at)}</p>\n" + "\n".join(sections) + "\n</body>\n</html>\n"
+    )
+
+
+def write_views(
+    views: Dict[str, pd.DataFrame], out_dir: Path, versions: Tuple[Tuple[str, str], ...] = ()
+) -> List[Path]:
+    """
+    Write every view, the snapshot page and the manifest to a directory.
+
+    Args:
+        views: Views from build_views
+        out_dir: Directory to write to (created if missing)
+        versions: (source, snapshot version) pairs the views were built from
+
+    Returns:
+        Paths of the files written
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    built_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    written = []
+
+    for name, df in views.items():
+        json_path = out_dir / f"{name}.json"
+        df.to_json(json_path, orient="records", date_format="iso", force_ascii=False)
+        parquet_path = out_dir / f"{name}.parquet"
+        df.to_parquet(parquet_path, index=False)
+        written += [json_path, parquet_path]
+
+    html_path = out_dir / "index.html"
+    html_path.write_text(render_html(views, built_at), encoding="utf-8")
+    written.append(html_path)
+
+    manifest_path = out_dir / "manifest.json"
+    manifest = {
+        "built_at": built_at,
+        "sources": {source: {"url": CSV_URLS[source], "version": version} for source, version in versions},
+        "views": {name: {"rows": len(df), "columns": [str(column) for column in df.columns]} for name, df in views.items()},
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    written.append(manifest_path)
+    return written
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir", type=Path, help="Directory to write the views to")
+    args = parser.parse_args()
+
+    # Sources are downloaded now rather than served from the stale-while-revalidate
+    # cache, and every view and the manifest come from this one model
+    model = load_fresh_season_model()
+    written = write_views(build_views(model), args.out_dir, model.versions)
+    for path in written:
+        print(f"Wrote {path} ({path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """Configuration constants for CPR Fantasy Football."""
 
+import os
 from datetime import datetime
+from pathlib import Path
 
 # CSV Data Source URLs
 CSV_URLS = {
@@ -12,6 +14,34 @@ CSV_URLS = {
     "FINES": "https://docs.google.com/spreadsheets/d/e/2PACX-1vRoEocKoPqHp2zwO8xw0jKBeog9PiYoEGThde4N1__g3xDtwQQ19K6ikYtq9PZt3_nEnNJ5tBZGCdnN/pub?gid=1129039641&single=true&output=csv",
 }
 
+# Optional override to read every source from somewhere other than Google Sheets,
+# e.g. a directory of recorded CSVs ("/path/to/recordings" or "file:///path/...")
+# or a local replay server ("http://127.0.0.1:8600"). Each source is then read
+# from "<CPR_DATA_SOURCE>/<SOURCE_KEY>.csv".
+DATA_SOURCE = os.environ.get("CPR_DATA_SOURCE", "").rstrip("/")
+if DATA_SOURCE:
+    CSV_URLS.update({name: f"{DATA_SOURCE}/{name}.csv" for name in CSV_URLS})
+
+# Sources the season model is built from, as keys in CSV_URLS
+SEASON_SOURCES = (
+    "MATCH_DETAILS",
+    "PLAYER_DATA",
+    "TEAM_SELECTION",
+    "BANK_STATEMENT",
+    "FINES",
+)
+
+# fetch_csv arguments used for each source
+# These must match the arguments the processors use so prefetched data hits the same cache entry
+CSV_READ_OPTIONS = {
+    "MATCH_DETAILS": {"use_generic_headers": True},
+    "PLAYER_DATA": {},
+    "TEAM_SELECTION": {},
+    "BANK_STATEMENT": {"use_generic_headers": True},
+    "SCORING_SYSTEM": {},
+    "FINES": {"use_generic_headers": True},
+}
+
 # Match Details CSV Column Names (after headers)
 # The CSV uses column index-based names like '_1', '_2', etc.
 MATCH_COLUMNS = {
@@ -63,5 +93,47 @@ SEASON_CONFIG = {
     "PAYMENT_START_DATE": datetime(2025, 8, 1),  # August 1, 2025
 }
 
+# Minimum trigram similarity (0-1) for a name that isn't in Player Data to be
+# treated as a misspelling of a Player Data name (e.g. "Bob Jnes" -> "Bob Jones")
+NAME_MATCH_THRESHOLD = 0.6
+
+# Derived results (match lists, fines summaries, ...) kept in memory, least recently used first out.
+# Entries are keyed by source versions and arguments, e.g. one per fine limit picked on the Fines page
+DERIVED_CACHE_SIZE = 64
+
+# Rows shown per page in paginated tables
+PAGE_SIZE = 25
+
 # Cache duration in seconds
+# Snapshots older than this are still served, but refreshed in the background
 CACHE_DURATION = 60  # 1 minute cache
+
+# Maximum snapshot age in seconds before a request waits for fresh data
+# Only reached if background refreshes keep failing; None never blocks
+MAX_STALENESS = 15 * 60  # 15 minutes
+
+# On-disk cache of raw CSV bodies and their HTTP validators (ETag / Last-Modified)
+HTTP_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "http"
+
+# (connect, read) timeouts in seconds for CSV downloads, per CSV_URLS key
+# Sources without an entry use "default"
+HTTP_TIMEOUTS = {
+    "default": (5, 20),
+    "MATCH_DETAILS": (5, 30),  # Largest sheet, grows every gameweek
+    "BANK_STATEMENT": (5, 30),
+}
+
+# Retries for connection errors, timeouts, 429 and 5xx responses
+HTTP_RETRIES = 2
+
+# Base delay in seconds for exponential backoff with jitter between retries
+HTTP_RETRY_BACKOFF = 0.5
+
+# Keep-alive connections kept open to Google (enough for a full prefetch)
+HTTP_POOL_SIZE = 8
+
+# Versioned Feather snapshots of every fetched source, loaded on startup
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "snapshots"
+
+# Number of snapshot versions to keep on disk per source
+SNAPSHOT_HISTORY = 3
@@ -1,39 +1,299 @@
 """Data fetching utilities for CPR Fantasy Football."""
 
+import io
+import logging
 import pandas as pd
-import streamlit as st
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 import re
+from .config import (
+    CSV_URLS,
+    CSV_READ_OPTIONS,
+    CACHE_DURATION,
+    MAX_STALENESS,
+    SEASON_SOURCES,
+    SNAPSHOT_DIR,
+    SNAPSHOT_HISTORY,
+)
+from .schemas import CsvSchema, SCHEMAS, NUMBER_JUNK_PATTERN
+from .snapshot_cache import Snapshot, SnapshotCache, freeze
+from .snapshot_store import SnapshotStore
+from .sources import read_body
 
+logger = logging.getLogger(__name__)
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def fetch_csv(url: str, skip_rows: int = 0, use_generic_headers: bool = False) -> pd.DataFrame:
+
+def _report_error(message: str) -> None:
+    """Log an error, and show it on the page when running inside Streamlit."""
+    logger.error(message)
+    # Streamlit is only loaded by the app; batch builds run without it
+    streamlit = sys.modules.get("streamlit")
+    if streamlit is not None:
+        streamlit.error(message)
+
+
+@dataclass(frozen=True)
+class RawCsvReader:
+    """Untyped CSV parse used by fetch_csv; every column keeps read_csv's inferred dtype."""
+
+    skip_rows: int = 0
+    use_generic_headers: bool = False
+
+    def parse(self, content: bytes) -> pd.DataFrame:
+        """Parse raw CSV bytes into a DataFrame."""
+        if self.use_generic_headers:
+            # Read without headers and create generic column names like '_1', '_2', etc.
+            df = pd.read_csv(io.BytesIO(content), header=None, skiprows=self.skip_rows)
+            # Rename columns to match TypeScript PapaParse behavior: '_1', '_2', etc.
+            df.columns = [f'_{i+1}' for i in range(len(df.columns))]
+        else:
+            df = pd.read_csv(io.BytesIO(content), skiprows=self.skip_rows)
+        return df
+
+
+def _load_snapshot(key: Tuple[str, Any], previous: Optional[Snapshot]) -> Snapshot:
+    """
+    Fetch one CSV and build a snapshot, reusing the previous parse when unchanged.
+
+    The key is (url, reader), where the reader is a RawCsvReader or CsvSchema.
+    HTTP sources are revalidated with ETag / Last-Modified, so an unchanged sheet
+    is neither downloaded nor parsed again.
+    """
+    url, reader = key
+    body = read_body(url)
+
+    if previous is not None and previous.version == body.version:
+        # Unchanged body: keep the parsed frame and anything derived from it
+        return Snapshot(
+            data=previous.data, version=body.version, fetched_at=time.time(), derived=previous.derived
+        )
+
+    return Snapshot(data=reader.parse(body.content), version=body.version, fetched_at=time.time())
+
+
+# Process-wide cache shared by every session: serves the last good snapshot
+# immediately, refreshes stale entries on a background thread, and persists
+# snapshots to disk so restarts start warm
+_snapshot_cache = SnapshotCache(
+    _load_snapshot,
+    fresh_for=CACHE_DURATION,
+    max_staleness=MAX_STALENESS,
+    store=SnapshotStore(SNAPSHOT_DIR, history=SNAPSHOT_HISTORY),
+)
+
+
+def fetch_csv(
+    url: str,
+    skip_rows: int = 0,
+    use_generic_headers: bool = False,
+    numeric_columns: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
     """
     Fetch and parse CSV data from a URL with caching.
 
+    Only the first fetch of a URL blocks. After that the last good snapshot is
+    returned straight away and refreshed in the background once it is older
+    than CACHE_DURATION. Snapshots saved on disk by an earlier run are served
+    without waiting for the network.
+
     Args:
         url: The URL of the CSV file to fetch
         skip_rows: Number of rows to skip at the beginning (default: 0)
         use_generic_headers: If True, uses generic column names like '_1', '_2' instead of CSV headers
+        numeric_columns: Columns to return coerced with parse_numbers; the coerced
+            columns are computed once per snapshot and cached (missing columns are ignored)
 
     Returns:
-        DataFrame containing the parsed CSV data
+        DataFrame containing the parsed CSV data. Its values are shared and
+        read-only; columns can be added or replaced
     """
     try:
-        if use_generic_headers:
-            # Read without headers and create generic column names like '_1', '_2', etc.
-            df = pd.read_csv(url, header=None, skiprows=skip_rows)
-            # Rename columns to match TypeScript PapaParse behavior: '_1', '_2', etc.
-            df.columns = [f'_{i+1}' for i in range(len(df.columns))]
-        else:
-            df = pd.read_csv(url, skiprows=skip_rows)
-        return df
+        snapshot = _snapshot_cache.get((url, RawCsvReader(skip_rows, use_generic_headers)))
+        # Callers get a new frame whose values are the snapshot's shared,
+        # read-only arrays (assigning a Series into a frame would copy it)
+        columns = {column: snapshot.data[column] for column in snapshot.data.columns}
+        for column in numeric_columns or ():
+            if column in columns:
+                columns[column] = _cached_numbers(snapshot, column)
+        return pd.DataFrame(columns, copy=False)
+    except Exception as e:
+        _report_error(f"Error fetching CSV from {url}: {str(e)}")
+        raise
+
+
+def fetch_typed(schema: CsvSchema, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Fetch a sheet through its typed schema, keeping only the requested columns.
+
+    Header rows are already dropped, NUMBER columns are float64 (NaN where blank
+    or unparseable) and STRING columns are object. The typed frame is cached like
+    fetch_csv, so each consumer's projection is just a column selection
+    that shares the cached data.
+
+    Args:
+        schema: Schema of the sheet (e.g. MATCH_SCHEMA)
+        columns: Column names the caller needs (default: all declared columns)
+
+    Returns:
+        DataFrame with the requested columns, sharing the cached read-only values
+    """
+    url = CSV_URLS[schema.source]
+    try:
+        snapshot = _snapshot_cache.get((url, schema))
+        return schema.project(snapshot.data, columns)
     except Exception as e:
-        st.error(f"Error fetching CSV from {url}: {str(e)}")
+        _report_error(f"Error fetching CSV from {url}: {str(e)}")
         raise
 
 
+def _cached_numbers(snapshot: Snapshot, column: str) -> pd.Series:
+    """Coerce one snapshot column with parse_numbers, computing it once per version."""
+    key = ("numbers", column)
+    numbers = snapshot.derived.get(key)
+    if numbers is None:
+        numbers = freeze(parse_numbers(snapshot.data[column]))
+        snapshot.derived[key] = numbers
+    return numbers
+
+
+def get_snapshot_age() -> Optional[float]:
+    """
+    Get the age of the oldest cached data snapshot.
+
+    Returns:
+        Age in seconds, or None if nothing has been fetched yet
+    """
+    snapshots = _snapshot_cache.snapshots()
+    if not snapshots:
+        return None
+    return max(snapshot.age for snapshot in snapshots.values())
+
+
+def format_snapshot_age() -> str:
+    """
+    Describe how old the displayed data is, for page captions.
+
+    Returns:
+        Human readable description such as "Data updated 2 min ago"
+    """
+    age = get_snapshot_age()
+    if age is None:
+        return "Data not loaded yet"
+    if age < 60:
+        return f"Data updated {int(age)}s ago"
+    if age < 3600:
+        return f"Data updated {int(age // 60)} min ago"
+    return f"Data updated {age / 3600:.1f} h ago"
+
+
+def _source_key(source: str) -> Tuple[str, Any]:
+    """Snapshot cache key for a configured source: (url, schema or RawCsvReader)."""
+    url = CSV_URLS[source]
+    if source in SCHEMAS:
+        return url, SCHEMAS[source]
+    return url, RawCsvReader(**CSV_READ_OPTIONS.get(source, {}))
+
+
+def fetch_snapshot(source: str) -> Snapshot:
+    """
+    Fetch the cached snapshot of a configured source, as fetch_source would read it.
+
+    The snapshot's data is shared by every caller and must not be modified.
+
+    Args:
+        source: Key in CSV_URLS (e.g. "MATCH_DETAILS")
+
+    Returns:
+        Snapshot with the parsed frame and the version of the body it came from
+    """
+    try:
+        return _snapshot_cache.get(_source_key(source))
+    except Exception as e:
+        _report_error(f"Error fetching CSV from {CSV_URLS[source]}: {str(e)}")
+        raise
+
+
+def fetch_fresh_snapshot(source: str) -> Snapshot:
+    """
+    Download and parse a configured source now, bypassing the snapshot cache and store.
+
+    For one-off builds that must not publish stale data; pages use fetch_snapshot.
+
+    Args:
+        source: Key in CSV_URLS (e.g. "MATCH_DETAILS")
+
+    Returns:
+        Snapshot of the source as it is right now
+    """
+    return _load_snapshot(_source_key(source), None)
+
+
+def fetch_source(source: str) -> pd.DataFrame:
+    """
+    Fetch a configured CSV source the way the processors read it.
+
+    Sources with a typed schema are read through fetch_typed; the rest use
+    fetch_csv with their registered read options.
+
+    Args:
+        source: Key in CSV_URLS (e.g. "MATCH_DETAILS")
+
+    Returns:
+        DataFrame containing the parsed CSV data
+    """
+    if source in SCHEMAS:
+        return fetch_typed(SCHEMAS[source])
+    return fetch_csv(CSV_URLS[source], **CSV_READ_OPTIONS.get(source, {}))
+
+
+def _is_warm(source: str) -> bool:
+    """Whether fetch_snapshot can serve source from memory without waiting on a download."""
+    snapshot = _snapshot_cache.peek(_source_key(source))
+    return snapshot is not None and (MAX_STALENESS is None or snapshot.age <= MAX_STALENESS)
+
+
+def prefetch_all(sources: Optional[Iterable[str]] = None) -> Dict[str, Snapshot]:
+    """
+    Fetch source snapshots concurrently so the cache is warm before processing.
+
+    A cold page load then costs roughly one network round trip (the slowest
+    source) rather than the sum of every sequential fetch. When every snapshot
+    is already in memory they are read directly, without starting any threads.
+
+    Args:
+        sources: Keys in CSV_URLS to fetch (default: SEASON_SOURCES)
+
+    Returns:
+        Dictionary mapping source key to its snapshot, in the order given
+    """
+    names = list(sources) if sources is not None else list(SEASON_SOURCES)
+    if not names:
+        return {}
+
+    if all(_is_warm(name) for name in names):
+        return {name: fetch_snapshot(name) for name in names}
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        return dict(zip(names, executor.map(fetch_snapshot, names)))
+
+
+def normalize_strings(values: pd.Series) -> pd.Series:
+    """
+    Vectorized normalize_string for a whole column.
+
+    Args:
+        values: Strings to normalize
+
+    Returns:
+        Trimmed lowercase strings, with "" where the value is missing
+    """
+    return values.where(values.notna(), "").astype(str).str.strip().str.lower()
+
+
 def normalize_string(value: Optional[str]) -> str:
     """
     Clean and normalize strings for comparison.
@@ -68,7 +328,7 @@ def parse_number(value) -> float:
 
     if isinstance(value, str):
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[£$,]', '', value)
+        cleaned = re.sub(NUMBER_JUNK_PATTERN, '', value)
         try:
             return float(cleaned)
         except ValueError:
@@ -77,6 +337,41 @@ def parse_number(value) -> float:
     return 0.0
 
 
+def parse_numbers(values: Union[pd.Series, pd.DataFrame]) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Parse whole columns of numeric values; the vectorized form of parse_number.
+    Handles currency symbols (£, $) and comma separators.
+
+    Args:
+        values: Series, or DataFrame whose every column should be parsed
+
+    Returns:
+        float64 Series/DataFrame of the same shape, with 0.0 where parsing fails
+    """
+    if isinstance(values, pd.DataFrame):
+        return values.apply(parse_numbers)
+
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(
+            values.astype(str).str.replace(NUMBER_JUNK_PATTERN, "", regex=True), errors="coerce"
+        )
+
+    return values.astype("float64").fillna(0.0)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of DD/MM/YYYY dates.
+
+    Args:
+        values: Date strings (surrounding whitespace is ignored)
+
+    Returns:
+        datetime64 Series, with NaT where the value isn't a valid DD/MM/YYYY date
+    """
+    return pd.to_datetime(values.astype(str).str.strip(), format="%d/%m/%Y", errors="coerce")
+
+
 def clean_player_name(name) -> str:
     """
     Clean and normalize player names.
@@ -1,119 +1,199 @@
 """Data processing utilities for player statistics."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List
-from .data_fetcher import fetch_csv, parse_number, clean_player_name
-from .config import CSV_URLS, MATCH_COLUMNS
-
-
-def get_player_stats() -> pd.DataFrame:
+from typing import Dict, List, Optional
+from .data_fetcher import parse_numbers
+from .dtypes import COUNT, LABEL, POINTS, compact
+from .config import MATCH_COLUMNS
+from .player_registry import NO_PLAYER, PlayerRegistry, build_player_registry
+from .derived_cache import derived
+from .season_model import SeasonModel, get_season_model
+
+# Leaderboard columns aggregated from Match Details, in display order:
+# (output column, MATCH_COLUMNS key, count only positive values)
+STAT_AGGREGATIONS = [
+    ("appearances", "APPEARANCE", True),
+    ("goals", "GOALS", False),
+    ("assists", "ASSISTS", False),
+    ("clean_sheets", "CLEAN_SHEET", True),
+    ("yellow_cards", "YELLOW_CARD", True),
+    ("red_cards", "RED_CARD", True),
+    ("mom1", "MOM", True),
+    ("mom2", "MOM_2", True),
+    ("mom3", "MOM_3", True),
+    ("dod", "DOD", True),
+]
+
+# Compact dtypes for the leaderboard (see dtypes.compact)
+PLAYER_STATS_LAYOUT = {
+    "name": LABEL,
+    **{output: COUNT for output, _, _ in STAT_AGGREGATIONS},
+    "fantasy_points": POINTS,
+}
+
+
+def aggregate_player_stats(
+    data_rows: pd.DataFrame, player_data: pd.DataFrame, registry: Optional[PlayerRegistry] = None
+) -> pd.DataFrame:
     """
-    Fetch and aggregate player statistics from match data and player data.
-    Includes Misc-Points from Player Data CSV for manual adjustments.
+    Aggregate per-player statistics from match rows plus Misc-Points adjustments.
+
+    Args:
+        data_rows: Match Details data rows (header rows already dropped)
+        player_data: Player Data sheet with "Player" and "Misc-Points" columns
+        registry: Player registry for these sheets (built from them if not given)
 
     Returns:
         DataFrame with player statistics sorted by fantasy points (highest first)
     """
-    # Fetch both match data and player data
-    # Match data uses generic column names like '_1', '_2' to match TypeScript behavior
-    match_data = fetch_csv(CSV_URLS["MATCH_DETAILS"], use_generic_headers=True)
-    player_data = fetch_csv(CSV_URLS["PLAYER_DATA"])
-
-    # Skip first 3 rows (headers and empty rows) for match data
-    data_rows = match_data.iloc[3:].copy()
-
-    # Initialize dictionary to store player stats
-    player_stats: Dict[str, Dict] = {}
-
-    # Process each match row
-    for _, row in data_rows.iterrows():
-        player_name = clean_player_name(row.get(MATCH_COLUMNS["PLAYER"], ""))
-
-        if not player_name:
-            continue  # Skip rows without player name
-
-        # Get or create player stat entry
-        if player_name not in player_stats:
-            player_stats[player_name] = {
-                "name": player_name,
-                "appearances": 0,
-                "goals": 0,
-                "assists": 0,
-                "clean_sheets": 0,
-                "yellow_cards": 0,
-                "red_cards": 0,
-                "mom1": 0,
-                "mom2": 0,
-                "mom3": 0,
-                "dod": 0,
-                "fantasy_points": 0.0,
-            }
-
-        # Parse match stats using column constants
-        appearance = parse_number(row.get(MATCH_COLUMNS["APPEARANCE"], 0))
-        goals = parse_number(row.get(MATCH_COLUMNS["GOALS"], 0))
-        assists = parse_number(row.get(MATCH_COLUMNS["ASSISTS"], 0))
-        yellow_card = parse_number(row.get(MATCH_COLUMNS["YELLOW_CARD"], 0))
-        red_card = parse_number(row.get(MATCH_COLUMNS["RED_CARD"], 0))
-        clean_sheet = parse_number(row.get(MATCH_COLUMNS["CLEAN_SHEET"], 0))
-        mom = parse_number(row.get(MATCH_COLUMNS["MOM"], 0))
-        mom2 = parse_number(row.get(MATCH_COLUMNS["MOM_2"], 0))
-        mom3 = parse_number(row.get(MATCH_COLUMNS["MOM_3"], 0))
-        dod = parse_number(row.get(MATCH_COLUMNS["DOD"], 0))
-        total_points = parse_number(row.get(MATCH_COLUMNS["TOTAL_POINTS"], 0))
-
-        # Aggregate stats
-        if appearance > 0:
-            player_stats[player_name]["appearances"] += int(appearance)
+    if registry is None:
+        registry = build_player_registry({"PLAYER_DATA": player_data, "MATCH_DETAILS": data_rows})
+
+    player_ids = registry.ids(data_rows[MATCH_COLUMNS["PLAYER"]])
+    has_player = player_ids != NO_PLAYER
+    if not has_player.any():
+        return pd.DataFrame()
+
+    rows = data_rows[has_player]
+    names = rows[MATCH_COLUMNS["PLAYER"]].astype(str).str.strip()
+    columns = {"player_id": player_ids[has_player], "name": names}
+    for output, key, positive_only in STAT_AGGREGATIONS:
+        values = parse_numbers(rows[MATCH_COLUMNS[key]])
+        if positive_only:
+            values = values.clip(lower=0)
+        # int() truncates toward zero for each row before summing
+        columns[output] = np.trunc(values)
+    columns["fantasy_points"] = parse_numbers(rows[MATCH_COLUMNS["TOTAL_POINTS"]])
+
+    # sort=False keeps first-appearance order, which the final sort relies on for ties.
+    # Players in Player Data take its spelling; others are shown as first written in Match Details
+    grouped = pd.DataFrame(columns).groupby("player_id", sort=False)
+    df = grouped.sum(numeric_only=True)
+    df.insert(0, "name", registry.labels(df.index, grouped["name"].first()))
+    for output, _, _ in STAT_AGGREGATIONS:
+        df[output] = df[output].astype("int64")
 
-        player_stats[player_name]["goals"] += int(goals)
-        player_stats[player_name]["assists"] += int(assists)
-
-        if clean_sheet > 0:
-            player_stats[player_name]["clean_sheets"] += int(clean_sheet)
-
-        if yellow_card > 0:
-            player_stats[player_name]["yellow_cards"] += int(yellow_card)
+    # Add Misc-Points from Player Data CSV
+    # This allows manual adjustments to be reflected in fantasy points
+    if "Player" in player_data.columns and "Misc-Points" in player_data.columns:
+        misc = pd.DataFrame(
+            {
+                "player_id": registry.ids(player_data["Player"]),
+                "misc_points": parse_numbers(player_data["Misc-Points"]),
+            }
+        )
+        misc_points = misc[misc["player_id"] != NO_PLAYER].groupby("player_id")["misc_points"].sum()
+        df["fantasy_points"] += misc_points.reindex(df.index, fill_value=0.0)
 
-        if red_card > 0:
-            player_stats[player_name]["red_cards"] += int(red_card)
+    df = df.reset_index(drop=True)
 
-        if mom > 0:
-            player_stats[player_name]["mom1"] += int(mom)
+    # Sort by fantasy points (descending)
+    df = df.sort_values("fantasy_points", ascending=False).reset_index(drop=True)
 
-        if mom2 > 0:
-            player_stats[player_name]["mom2"] += int(mom2)
+    return compact(df, PLAYER_STATS_LAYOUT)
 
-        if mom3 > 0:
-            player_stats[player_name]["mom3"] += int(mom3)
 
-        if dod > 0:
-            player_stats[player_name]["dod"] += int(dod)
+def get_player_stats(model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Get player statistics from the season model.
+    Includes Misc-Points from Player Data CSV for manual adjustments.
 
-        player_stats[player_name]["fantasy_points"] += total_points
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
 
-    # Add Misc-Points from Player Data CSV
-    # This allows manual adjustments to be reflected in fantasy points
-    for _, row in player_data.iterrows():
-        player_name = clean_player_name(row.get("Player", ""))
-        if not player_name:
-            continue
+    Returns:
+        DataFrame with player statistics sorted by fantasy points (highest first)
+    """
+    return (model or get_season_model()).player_stats.copy(deep=False)
 
-        if player_name in player_stats:
-            misc_points = parse_number(row.get("Misc-Points", 0))
-            player_stats[player_name]["fantasy_points"] += misc_points
 
-    # Convert to DataFrame
-    df = pd.DataFrame.from_dict(player_stats, orient="index")
+class Leaderboard:
+    """
+    Player stats ranked once per version of the data.
 
-    # Check if DataFrame is empty
-    if df.empty:
-        return df
+    Every stat has a presorted order (highest first; ties keep the fantasy
+    points order), so sorting by any stat, slicing out one page, or finding
+    the leaders for a card is a slice instead of a sort of the whole table.
+    """
 
-    # Sort by fantasy points (descending)
-    df = df.sort_values("fantasy_points", ascending=False).reset_index(drop=True)
+    # Stats the leaderboard can be sorted by
+    STATS = ["fantasy_points", *(output for output, _, _ in STAT_AGGREGATIONS)]
+
+    def __init__(self, stats: pd.DataFrame):
+        """
+        Args:
+            stats: Player stats table from aggregate_player_stats
+        """
+        if stats.empty:
+            # With no players yet, aggregate_player_stats returns a frame without columns
+            stats = stats.reindex(columns=["name", *self.STATS])
+        self.stats = stats
+        self._orders: Dict[str, np.ndarray] = {
+            stat: np.arange(len(stats)) if stat == "fantasy_points"
+            else stats[stat].sort_values(ascending=False, kind="stable").index.to_numpy()
+            for stat in self.STATS
+        }
+        self._ranks = np.array([get_medal_emoji(i) for i in range(len(stats))], dtype=object)
+        self.totals: Dict[str, float] = {stat: stats[stat].sum() for stat in self.STATS}
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    def page(
+        self, sort_by: str = "fantasy_points", columns: Optional[List[str]] = None, start: int = 0, end: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Get one page of the leaderboard.
+
+        Args:
+            sort_by: Stat to rank by (one of STATS), highest first
+            columns: Stat columns to include after rank and name (default: all),
+                in table order
+            start: First position in the ranking
+            end: Position after the last one (default: the end of the ranking)
+
+        Returns:
+            DataFrame with rank (medal for the top 3), name and the chosen
+            columns, for positions start to end only
+        """
+        positions = self._orders[sort_by][start:end]
+        # Columns keep the table's order
+        columns = [
+            column for column in self.stats.columns if column != "name" and (columns is None or column in columns)
+        ]
+        page = self.stats.iloc[positions][["name", *columns]].reset_index(drop=True)
+        page.insert(0, "rank", self._ranks[start:start + len(positions)])
+        return page
+
+    def leaders(self, stat: str, n: int = 1) -> pd.DataFrame:
+        """
+        Get the players with the highest value of a stat.
+
+        Args:
+            stat: One of STATS
+            n: Number of players
+
+        Returns:
+            Rows of the stats table, highest first, like stats.nlargest(n, stat)
+        """
+        return self.stats.iloc[self._orders[stat][:n]]
+
+
+@derived
+def _leaderboard(model: SeasonModel) -> Leaderboard:
+    """Leaderboard over the model's player stats, built once per version of the data."""
+    return Leaderboard(model.player_stats)
+
+
+def get_leaderboard() -> Leaderboard:
+    """
+    Get the ranked leaderboard for the current player stats.
 
-    return df
+    Returns:
+        Leaderboard shared by every session; its tables must not be modified
+    """
+    return _leaderboard()
 
 
 def get_medal_emoji(rank: int) -> str:
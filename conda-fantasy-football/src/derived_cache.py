@@ -0,0 +1,96 @@
+"""Memoization of results derived from the season model."""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from .config import DERIVED_CACHE_SIZE
+from .season_model import get_season_model
+from .single_flight import SingleFlight
+
+
+class DerivedCache:
+    """
+    Bounded LRU cache of derived results.
+
+    Results are keyed by the snapshot versions (content hashes) they were
+    computed from plus their arguments, so an entry never goes stale: new data
+    gets new keys, and old entries age out once max_entries is reached.
+    Concurrent misses for the same key share a single computation.
+    """
+
+    def __init__(self, max_entries: int = DERIVED_CACHE_SIZE):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._computes = SingleFlight()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the result for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable key identifying the inputs of compute
+            compute: Function producing the result
+
+        Returns:
+            The cached or newly computed result
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        def load() -> Any:
+            result = compute()
+            with self._lock:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return result
+
+        return self._computes.do(key, load)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache = DerivedCache()
+
+
+def derived(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Memoize a function of the season model on the model's versions and arguments.
+
+    The decorated function takes the SeasonModel as its first argument; the
+    wrapper takes only the remaining (hashable) arguments and uses the current
+    model unless one is passed as model=. Results are shared by every session,
+    so callers must not modify them.
+
+    Args:
+        fn: Function called as fn(model, *args)
+
+    Returns:
+        Wrapped function called as wrapper(*args, model=None)
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Hashable, model: Any = None) -> Any:
+        if model is None:
+            model = get_season_model()
+        key = (fn.__module__, fn.__qualname__, model.versions, args)
+        return _cache.get(key, lambda: fn(model, *args))
+
+    return wrapper
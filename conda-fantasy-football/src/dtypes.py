@@ -0,0 +1,74 @@
+"""Compact dtype policy for processed tables, and per-table memory reporting."""
+
+import sys
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Column kinds used in table layouts
+LABEL = "label"  # Repeated text (player, team, position, opponent): categorical
+COUNT = "count"  # Whole-number counter: smallest signed int that fits the data
+POINTS = "points"  # Fantasy points and prices: float64, so 7.8 stays 7.8 rather than 7.800000190734863
+# Money (fees, payments, balances) is left as float64 so ledger totals stay exact to the penny
+
+
+def compact(df: pd.DataFrame, layout: Dict[str, str]) -> pd.DataFrame:
+    """
+    Convert a table's columns to the compact dtypes of its layout.
+
+    Args:
+        df: Table to convert (not modified)
+        layout: Column name -> LABEL, COUNT or POINTS; other columns are kept
+            as they are, and layout entries for missing columns are ignored
+
+    Returns:
+        New DataFrame with the same columns and index
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        kind = layout.get(name)
+        if kind == LABEL:
+            values = values.astype("category")
+        elif kind == COUNT:
+            # Fractional counts are truncated like int() would
+            values = pd.to_numeric(np.trunc(values), downcast="integer")
+        elif kind == POINTS:
+            values = values.astype("float64")
+        columns[name] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def _table_bytes(df: pd.DataFrame) -> int:
+    """Bytes used by a table, like memory_usage(deep=True).sum()."""
+    # pandas can't measure the contents of read-only (frozen) object columns,
+    # so those are summed here the same way it would
+    total = int(df.memory_usage(deep=False).sum())
+    for name in df.columns:
+        if df[name].dtype == object:
+            total += sum(sys.getsizeof(value) for value in df[name])
+    return total
+
+
+def memory_report(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Measure how much memory each table uses.
+
+    Args:
+        tables: Tables keyed by name
+
+    Returns:
+        DataFrame with one row per table: table, rows, columns, bytes (including
+        the contents of object columns) and bytes_per_row
+    """
+    report = pd.DataFrame(
+        {
+            "table": list(tables),
+            "rows": [len(df) for df in tables.values()],
+            "columns": [len(df.columns) for df in tables.values()],
+            "bytes": [_table_bytes(df) for df in tables.values()],
+        }
+    )
+    report["bytes_per_row"] = (report["bytes"] / report["rows"].where(report["rows"] > 0)).fillna(0.0)
+    return report
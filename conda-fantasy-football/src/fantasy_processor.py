@@ -1,88 +1,187 @@
 """Fantasy league data processing."""
 
 import pandas as pd
-from typing import Dict, List
-from .data_fetcher import fetch_csv
-from .config import CSV_URLS
+from typing import Dict, List, Optional, Tuple
+from .data_fetcher import parse_numbers
+from .data_processor import get_medal_emoji
+from .dtypes import COUNT, LABEL, POINTS, compact
+from .derived_cache import derived
+from .season_model import SeasonModel, get_season_model
+from .snapshot_cache import freeze
+
+# Squad table columns, in display order
+SQUAD_COLUMNS = ["name", "position", "price", "points"]
+
+# Compact dtypes for the teams and squad tables (see dtypes.compact)
+TEAMS_LAYOUT = {
+    "team_id": COUNT,
+    "team_name": LABEL,
+    "manager_name": LABEL,
+    "total_points": POINTS,
+    "rank": COUNT,
+    "squad_start": COUNT,
+    "squad_end": COUNT,
+}
+SQUADS_LAYOUT = {"name": LABEL, "position": LABEL, "price": POINTS, "points": POINTS}
+
+
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Stripped text column; missing columns and blank cells become ""."""
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    values = frame[column]
+    return values.where(values.notna(), "").astype(str).str.strip()
+
+
+def build_fantasy_tables(team_data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the teams table and the squad table from Team Selection rows.
 
+    Args:
+        team_data: Team Selection sheet, one row per player on a team
+            (Team Name, Manager, Players, Price, Position, Total-Points, Team-Points)
 
-def get_fantasy_league() -> pd.DataFrame:
+    Returns:
+        Tuple of (teams, squads):
+        - teams: one row per team sorted by total points (highest first), with
+          team_id, team_name, manager_name, total_points, rank, and squad_start /
+          squad_end, the team's row range in squads
+        - squads: one row per player indexed by team_id, with SQUAD_COLUMNS
+          (name and position as categoricals), grouped by team in teams order
+          and sorted by points within each team
     """
-    Fetch and process fantasy league team data.
+    rows = pd.DataFrame(
+        {
+            "team_name": _text(team_data, "Team Name"),
+            "manager_name": _text(team_data, "Manager"),
+            "name": _text(team_data, "Players"),
+            "position": _text(team_data, "Position"),
+            "price": parse_numbers(team_data["Price"]) if "Price" in team_data else 0.0,
+            "points": parse_numbers(team_data["Total-Points"]) if "Total-Points" in team_data else 0.0,
+        }
+    )
+    # Skip rows without team name
+    rows = rows[(rows["team_name"] != "") & (rows["manager_name"] != "")]
+    if rows.empty:
+        return pd.DataFrame(), pd.DataFrame(columns=SQUAD_COLUMNS)
+
+    # Teams are numbered in sheet order; the manager comes from the team's first row
+    rows["team_id"] = rows.groupby("team_name", sort=False).ngroup()
+    players = rows[rows["name"] != ""]
+
+    teams = rows.drop_duplicates("team_id")[["team_id", "team_name", "manager_name"]]
+    # Total points from players
+    teams["total_points"] = (
+        players.groupby("team_id")["points"].sum().reindex(teams["team_id"], fill_value=0.0).to_numpy()
+    )
+
+    # Sort by total points (descending) and assign ranks
+    teams = teams.sort_values("total_points", ascending=False).reset_index(drop=True)
+    teams["rank"] = teams.index + 1
+
+    # One squad table, grouped by team in rank order and by points within a team
+    players = players.assign(_rank=players["team_id"].map(teams.set_index("team_id")["rank"]))
+    players = players.sort_values(["_rank", "points"], ascending=[True, False], kind="stable")
+    squads = compact(players.set_index("team_id")[SQUAD_COLUMNS], SQUADS_LAYOUT)
+
+    squad_sizes = players.groupby("team_id").size().reindex(teams["team_id"], fill_value=0).to_numpy()
+    teams["squad_end"] = squad_sizes.cumsum()
+    teams["squad_start"] = teams["squad_end"] - squad_sizes
+
+    return compact(teams, TEAMS_LAYOUT), squads
+
+
+def get_fantasy_tables(model: Optional[SeasonModel] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Get fantasy league data from the season model as a teams table and a squad table.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
 
     Returns:
-        DataFrame with fantasy teams sorted by total points (highest first)
-        Columns: team_name, manager_name, total_points, rank, players (list)
+        Tuple of (teams, squads); see build_fantasy_tables
     """
-    # Fetch team selection data
-    team_data = fetch_csv(CSV_URLS["TEAM_SELECTION"])
-
-    # The CSV structure: each row is a player on a team
-    # Columns: Team Name, Manager, Players, Price, Position, Total-Points, Team-Points
-    teams_map: Dict[str, Dict] = {}
-
-    for _, row in team_data.iterrows():
-        team_name = str(row.get("Team Name", "")).strip()
-        manager_name = str(row.get("Manager", "")).strip()
-        player_name = str(row.get("Players", "")).strip()
-        position = str(row.get("Position", "")).strip()
-        price = float(row.get("Price", 0) or 0)
-        player_points = float(row.get("Total-Points", 0) or 0)
-        team_points = float(row.get("Team-Points", 0) or 0)
-
-        # Skip rows without team name
-        if not team_name or not manager_name:
-            continue
-
-        # Get or create team
-        if team_name not in teams_map:
-            teams_map[team_name] = {
-                "team_name": team_name,
-                "manager_name": manager_name,
-                "players": [],
-                "total_points": team_points,
-                "rank": 0,  # Will be calculated after sorting
-            }
+    model = model or get_season_model()
+    return model.teams.copy(deep=False), model.squads.copy(deep=False)
+
+
+def get_team_squad(squads: pd.DataFrame, team: pd.Series) -> pd.DataFrame:
+    """
+    Get one team's players, already sorted by points.
+
+    Args:
+        squads: Squad table from get_fantasy_tables
+        team: The team's row from the teams table
+
+    Returns:
+        Slice of squads (a view, not a copy) with the team's players
+    """
+    return squads.iloc[team["squad_start"]:team["squad_end"]]
+
 
-        team = teams_map[team_name]
-
-        # Add player if we have player data
-        if player_name:
-            team["players"].append(
-                {
-                    "name": player_name,
-                    "position": position,
-                    "price": price,
-                    "points": player_points,
-                }
-            )
-
-    # Convert to DataFrame
-    teams_list = []
-    for team_name, team in teams_map.items():
-        # Calculate total points from players
-        total_points = sum(p["points"] for p in team["players"])
-        teams_list.append(
+@derived
+def _fantasy_standings(model: SeasonModel) -> pd.DataFrame:
+    """Standings for get_fantasy_standings, built once per version of the data."""
+    teams = model.teams
+    if teams.empty:
+        return teams
+    return freeze(
+        pd.DataFrame(
             {
-                "team_name": team["team_name"],
-                "manager_name": team["manager_name"],
-                "total_points": total_points,
-                "players": team["players"],
+                "rank": [get_medal_emoji(rank - 1) for rank in teams["rank"]],
+                "team_name": teams["team_name"],
+                "manager_name": teams["manager_name"],
+                "players": teams["squad_end"] - teams["squad_start"],
+                "total_points": teams["total_points"],
             }
         )
+    )
 
-    df = pd.DataFrame(teams_list)
 
-    if df.empty:
-        return df
+def get_fantasy_standings(model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Get the league standings, ready to display.
 
-    # Sort by total points (descending)
-    df = df.sort_values("total_points", ascending=False).reset_index(drop=True)
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
 
-    # Assign ranks
-    df["rank"] = df.index + 1
+    Returns:
+        DataFrame aligned with the teams table from get_fantasy_tables, with
+        rank (medal for the top 3), team_name, manager_name, players (squad
+        size) and total_points
+    """
+    return _fantasy_standings(model=model).copy(deep=False)
 
-    return df
+
+@derived
+def _fantasy_league(model: SeasonModel) -> pd.DataFrame:
+    """League table for get_fantasy_league, built once per version of the data."""
+    teams, squads = model.teams, model.squads
+    if teams.empty:
+        return teams
+
+    df = teams[["team_name", "manager_name", "total_points"]].copy()
+    df["players"] = [
+        get_team_squad(squads, team).astype({"name": str, "position": str}).to_dict("records")
+        for _, team in teams.iterrows()
+    ]
+    df["rank"] = teams["rank"]
+
+    return freeze(df)
+
+
+def get_fantasy_league(model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Fetch and process fantasy league team data.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
+
+    Returns:
+        DataFrame with fantasy teams sorted by total points (highest first)
+        Columns: team_name, manager_name, total_points, players (list), rank
+    """
+    return _fantasy_league(model=model).copy(deep=False)
 
 
 def get_team_players_df(players_list: List[Dict]) -> pd.DataFrame:
@@ -1,93 +1,206 @@
 """Fines data processing."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict
-from .data_fetcher import fetch_csv, parse_number
-from .config import CSV_URLS
+from typing import Optional
+from .data_fetcher import parse_dates, parse_numbers
+from .dtypes import COUNT, LABEL, compact
+from .player_registry import FINES_HEADER_ROWS, NO_PLAYER, PlayerRegistry, build_player_registry
+from .derived_cache import derived
+from .season_model import SeasonModel, get_season_model
+from .snapshot_cache import freeze
 
 
-def normalize_player_name(name: str) -> str:
-    """Normalize player names for matching across different data sources."""
-    if not name or pd.isna(name):
-        return ""
-    return str(name).lower().strip()
+# Compact dtypes for the fines table (see dtypes.compact); money stays float64
+FINES_LAYOUT = {"name": LABEL, "fine_count": COUNT}
 
 
-def get_player_fines() -> pd.DataFrame:
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Stringify and strip a column like str(row.get(column, "")).strip()."""
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[column].astype(str).str.strip()
+
+
+def build_player_fines(
+    fines_data: pd.DataFrame, registry: Optional[PlayerRegistry] = None
+) -> pd.DataFrame:
     """
-    Fetch and process player fines information.
+    Total each player's fines and collect their fine details.
+
+    Args:
+        fines_data: Fines sheet with generic headers, including its 4 header rows
+        registry: Player registry for these sheets (built from the fines if not given)
 
     Returns:
         DataFrame with player fine details sorted by total fines (highest first)
     """
-    # Fines data uses generic column names (no actual headers in CSV)
-    fines_data = fetch_csv(CSV_URLS["FINES"], use_generic_headers=True)
-
-    player_map: Dict[str, Dict] = {}
-
-    # Process fines data
-    # Skip first 4 rows: 2 header rows + 1 empty row + 1 column header row
-    # Check if first row is a header
-    if not fines_data.empty:
-        fines_rows = fines_data.iloc[4:]
-
-        for _, row in fines_rows.iterrows():
-            try:
-                # Column names: _1 is empty, _2 is Date, _3 is Fines, _4 is Description, _5 is Player
-                player_name = str(row.get('_5', '')).strip()
-                fine = parse_number(row.get('_3', 0))
-                date = str(row.get('_2', '')).strip()
-                description = str(row.get('_4', '')).strip()
-
-                if not player_name or not date:
-                    continue
-                if fine <= 0:
-                    continue  # Skip rows with no fine amount
-
-                normalized = normalize_player_name(player_name)
-
-                if normalized not in player_map:
-                    player_map[normalized] = {
-                        "name": player_name,
-                        "total_fines": 0.0,
-                        "fine_count": 0,
-                        "fine_details": [],
-                    }
-
-                player = player_map[normalized]
-                player["total_fines"] += fine
-                player["fine_count"] += 1
-                player["fine_details"].append(
-                    {"date": date, "amount": fine, "description": description}
-                )
-            except (IndexError, ValueError):
-                continue
-
-    # Sort fine details by date for each player
-    def parse_date_for_sorting(date_str: str) -> tuple:
-        """Parse DD/MM/YYYY format for sorting."""
-        try:
-            parts = date_str.split("/")
-            if len(parts) == 3:
-                day, month, year = map(int, parts)
-                return (year, month, day)
-        except:
-            pass
-        return (0, 0, 0)
-
-    for player in player_map.values():
-        player["fine_details"].sort(key=lambda x: parse_date_for_sorting(x["date"]))
-
-    # Convert to DataFrame
-    if not player_map:
+    if fines_data.empty or "_5" not in fines_data.columns:
+        return pd.DataFrame()
+    if registry is None:
+        registry = build_player_registry({"FINES": fines_data})
+
+    # Skip the header rows: 2 header rows + 1 empty row + 1 column header row
+    # Column names: _1 is empty, _2 is Date, _3 is Fines, _4 is Description, _5 is Player
+    fines_rows = fines_data.iloc[FINES_HEADER_ROWS:]
+    fines = pd.DataFrame(
+        {
+            "player_id": registry.ids(fines_rows["_5"], fuzzy=True),
+            "name": _text(fines_rows, "_5"),
+            "date": _text(fines_rows, "_2"),
+            "amount": parse_numbers(fines_rows["_3"]) if "_3" in fines_rows else 0.0,
+            "description": _text(fines_rows, "_4"),
+        }
+    )
+    # Skip rows with no player, no date or no fine amount
+    fines = fines[(fines["player_id"] != NO_PLAYER) & (fines["date"] != "") & (fines["amount"] > 0)]
+    if fines.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame.from_dict(player_map, orient="index")
+    # Fine details sorted by date; unparseable dates first
+    details = fines.assign(_sort_date=parse_dates(fines["date"])).sort_values(
+        "_sort_date", kind="stable", na_position="first"
+    )
+    fine_details = {
+        player_id: group[["date", "amount", "description"]].to_dict("records")
+        for player_id, group in details.groupby("player_id", sort=False)
+    }
+
+    # One row per player, in first-appearance order. Players resolved to Player
+    # Data take its spelling; unmatched ones keep the label first written in Fines
+    grouped = fines.groupby("player_id", sort=False)
+    counts = grouped.size()
+    df = pd.DataFrame(
+        {
+            "name": registry.labels(counts.index, grouped["name"].first()),
+            "total_fines": grouped["amount"].sum(),
+            "fine_count": counts,
+        }
+    )
+    df["fine_details"] = [fine_details[player_id] for player_id in df.index]
 
     # Sort by total fines (highest first)
     df = df.sort_values("total_fines", ascending=False).reset_index(drop=True)
 
-    return df
+    return compact(df, FINES_LAYOUT)
+
+
+def get_player_fines(model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Get player fines information from the season model.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
+
+    Returns:
+        DataFrame with player fine details sorted by total fines (highest first)
+    """
+    return (model or get_season_model()).fines.copy(deep=False)
+
+
+class FinesIndex:
+    """
+    Per-player fine amounts sorted ascending, with prefix sums.
+
+    Totals, counts and averages for any max_amount cutoff are then a binary
+    search per player instead of a pass over every fine, so the page can
+    re-filter on every slider move.
+    """
+
+    def __init__(self, players: pd.DataFrame):
+        """
+        Args:
+            players: Frame from get_player_fines (uses its fine_details column)
+        """
+        self.index = players.index
+        # build_player_fines returns a frame without columns when there are no fines
+        all_details = players["fine_details"] if "fine_details" in players.columns else []
+        amounts = [
+            np.sort(np.array([fine["amount"] for fine in details], dtype="float64"))
+            for details in all_details
+        ]
+        # Player i's amounts are self._amounts[offsets[i]:offsets[i + 1]]
+        self._offsets = np.concatenate([[0], np.cumsum([len(values) for values in amounts])]).astype("int64")
+        self._amounts = np.concatenate(amounts) if amounts else np.empty(0)
+        # prefix[j] is the sum of the first j amounts
+        self._prefix = np.concatenate([[0.0], np.cumsum(self._amounts)])
+
+    def summarize(self, max_amount: float = 5.0) -> pd.DataFrame:
+        """
+        Split each player's fines at max_amount.
+
+        Args:
+            max_amount: Largest amount counted as a regular fine
+
+        Returns:
+            DataFrame aligned with the players frame, with columns total, count and
+            average (regular fines, ≤ max_amount) and miscellaneous (the rest)
+        """
+        starts, ends = self._offsets[:-1], self._offsets[1:]
+        cutoffs = starts + np.array(
+            [
+                np.searchsorted(self._amounts[start:end], max_amount, side="right")
+                for start, end in zip(starts, ends)
+            ],
+            dtype="int64",
+        )
+        total = self._prefix[cutoffs] - self._prefix[starts]
+        count = cutoffs - starts
+        average = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+        miscellaneous = self._prefix[ends] - self._prefix[cutoffs]
+
+        return pd.DataFrame(
+            {"total": total, "count": count, "average": average, "miscellaneous": miscellaneous},
+            index=self.index,
+        )
+
+    @property
+    def max_amount(self) -> float:
+        """Largest single fine, or 0.0 if there are none."""
+        return float(self._amounts.max()) if len(self._amounts) else 0.0
+
+
+@derived
+def _fines_index(model: SeasonModel) -> FinesIndex:
+    """FinesIndex over the model's fines table, built once per version of the data."""
+    return FinesIndex(model.fines)
+
+
+def get_fines_index(model: Optional[SeasonModel] = None) -> FinesIndex:
+    """
+    Get the FinesIndex for the current fines table.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
+
+    Returns:
+        FinesIndex aligned with get_player_fines()
+    """
+    return _fines_index(model=model)
+
+
+@derived
+def _fines_summary(model: SeasonModel, max_amount: float) -> pd.DataFrame:
+    """Summary for get_fines_summary, computed once per version of the data and max_amount."""
+    return freeze(_fines_index(model=model).summarize(max_amount))
+
+
+def get_fines_summary(max_amount: float = 5.0, model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Split each player's fines at max_amount (see FinesIndex.summarize).
+
+    Summaries are cached per fine limit, so moving the slider back to a limit
+    already seen skips the work.
+
+    Args:
+        max_amount: Largest amount counted as a regular fine
+        model: Season model to read (default: the current one, see get_season_model)
+
+    Returns:
+        DataFrame aligned with get_player_fines(), with columns total, count,
+        average and miscellaneous
+    """
+    return _fines_summary(float(max_amount), model=model).copy(deep=False)
 
 
 def calculate_filtered_fines(fine_details: list, max_amount: float = 5.0) -> dict:
@@ -0,0 +1,114 @@
+"""Conditional HTTP fetching with a persistent on-disk body cache."""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from . import transport
+from .config import HTTP_CACHE_DIR
+
+
+@dataclass
+class CachedBody:
+    """Raw response body plus the metadata needed to revalidate it."""
+
+    content: bytes
+    version: str  # SHA-256 of the body, stable across restarts
+    modified: bool  # False when the server answered 304 Not Modified
+
+
+def _entry_paths(url: str, cache_dir: Path) -> tuple:
+    """Return the (body, metadata) file paths for a URL."""
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.csv", cache_dir / f"{key}.json"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file atomically so concurrent readers never see partial data."""
+    tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _load_entry(url: str, cache_dir: Path) -> Optional[Dict]:
+    """Load cached metadata and body for a URL, or None if missing/corrupt."""
+    body_path, meta_path = _entry_paths(url, cache_dir)
+    try:
+        meta = json.loads(meta_path.read_text())
+        content = body_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+
+    # Guard against a body that was replaced without its metadata
+    if hashlib.sha256(content).hexdigest() != meta.get("version"):
+        return None
+
+    meta["content"] = content
+    return meta
+
+
+def fetch_body(url: str, cache_dir: Path = HTTP_CACHE_DIR) -> CachedBody:
+    """
+    Fetch a URL, revalidating any cached copy with ETag / Last-Modified.
+
+    When the server answers 304 the cached body is returned without downloading
+    it again. New bodies and their validators are written to disk so they survive
+    restarts.
+
+    Args:
+        url: The URL to fetch
+        cache_dir: Directory holding cached bodies and validators
+
+    Returns:
+        CachedBody with the response content and its version
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached = _load_entry(url, cache_dir)
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with transport.get(url, headers=headers) as response:
+        if response.status_code == 304 and cached:
+            return CachedBody(content=cached["content"], version=cached["version"], modified=False)
+
+        response.raise_for_status()
+
+        # Stream the body, hashing it as chunks arrive
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            digest.update(chunk)
+            buffer.extend(chunk)
+
+    content = bytes(buffer)
+    version = digest.hexdigest()
+
+    # Servers without validators still let us skip re-parsing unchanged bodies
+    if cached and cached["version"] == version:
+        modified = False
+    else:
+        modified = True
+
+    body_path, meta_path = _entry_paths(url, cache_dir)
+    _atomic_write(body_path, content)
+    _atomic_write(
+        meta_path,
+        json.dumps(
+            {
+                "url": url,
+                "version": version,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        ).encode("utf-8"),
+    )
+
+    return CachedBody(content=content, version=version, modified=modified)
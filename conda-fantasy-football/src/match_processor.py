@@ -1,10 +1,49 @@
 """Match data processing."""
 
+import numpy as np
 import pandas as pd
 import re
-from typing import Dict, List, Tuple
-from .data_fetcher import fetch_csv, parse_number
-from .config import CSV_URLS, MATCH_COLUMNS
+from typing import Dict, List, Optional, Tuple
+from .data_fetcher import parse_dates, parse_numbers
+from .dtypes import COUNT, LABEL, POINTS, compact
+from .config import MATCH_COLUMNS
+from .derived_cache import derived
+from .player_registry import NO_PLAYER, PlayerRegistry
+from .season_model import SeasonModel, get_season_model
+
+# Per-player performance fields shown for each match: output field -> MATCH_COLUMNS key
+PERFORMANCE_FIELDS = {
+    "appearance": "APPEARANCE",
+    "goals": "GOALS",
+    "assists": "ASSISTS",
+    "clean_sheet": "CLEAN_SHEET",
+    "yellow_card": "YELLOW_CARD",
+    "red_card": "RED_CARD",
+    "points": "TOTAL_POINTS",
+}
+
+# Compact dtypes for the match and performance tables (see dtypes.compact)
+MATCHES_LAYOUT = {
+    "match_id": COUNT,
+    "team": LABEL,
+    "opponent": LABEL,
+    "score": LABEL,
+    "cpr_score": COUNT,
+    "opponent_score": COUNT,
+    "gameweek": LABEL,
+}
+PERFORMANCES_LAYOUT = {
+    "match_id": COUNT,
+    "name": LABEL,
+    **{field: COUNT for field in PERFORMANCE_FIELDS if field != "points"},
+    "points": POINTS,
+}
+
+# Team, score and opponent from descriptions like "CPR 3v2 Opponent" or "CPRA 4v4 Opponent"
+SCORE_PATTERN = re.compile(
+    r"(?P<team>CPRA|CPR)\s+(?P<cpr_score>\d+)v(?P<opponent_score>\d+)\s+(?P<opponent>.+)",
+    re.IGNORECASE,
+)
 
 
 def parse_score(match_description: str) -> Tuple[str, int, int, str]:
@@ -45,81 +84,315 @@ def parse_score(match_description: str) -> Tuple[str, int, int, str]:
     )
 
 
-def get_matches() -> List[Dict]:
+def parse_scores(descriptions: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized parse_score for a whole column of match descriptions.
+
+    Args:
+        descriptions: Match description strings
+
+    Returns:
+        DataFrame aligned with descriptions, with columns
+        team, cpr_score, opponent_score, opponent
+    """
+    parts = descriptions.str.extract(SCORE_PATTERN)
+    matched = parts["team"].notna()
+
+    # Default to CPR with a 0-0 score if the description can't be parsed
+    fallback_opponent = descriptions.str.replace(
+        r"^CPR(A)?\s+", "", case=False, regex=True
+    ).str.strip()
+
+    return pd.DataFrame(
+        {
+            "team": parts["team"].str.upper().where(matched, "CPR"),
+            "cpr_score": pd.to_numeric(parts["cpr_score"]).fillna(0).astype("int64"),
+            "opponent_score": pd.to_numeric(parts["opponent_score"]).fillna(0).astype("int64"),
+            "opponent": parts["opponent"].str.strip().where(matched, fallback_opponent),
+        },
+        index=descriptions.index,
+    )
+
+
+def build_match_tables(data_rows: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the match table and per-player performance table from match rows.
+
+    Args:
+        data_rows: Typed Match Details data rows (header rows already dropped)
+
+    Returns:
+        Tuple of (matches, performances):
+        - matches: one row per match sorted by date (most recent first), with
+          match_id, date, team, opponent, score, cpr_score, opponent_score,
+          gameweek and the parsed date_value
+        - performances: one row per player per match, with match_id, name and
+          the PERFORMANCE_FIELDS columns, in sheet order
+    """
+    # Text columns are stringified like str(value).strip()
+    text = {
+        key: data_rows[MATCH_COLUMNS[key]].astype(str).str.strip()
+        for key in ("DATE", "GAMEWEEK", "GAME", "PLAYER")
+    }
+    valid = (text["DATE"] != "") & (text["GAME"] != "") & (text["PLAYER"] != "")
+
+    rows = pd.DataFrame(
+        {
+            "date": text["DATE"][valid],
+            "game": text["GAME"][valid],
+            "gameweek": text["GAMEWEEK"][valid],
+            "name": text["PLAYER"][valid],
+        }
+    )
+    stats = parse_numbers(
+        data_rows.loc[valid, [MATCH_COLUMNS[key] for key in PERFORMANCE_FIELDS.values()]]
+    )
+    stats.columns = list(PERFORMANCE_FIELDS)
+
+    # Group by match (date + game description), numbering matches in sheet order
+    rows["match_id"] = rows.groupby(["date", "game"], sort=False).ngroup()
+
+    performances = pd.concat([rows[["match_id", "name"]], stats], axis=1).reset_index(drop=True)
+
+    # Match attributes come from each match's first row
+    matches = rows.drop_duplicates("match_id").set_index("match_id")
+    scores = parse_scores(matches["game"])
+    matches = pd.DataFrame(
+        {
+            "date": matches["date"],
+            "team": scores["team"],
+            "opponent": scores["opponent"],
+            "score": scores["cpr_score"].astype(str) + "-" + scores["opponent_score"].astype(str),
+            "cpr_score": scores["cpr_score"],
+            "opponent_score": scores["opponent_score"],
+            "gameweek": matches["gameweek"],
+            # Dates are DD/MM/YYYY; unparseable dates sort last
+            "date_value": parse_dates(matches["date"]),
+        }
+    )
+
+    # Sort by date (most recent first); stable so same-day matches keep sheet order
+    matches = matches.sort_values(
+        "date_value", ascending=False, kind="stable", na_position="last"
+    ).reset_index()
+
+    return compact(matches, MATCHES_LAYOUT), compact(performances, PERFORMANCES_LAYOUT)
+
+
+def get_match_tables() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Get match data from the season model as a match table and a per-player performance table.
+
+    Returns:
+        Tuple of (matches, performances) sharing a match_id column; see build_match_tables
+    """
+    model = get_season_model()
+    return model.matches.copy(deep=False), model.performances.copy(deep=False)
+
+
+@derived
+def _match_list(model: SeasonModel) -> List[Dict]:
+    """Match dictionaries for get_matches, built once per version of the data."""
+    matches, performances = model.matches, model.performances
+
+    players_by_match = {
+        match_id: group.drop(columns="match_id").to_dict("records")
+        for match_id, group in performances.groupby("match_id", sort=False)
+    }
+
+    match_list = matches.drop(columns=["match_id", "date_value"]).to_dict("records")
+    for match, match_id in zip(match_list, matches["match_id"]):
+        match["players"] = players_by_match.get(match_id, [])
+
+    return match_list
+
+
+def get_matches(model: Optional[SeasonModel] = None) -> List[Dict]:
     """
     Fetch and process match data with player performances.
 
+    The list is shared by every session (see derived_cache), so filter it into
+    a new list rather than modifying it.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
+
     Returns:
         List of match dictionaries sorted by date (most recent first)
     """
-    # Match data uses generic column names like '_1', '_2' to match TypeScript behavior
-    match_data = fetch_csv(CSV_URLS["MATCH_DETAILS"], use_generic_headers=True)
-
-    # Skip first 3 rows (headers)
-    data_rows = match_data.iloc[3:]
-
-    # Group by match (date + game description)
-    matches_map: Dict[str, Dict] = {}
-
-    for _, row in data_rows.iterrows():
-        date = str(row.get(MATCH_COLUMNS["DATE"], "")).strip()
-        gameweek = str(row.get(MATCH_COLUMNS["GAMEWEEK"], "")).strip()
-        match_description = str(row.get(MATCH_COLUMNS["GAME"], "")).strip()
-        player_name = str(row.get(MATCH_COLUMNS["PLAYER"], "")).strip()
-
-        if not date or not match_description or not player_name:
-            continue
-
-        match_key = f"{date}-{match_description}"
-
-        # Create match entry if it doesn't exist
-        if match_key not in matches_map:
-            team, cpr_score, opp_score, opp_name = parse_score(match_description)
-            matches_map[match_key] = {
-                "date": date,
-                "team": team,
-                "opponent": opp_name,
-                "score": f"{cpr_score}-{opp_score}",
-                "cpr_score": cpr_score,
-                "opponent_score": opp_score,
-                "gameweek": gameweek,
-                "players": [],
-            }
+    return _match_list(model=model)
+
+
+# Result codes in MatchIndex.results and the order of its (wins, draws, losses) tallies
+WIN, DRAW, LOSS = 0, 1, 2
+
+
+class MatchIndex:
+    """
+    Match table with prebuilt filter indexes and per-match player tables.
+
+    Matches are indexed by team, opponent, gameweek and player, each key with
+    its (wins, draws, losses) tally, and by date, so a filter is a lookup plus
+    an intersection of position arrays instead of a pass over every match.
+    Each match's players are presorted by points.
+    """
+
+    # Filterable fields, in the order select() intersects them
+    FIELDS = ("team", "opponent", "gameweek", "player_id")
+
+    def __init__(self, matches: pd.DataFrame, performances: pd.DataFrame, registry: PlayerRegistry):
+        """
+        Args:
+            matches: Match table from build_match_tables
+            performances: Performance table from build_match_tables
+            registry: Registry used to give performances player IDs
+        """
+        self.matches = matches
+        self.results = np.select(
+            [matches["cpr_score"] > matches["opponent_score"], matches["cpr_score"] < matches["opponent_score"]],
+            [WIN, LOSS],
+            DRAW,
+        ).astype("int8")
+
+        # Positions (into matches, so most recent first) of each match_id, and
+        # the match positions each player appeared in
+        match_ids = matches["match_id"].to_numpy()
+        position_of = pd.Series(np.arange(len(matches)), index=match_ids)
+        player_ids = registry.ids(performances["name"].astype(object))
+        appearances = pd.DataFrame(
+            {"player_id": player_ids.to_numpy(), "position": position_of.reindex(performances["match_id"]).to_numpy()}
+        ).drop_duplicates()
+        appearances = appearances[appearances["player_id"] != NO_PLAYER]
 
-        match = matches_map[match_key]
-
-        # Add player performance
-        match["players"].append(
-            {
-                "name": player_name,
-                "appearance": parse_number(row.get(MATCH_COLUMNS["APPEARANCE"], 0)),
-                "goals": parse_number(row.get(MATCH_COLUMNS["GOALS"], 0)),
-                "assists": parse_number(row.get(MATCH_COLUMNS["ASSISTS"], 0)),
-                "clean_sheet": parse_number(row.get(MATCH_COLUMNS["CLEAN_SHEET"], 0)),
-                "yellow_card": parse_number(row.get(MATCH_COLUMNS["YELLOW_CARD"], 0)),
-                "red_card": parse_number(row.get(MATCH_COLUMNS["RED_CARD"], 0)),
-                "points": parse_number(row.get(MATCH_COLUMNS["TOTAL_POINTS"], 0)),
+        self.positions: Dict[str, Dict] = {
+            field: {
+                key: np.sort(positions)
+                for key, positions in matches.groupby(field, observed=True, sort=False).indices.items()
             }
+            for field in ("team", "opponent", "gameweek")
+        }
+        self.positions["player_id"] = {
+            player_id: np.sort(group.to_numpy())
+            for player_id, group in appearances.groupby("player_id", sort=False)["position"]
+        }
+        self.tallies: Dict[str, Dict] = {
+            field: {key: self._count(positions) for key, positions in index.items()}
+            for field, index in self.positions.items()
+        }
+        self.player_names = registry.players["name"].reindex(list(self.positions["player_id"]))
+
+        # Dated matches come first, most recent first; keep them oldest first for searchsorted
+        dates = matches["date_value"].dropna().to_numpy()
+        self._dates_ascending = dates[::-1]
+
+        # Performances sorted by match then points (highest first); match_id's
+        # players are rows self._offsets[match_id]:self._offsets[match_id + 1]
+        order = np.lexsort((-performances["points"].to_numpy(), performances["match_id"].to_numpy()))
+        performances = performances.iloc[order].reset_index(drop=True)
+        self._offsets = np.searchsorted(
+            performances["match_id"].to_numpy(), np.arange(int(match_ids.max(initial=-1)) + 2)
         )
+        self.performances = performances.drop(columns="match_id")
+
+    def _count(self, positions: np.ndarray) -> Tuple[int, int, int]:
+        """(wins, draws, losses) among the matches at positions."""
+        wins, draws, losses = np.bincount(self.results[positions], minlength=3)
+        return int(wins), int(draws), int(losses)
+
+    def options(self, field: str) -> list:
+        """
+        Keys that can be selected for a field.
+
+        Args:
+            field: One of FIELDS
+
+        Returns:
+            Teams and opponents in alphabetical order, gameweeks most recent
+            first, player IDs in alphabetical order of name
+        """
+        keys = list(self.positions[field])
+        if field == "player_id":
+            return list(self.player_names.sort_values(key=lambda names: names.str.lower()).index)
+        if field == "gameweek":
+            return keys
+        return sorted(keys, key=lambda key: str(key).lower())
+
+    def select(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        **keys,
+    ) -> Tuple[np.ndarray, Tuple[int, int, int]]:
+        """
+        Find the matches that pass every filter.
+
+        Args:
+            start: Earliest match date to include, or None
+            end: Latest match date to include, or None
+            **keys: Field (one of FIELDS) -> key to match; None means any
+
+        Returns:
+            (positions into matches, most recent first; (wins, draws, losses))
+        """
+        filters = [(field, key) for field, key in keys.items() if key is not None]
+        if start is None and end is None and len(filters) <= 1:
+            # A single key or no filter at all: the tally is precomputed
+            if not filters:
+                positions = np.arange(len(self.matches))
+                return positions, self._count(positions)
+            field, key = filters[0]
+            positions = self.positions[field].get(key, np.empty(0, dtype="int64"))
+            return positions, self.tallies[field].get(key, (0, 0, 0))
 
-    # Convert to list
-    matches = list(matches_map.values())
+        positions = np.arange(len(self.matches))
+        if start is not None or end is not None:
+            dated = len(self._dates_ascending)
+            low = 0 if start is None else np.searchsorted(self._dates_ascending, pd.Timestamp(start).to_datetime64(), "left")
+            high = dated if end is None else np.searchsorted(self._dates_ascending, pd.Timestamp(end).to_datetime64(), "right")
+            positions = np.arange(dated - high, dated - low)
+        for field, key in filters:
+            positions = np.intersect1d(
+                positions, self.positions[field].get(key, np.empty(0, dtype="int64")), assume_unique=True
+            )
+        return positions, self._count(positions)
 
-    # Sort by date (most recent first)
-    def parse_date(date_str: str):
-        """Parse DD/MM/YYYY format"""
-        try:
-            parts = date_str.split("/")
-            if len(parts) == 3:
-                day, month, year = map(int, parts)
-                return (year, month, day)
-        except:
-            pass
-        return (0, 0, 0)
+    def date_range(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """(earliest, latest) match date, or None if no match has a date."""
+        if not len(self._dates_ascending):
+            return None
+        return pd.Timestamp(self._dates_ascending[0]), pd.Timestamp(self._dates_ascending[-1])
 
-    matches.sort(key=lambda m: parse_date(m["date"]), reverse=True)
+    def players(self, match_id: int) -> pd.DataFrame:
+        """
+        Get one match's player performances, sorted by points (highest first).
 
-    return matches
+        Args:
+            match_id: The match's match_id
+
+        Returns:
+            Slice of the sorted performances (a view, not a copy) with name and
+            the PERFORMANCE_FIELDS columns
+        """
+        match_id = int(match_id)
+        if not 0 <= match_id < len(self._offsets) - 1:
+            return self.performances.iloc[0:0]
+        return self.performances.iloc[self._offsets[match_id]:self._offsets[match_id + 1]]
+
+
+@derived
+def _match_index(model: SeasonModel) -> MatchIndex:
+    """MatchIndex over the model's match tables, built once per version of the data."""
+    return MatchIndex(model.matches, model.performances, model.registry)
+
+
+def get_match_index() -> MatchIndex:
+    """
+    Get the MatchIndex for the current match data.
+
+    Returns:
+        MatchIndex shared by every session; its tables must not be modified
+    """
+    return _match_index()
 
 
 def get_match_result_badge(cpr_score: int, opponent_score: int) -> str:
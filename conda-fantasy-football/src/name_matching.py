@@ -0,0 +1,67 @@
+"""Fuzzy player name matching with a character trigram index."""
+
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+def trigrams(name: str) -> FrozenSet[str]:
+    """
+    Character trigrams of a name, padded so word starts and ends count.
+
+    Args:
+        name: Normalized (trimmed, lowercased) name
+
+    Returns:
+        Set of 3-character substrings
+    """
+    padded = f"  {name} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """
+    Inverted index from trigram to the names that contain it.
+
+    A lookup only scores names that share at least one trigram with the query,
+    rather than every known name.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Args:
+            names: Normalized names to index
+        """
+        self.names: List[str] = list(names)
+        self._sizes = [len(trigrams(name)) for name in self.names]
+        self._postings: Dict[str, List[int]] = {}
+        for position, name in enumerate(self.names):
+            for gram in trigrams(name):
+                self._postings.setdefault(gram, []).append(position)
+
+    def best_match(self, name: str) -> Optional[Tuple[int, float]]:
+        """
+        Find the indexed name most similar to a query.
+
+        Similarity is the Dice coefficient of the two trigram sets (1.0 for
+        identical names). A tie for the best score is treated as no match.
+
+        Args:
+            name: Normalized name to look up
+
+        Returns:
+            (position in names, similarity), or None if nothing shares a trigram
+            or the best match is ambiguous
+        """
+        grams = trigrams(name)
+        shared = Counter(position for gram in grams for position in self._postings.get(gram, ()))
+        if not shared:
+            return None
+
+        scores = sorted(
+            ((2 * count / (len(grams) + self._sizes[position]), position) for position, count in shared.items()),
+            reverse=True,
+        )
+        if len(scores) > 1 and scores[0][0] == scores[1][0]:
+            return None
+        score, position = scores[0]
+        return position, score
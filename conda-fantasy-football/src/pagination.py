@@ -0,0 +1,71 @@
+"""Pagination of long tables, so pages only render the rows on screen."""
+
+from typing import Tuple
+
+import pandas as pd
+
+from .config import PAGE_SIZE
+
+
+def page_count(total_rows: int, page_size: int = PAGE_SIZE) -> int:
+    """Number of pages needed for total_rows (at least 1)."""
+    return max(1, -(-total_rows // page_size))
+
+
+def page_bounds(page: int, total_rows: int, page_size: int = PAGE_SIZE) -> Tuple[int, int]:
+    """
+    Row range shown on a page.
+
+    Args:
+        page: 1-based page number; out-of-range pages are clamped
+        total_rows: Number of rows in the table
+        page_size: Rows per page
+
+    Returns:
+        (start, end) positions, end exclusive
+    """
+    page = min(max(page, 1), page_count(total_rows, page_size))
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total_rows)
+
+
+def page_picker(total_rows: int, key: str, page_size: int = PAGE_SIZE) -> Tuple[int, int]:
+    """
+    Show a page picker for a table of total_rows and return the chosen row range.
+
+    No picker is shown when everything fits on one page.
+
+    Args:
+        total_rows: Number of rows in the table
+        key: Widget key, unique on the page
+        page_size: Rows per page
+
+    Returns:
+        (start, end) positions of the chosen page, end exclusive
+    """
+    # Imported here so src can be used without Streamlit (see batch_build)
+    import streamlit as st
+
+    pages = page_count(total_rows, page_size)
+    if pages == 1:
+        return page_bounds(1, total_rows, page_size)
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=key)
+    start, end = page_bounds(int(page), total_rows, page_size)
+    st.caption(f"Showing {start + 1}–{end} of {total_rows}")
+    return start, end
+
+
+def paginate(df: pd.DataFrame, key: str, page_size: int = PAGE_SIZE) -> pd.DataFrame:
+    """
+    Show a page picker for a table and return the rows on the chosen page.
+
+    Args:
+        df: Table to paginate
+        key: Widget key, unique on the page
+        page_size: Rows per page
+
+    Returns:
+        Slice of df (a view, not a copy) for the chosen page
+    """
+    start, end = page_picker(len(df), key, page_size)
+    return df.iloc[start:end]
@@ -1,193 +1,206 @@
 """Payment data processing."""
 
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List
-from .data_fetcher import fetch_csv, parse_number
-from .config import CSV_URLS, MATCH_COLUMNS, BANK_COLUMNS, SEASON_CONFIG
-
-
-def normalize_player_name(name: str) -> str:
-    """Normalize player names for matching across different data sources."""
-    if not name or pd.isna(name):
-        return ""
-    return str(name).lower().strip()
-
-
-def get_player_payments() -> pd.DataFrame:
+from typing import Dict, List, Optional
+from .data_fetcher import parse_dates, parse_numbers
+from .dtypes import COUNT, LABEL, compact
+from .player_registry import (
+    FINES_HEADER_ROWS,
+    NO_PLAYER,
+    PlayerRegistry,
+    build_player_registry,
+    is_bank_header,
+)
+from .config import MATCH_COLUMNS, BANK_COLUMNS, SEASON_CONFIG
+from .season_model import SeasonModel, get_season_model
+
+# Output columns, in display order
+OUTPUT_COLUMNS = [
+    "name",
+    "match_fees",
+    "season_fees",
+    "fines",
+    "total_owed",
+    "paid",
+    "balance",
+    "match_count",
+    "match_details",
+    "payment_details",
+    "fine_details",
+]
+
+# Compact dtypes for the payments table (see dtypes.compact); money stays float64
+PAYMENTS_LAYOUT = {"name": LABEL, "match_count": COUNT}
+
+
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Stringify and strip a column like str(row.get(column, "")).strip()."""
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[column].astype(str).str.strip()
+
+
+def _numbers(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Parse a numeric column, or zeros if the sheet doesn't have it."""
+    if column not in frame.columns:
+        return pd.Series(0.0, index=frame.index)
+    return parse_numbers(frame[column])
+
+
+def _player_ids(
+    registry: PlayerRegistry, frame: pd.DataFrame, column: str, fuzzy: bool = False
+) -> pd.Series:
+    """Player ID for each row, NO_PLAYER where the sheet has no name column (see PlayerRegistry.ids)."""
+    if column not in frame.columns:
+        return pd.Series(NO_PLAYER, index=frame.index, dtype="int32")
+    return registry.ids(frame[column], fuzzy=fuzzy)
+
+
+def _group_details(details: pd.DataFrame, columns: List[str]) -> Dict[int, List[Dict]]:
+    """Sort detail rows by date and collect them into one list of dicts per player ID."""
+    # NaT (unparseable dates) sorts first, like (0, 0, 0) did
+    details = details.assign(_sort_date=parse_dates(details["date"])).sort_values(
+        "_sort_date", kind="stable", na_position="first"
+    )
+    return {
+        player_id: group[columns].to_dict("records")
+        for player_id, group in details.groupby("player_id", sort=False)
+    }
+
+
+def build_player_payments(
+    player_data: pd.DataFrame,
+    match_rows: pd.DataFrame,
+    bank_data: pd.DataFrame,
+    fines_data: pd.DataFrame,
+    registry: Optional[PlayerRegistry] = None,
+) -> pd.DataFrame:
     """
-    Fetch and process player payment information.
-    Combines data from player data, match fees, and bank statement.
+    Join player data, match fees, bank payments and fines on player IDs.
+
+    Args:
+        player_data: Player Data sheet (Player, Fees, Payments, Appearance)
+        match_rows: Match Details data rows with DATE, FEE, GAME and PLAYER columns
+        bank_data: Bank Statement rows with DATE, DESCRIPTION, CREDIT and PLAYER columns
+        fines_data: Fines sheet with generic headers, including its 4 header rows
+        registry: Player registry for these sheets (built from them if not given)
 
     Returns:
         DataFrame with player payment details sorted by balance (highest debt first)
     """
-    # Fetch all data sources
-    player_data = fetch_csv(CSV_URLS["PLAYER_DATA"])
-    # Match data uses generic column names like '_1', '_2' to match TypeScript behavior
-    match_data = fetch_csv(CSV_URLS["MATCH_DETAILS"], use_generic_headers=True)
-    # Bank and fines data use generic headers (no actual headers in CSV)
-    bank_data = fetch_csv(CSV_URLS["BANK_STATEMENT"], use_generic_headers=True)
-    fines_data = fetch_csv(CSV_URLS["FINES"], use_generic_headers=True)
-
-    player_map: Dict[str, Dict] = {}
-
-    # Process player data (has Fees, Payments, Due columns)
-    for _, row in player_data.iterrows():
-        player_name = str(row.get("Player", "")).strip()
-        fees = parse_number(row.get("Fees", 0))
-        payments = parse_number(row.get("Payments", 0))
-        due = parse_number(row.get("Due", 0))
-        appearance = int(parse_number(row.get("Appearance", 0)))
-
-        if not player_name:
-            continue
-
-        normalized = normalize_player_name(player_name)
-        player_map[normalized] = {
-            "name": player_name,
-            "match_fees": fees,
-            "season_fees": 0,  # Will be calculated later
-            "fines": 0,  # Will be calculated from fines CSV
-            "total_owed": fees,
-            "paid": payments,
-            "balance": due,
-            "match_count": appearance,
-            "match_details": [],
-            "payment_details": [],
-            "fine_details": [],
-        }
-
-    # Process match details to get match fees per game (skip first 3 rows)
-    match_rows = match_data.iloc[3:]
-    for _, row in match_rows.iterrows():
-        player_name = str(row.get(MATCH_COLUMNS["PLAYER"], "")).strip()
-        fee = parse_number(row.get(MATCH_COLUMNS["FEE"], 0))
-        date = str(row.get(MATCH_COLUMNS["DATE"], "")).strip()
-        game = str(row.get(MATCH_COLUMNS["GAME"], "")).strip()
-
-        if not player_name or not date:
-            continue
-
-        normalized = normalize_player_name(player_name)
-        player = player_map.get(normalized)
-
-        if player and fee > 0:
-            player["match_details"].append({"date": date, "fee": fee, "game": game})
-
-    # Process bank payments
-    # Bank statement CSV has no headers, skip first row if it looks like a header
-    if not bank_data.empty:
-        first_row = bank_data.iloc[0]
-        # If first column contains "Date" or similar, skip it
-        if str(first_row.get('_1', '')).strip().lower() in ["date"]:
-            bank_data = bank_data.iloc[1:]
-
-    for _, row in bank_data.iterrows():
-        # Access by column names (indices converted to '_1', '_2', etc.)
-        try:
-            # Convert index to column name: index 0 -> '_1', index 1 -> '_2', etc.
-            date = str(row.get(f"_{BANK_COLUMNS['DATE']+1}", "")).strip()
-            description = str(row.get(f"_{BANK_COLUMNS['DESCRIPTION']+1}", "")).strip()
-            payment = parse_number(row.get(f"_{BANK_COLUMNS['CREDIT']+1}", 0))
-            player_name_from_bank = str(row.get(f"_{BANK_COLUMNS['PLAYER']+1}", "")).strip()
-
-            # Skip if no player name or payment
-            if not player_name_from_bank or payment == 0 or not date:
-                continue
-
-            # Parse date and filter for dates from payment start date onwards
-            date_parts = date.split("/")
-            if len(date_parts) != 3:
-                continue
-
-            day, month, year = map(int, date_parts)
-            row_date = datetime(year, month, day)
-
-            # Only process dates from the configured payment start date onwards
-            if row_date < SEASON_CONFIG["PAYMENT_START_DATE"]:
-                continue
-
-            # Match player
-            normalized = normalize_player_name(player_name_from_bank)
-            player = player_map.get(normalized)
-
-            if player:
-                player["payment_details"].append(
-                    {"date": date, "amount": payment, "description": description}
-                )
-        except (IndexError, ValueError):
-            continue
-
-    # Process fines data (skip first 4 rows)
-    if not fines_data.empty:
-        fines_rows = fines_data.iloc[4:]
-        for _, row in fines_rows.iterrows():
-            try:
-                # Column names: _1 is empty, _2 is Date, _3 is Fines, _4 is Description, _5 is Player
-                player_name = str(row.get('_5', '')).strip()
-                fine = parse_number(row.get('_3', 0))
-                date = str(row.get('_2', '')).strip()
-                description = str(row.get('_4', '')).strip()
-
-                if not player_name or not date or fine <= 0:
-                    continue
-
-                normalized = normalize_player_name(player_name)
-                player = player_map.get(normalized)
-
-                if player:
-                    player["fines"] += fine
-                    player["fine_details"].append(
-                        {"date": date, "amount": fine, "description": description}
-                    )
-            except (IndexError, ValueError):
-                continue
-
-    # Calculate season fees and update totals
-    for player in player_map.values():
-        # Apply season fee if player has played more than threshold number of games
-        player["season_fees"] = (
-            SEASON_CONFIG["SEASON_FEE"]
-            if player["match_count"] > SEASON_CONFIG["SEASON_FEE_THRESHOLD"]
-            else 0
+    if registry is None:
+        registry = build_player_registry(
+            {
+                "PLAYER_DATA": player_data,
+                "MATCH_DETAILS": match_rows,
+                "BANK_STATEMENT": bank_data,
+                "FINES": fines_data,
+            }
         )
 
-        # Update totalOwed to include season fees
-        player["total_owed"] = player["match_fees"] + player["season_fees"]
-
-        # Recalculate balance as Total Owed - Total Paid
-        player["balance"] = player["total_owed"] - player["paid"]
-
-        # Sort details by date
-        for detail_key in ["match_details", "payment_details", "fine_details"]:
-            player[detail_key].sort(key=lambda x: parse_date_for_sorting(x["date"]))
+    # Players: one row per player ID. A later row for the same player
+    # replaces the earlier one but keeps its position. Every player comes from
+    # Player Data, so names are its spelling whatever the other sheets say
+    players = pd.DataFrame(
+        {
+            "player_id": _player_ids(registry, player_data, "Player"),
+            "name": _text(player_data, "Player"),
+            "match_fees": _numbers(player_data, "Fees"),
+            "paid": _numbers(player_data, "Payments"),
+            "match_count": np.trunc(_numbers(player_data, "Appearance")).astype("int64"),
+        }
+    )
+    players = players[players["player_id"] != NO_PLAYER]
+    first_seen = players.drop_duplicates("player_id")["player_id"]
+    players = (
+        players.drop_duplicates("player_id", keep="last").set_index("player_id").reindex(first_seen)
+    )
+
+    # Match fees per game
+    fees = pd.DataFrame(
+        {
+            "player_id": _player_ids(registry, match_rows, MATCH_COLUMNS["PLAYER"]),
+            "date": _text(match_rows, MATCH_COLUMNS["DATE"]),
+            "fee": _numbers(match_rows, MATCH_COLUMNS["FEE"]),
+            "game": _text(match_rows, MATCH_COLUMNS["GAME"]),
+        }
+    )
+    fees = fees[(fees["date"] != "") & (fees["fee"] > 0) & fees["player_id"].isin(players.index)]
 
-    # Convert to DataFrame
-    players_list = [
-        p
-        for p in player_map.values()
-        if p["match_count"] > 0 or p["fines"] > 0
+    # Bank payments from the configured payment start date onwards
+    # Bank statement CSV has no headers, skip first row if it looks like a header
+    if is_bank_header(bank_data):
+        bank_data = bank_data.iloc[1:]
+
+    payments = pd.DataFrame(
+        {
+            "player_id": _player_ids(registry, bank_data, f"_{BANK_COLUMNS['PLAYER'] + 1}", fuzzy=True),
+            "date": _text(bank_data, f"_{BANK_COLUMNS['DATE'] + 1}"),
+            "amount": _numbers(bank_data, f"_{BANK_COLUMNS['CREDIT'] + 1}"),
+            "description": _text(bank_data, f"_{BANK_COLUMNS['DESCRIPTION'] + 1}"),
+        }
+    )
+    payment_dates = parse_dates(payments["date"])
+    payments = payments[
+        (payments["amount"] != 0)
+        & payment_dates.notna()
+        & (payment_dates >= SEASON_CONFIG["PAYMENT_START_DATE"])
+        & payments["player_id"].isin(players.index)
     ]
 
-    if not players_list:
+    # Fines (skip the header rows)
+    # Column names: _1 is empty, _2 is Date, _3 is Fines, _4 is Description, _5 is Player
+    fines_rows = fines_data.iloc[FINES_HEADER_ROWS:]
+    fines = pd.DataFrame(
+        {
+            "player_id": _player_ids(registry, fines_rows, "_5", fuzzy=True),
+            "date": _text(fines_rows, "_2"),
+            "amount": _numbers(fines_rows, "_3"),
+            "description": _text(fines_rows, "_4"),
+        }
+    )
+    fines = fines[(fines["date"] != "") & (fines["amount"] > 0) & fines["player_id"].isin(players.index)]
+
+    # Season fees and balances as column arithmetic
+    players["fines"] = fines.groupby("player_id")["amount"].sum().reindex(players.index, fill_value=0.0)
+    players["season_fees"] = np.where(
+        players["match_count"] > SEASON_CONFIG["SEASON_FEE_THRESHOLD"], SEASON_CONFIG["SEASON_FEE"], 0
+    ).astype("int64")
+    players["total_owed"] = players["match_fees"] + players["season_fees"]
+    players["balance"] = players["total_owed"] - players["paid"]
+
+    players = players[(players["match_count"] > 0) | (players["fines"] > 0)]
+    if players.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame(players_list)
+    # Sorted detail lists per player
+    for column, details, fields in (
+        ("match_details", fees, ["date", "fee", "game"]),
+        ("payment_details", payments, ["date", "amount", "description"]),
+        ("fine_details", fines, ["date", "amount", "description"]),
+    ):
+        grouped = _group_details(details, fields)
+        players[column] = [grouped.get(player_id, []) for player_id in players.index]
+
+    df = players[OUTPUT_COLUMNS].reset_index(drop=True)
 
     # Sort by balance (highest debt first)
     df = df.sort_values("balance", ascending=False).reset_index(drop=True)
 
-    return df
+    return compact(df, PAYMENTS_LAYOUT)
+
 
+def get_player_payments(model: Optional[SeasonModel] = None) -> pd.DataFrame:
+    """
+    Get player payment information from the season model.
+    Combines data from player data, match fees, bank statement and fines.
+
+    Args:
+        model: Season model to read (default: the current one, see get_season_model)
+
+    Returns:
+        DataFrame with player payment details sorted by balance (highest debt first)
+    """
+    return (model or get_season_model()).payments.copy(deep=False)
 
-def parse_date_for_sorting(date_str: str) -> tuple:
-    """Parse DD/MM/YYYY format for sorting."""
-    try:
-        parts = date_str.split("/")
-        if len(parts) == 3:
-            day, month, year = map(int, parts)
-            return (year, month, day)
-    except:
-        pass
-    return (0, 0, 0)
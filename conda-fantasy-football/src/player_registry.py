@@ -0,0 +1,232 @@
+"""Canonical player IDs shared by every source that names players."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import MATCH_COLUMNS, BANK_COLUMNS, NAME_MATCH_THRESHOLD
+from .data_fetcher import normalize_strings
+from .name_matching import TrigramIndex
+
+# Column holding player names in each source, in the order names are registered.
+# Player Data comes first so its spellings name the canonical players
+NAME_COLUMNS = {
+    "PLAYER_DATA": "Player",
+    "MATCH_DETAILS": MATCH_COLUMNS["PLAYER"],
+    "BANK_STATEMENT": f"_{BANK_COLUMNS['PLAYER'] + 1}",
+    "FINES": "_5",
+}
+
+# Sources whose unknown names are matched against Player Data names. Their
+# player labels are typed by hand, so misspellings are common
+FUZZY_SOURCES = ("BANK_STATEMENT", "FINES")
+
+# Leading rows of the Fines sheet: 2 header rows + 1 empty row + 1 column header row
+FINES_HEADER_ROWS = 4
+
+# ID returned for missing names
+NO_PLAYER = -1
+
+
+@dataclass(frozen=True)
+class PlayerRegistry:
+    """
+    Map every spelling of a player's name to a small integer ID.
+
+    Spellings are matched on their normalized key (trimmed, lowercased), so
+    "Bob Jones" and " BOB JONES" share an ID. In the hand-typed sources
+    (FUZZY_SOURCES), a key that isn't in Player Data but is close enough to one
+    that is (see NAME_MATCH_THRESHOLD) is resolved to that player and recorded
+    in ``aliases``. Other names still get an ID, so their rows can be joined,
+    and are listed in ``unmatched``.
+    """
+
+    # Indexed by player_id: key, name (first spelling seen) and in_player_data
+    players: pd.DataFrame
+    # Every distinct raw spelling seen, and the ID for each: by exact key, and
+    # with aliases resolved (for FUZZY_SOURCES). NO_PLAYER where there is none
+    spellings: pd.Index
+    spelling_ids: np.ndarray
+    fuzzy_spelling_ids: np.ndarray
+    # Names not in Player Data: source, name, rows
+    unmatched: pd.DataFrame
+    # Near-miss keys resolved to a Player Data player: alias, player_id, name, score
+    aliases: pd.DataFrame
+    # Trigram index over the Player Data keys, for resolving new spellings
+    index: TrigramIndex
+
+    def ids(self, names: pd.Series, fuzzy: bool = False) -> pd.Series:
+        """
+        Look up the player ID for each name.
+
+        Args:
+            names: Raw names from any source
+            fuzzy: Also resolve near misses of Player Data names (aliases and
+                resolve). Only for FUZZY_SOURCES; other sources match on the
+                normalized key alone
+
+        Returns:
+            int32 Series aligned with names, NO_PLAYER where the name is blank or unknown
+        """
+        positions = self.spellings.get_indexer(names)
+        spelling_ids = self.fuzzy_spelling_ids if fuzzy else self.spelling_ids
+        ids = np.where(positions >= 0, spelling_ids[positions], NO_PLAYER)
+
+        unseen = positions < 0
+        if unseen.any():
+            # Spellings that weren't registered can still match on their key,
+            # or with fuzzy, on the Player Data name they are closest to
+            keys = normalize_strings(names[unseen])
+            key_ids = pd.Series(self.players.index, index=self.players["key"]).reindex(keys)
+            if fuzzy:
+                alias_ids = pd.Series(self.aliases["player_id"].to_numpy(), index=self.aliases["alias"])
+                key_ids = alias_ids.reindex(keys).fillna(key_ids)
+            ids[unseen] = [
+                int(player_id) if not np.isnan(player_id) else self.resolve(key) if fuzzy else NO_PLAYER
+                for key, player_id in zip(keys, key_ids)
+            ]
+
+        return pd.Series(ids, index=names.index, dtype="int32")
+
+    def labels(self, player_ids: pd.Index, source_names: pd.Series) -> pd.Series:
+        """
+        Display name for each player: the Player Data spelling for players in
+        Player Data, otherwise the name as written in the source.
+
+        Args:
+            player_ids: Player IDs to label
+            source_names: Names from the source, indexed by player ID
+
+        Returns:
+            Names indexed by player_ids
+        """
+        players = self.players.reindex(player_ids)
+        return players["name"].where(players["in_player_data"].eq(True), source_names.reindex(player_ids))
+
+    def resolve(self, key: str) -> int:
+        """
+        Find the Player Data player a normalized name is a near miss for.
+
+        Args:
+            key: Normalized name
+
+        Returns:
+            Player ID, or NO_PLAYER if the key is blank or nothing is close enough
+        """
+        match = _best_match(self.index, key)
+        if match is None:
+            return NO_PLAYER
+        return int(self.players.index[self.players["key"] == match[0]][0])
+
+
+def _name_rows(source: str, frame: pd.DataFrame) -> pd.Series:
+    """The name column of a source, without its header rows."""
+    column = NAME_COLUMNS[source]
+    if column not in frame.columns:
+        return pd.Series([], dtype=object)
+
+    names = frame[column]
+    if source == "FINES":
+        names = names.iloc[FINES_HEADER_ROWS:]
+    elif source == "BANK_STATEMENT" and is_bank_header(frame):
+        names = names.iloc[1:]
+    return names
+
+
+def is_bank_header(bank_data: pd.DataFrame) -> bool:
+    """Whether the Bank Statement's first row is a header (its date cell reads "Date")."""
+    date_column = f"_{BANK_COLUMNS['DATE'] + 1}"
+    if bank_data.empty or date_column not in bank_data.columns:
+        return False
+    return str(bank_data[date_column].iloc[0]).strip().lower() == "date"
+
+
+def _best_match(index: TrigramIndex, key: str) -> Optional[Tuple[str, float]]:
+    """The indexed key a name is a near miss for, with its similarity, if above the threshold."""
+    if not key:
+        return None
+    match = index.best_match(key)
+    if match is None or match[1] < NAME_MATCH_THRESHOLD:
+        return None
+    return index.names[match[0]], match[1]
+
+
+def build_player_registry(sources: Dict[str, pd.DataFrame]) -> PlayerRegistry:
+    """
+    Register every player name seen in the sources.
+
+    Args:
+        sources: Frames keyed by source (any of NAME_COLUMNS), read the way
+            fetch_source reads them
+
+    Returns:
+        PlayerRegistry with IDs numbered in order of first appearance
+    """
+    sightings = pd.concat(
+        [
+            pd.DataFrame({"source": source, "spelling": _name_rows(source, sources[source])})
+            for source in NAME_COLUMNS
+            if source in sources
+        ],
+        ignore_index=True,
+    )
+    sightings["key"] = normalize_strings(sightings["spelling"])
+    sightings = sightings[sightings["key"] != ""].assign(
+        name=lambda rows: rows["spelling"].astype(str).str.strip()
+    )
+
+    # Resolve Bank Statement and Fines keys that aren't in Player Data to the
+    # closest Player Data key, if any is close enough. Only the few unknown keys
+    # are looked up, and each lookup only scores names sharing a trigram with it
+    known_keys = sightings.loc[sightings["source"] == "PLAYER_DATA", "key"].unique()
+    index = TrigramIndex(known_keys)
+    fuzzy = sightings["source"].isin(FUZZY_SOURCES)
+    unknown = fuzzy & ~sightings["key"].isin(known_keys)
+    resolved = {}
+    for key in pd.unique(sightings.loc[unknown, "key"]):
+        match = _best_match(index, key)
+        if match is not None:
+            resolved[key] = match
+    alias_keys = {key: match_key for key, (match_key, _) in resolved.items()}
+    # Other sources keep their own key, so their rows never depend on what the
+    # hand-typed sheets happen to contain
+    sightings["resolved_key"] = sightings["key"].mask(fuzzy, sightings["key"].replace(alias_keys))
+
+    # IDs in order of first appearance, Player Data first
+    sightings["player_id"] = sightings.groupby("resolved_key", sort=False).ngroup().astype("int32")
+    players = sightings.drop_duplicates("player_id").set_index("player_id")[["resolved_key", "name"]]
+    players = players.rename(columns={"resolved_key": "key"})
+    registered = sightings.loc[sightings["source"] == "PLAYER_DATA", "player_id"].unique()
+    players["in_player_data"] = players.index.isin(registered)
+
+    key_ids = pd.Series(players.index, index=players["key"])
+    aliases = pd.DataFrame(
+        {
+            "alias": list(resolved),
+            "player_id": [key_ids[match_key] for match_key, _ in resolved.values()],
+            "score": [score for _, score in resolved.values()],
+        }
+    )
+    aliases.insert(2, "name", players["name"].reindex(aliases["player_id"]).to_numpy())
+
+    spellings = sightings.drop_duplicates("spelling")["spelling"]
+    spelling_keys = normalize_strings(spellings)
+    unmatched = (
+        sightings[~sightings["player_id"].isin(registered)]
+        .groupby(["source", "name"], sort=False)
+        .size()
+        .rename("rows")
+        .reset_index()
+    )
+
+    return PlayerRegistry(
+        players=players,
+        spellings=pd.Index(spellings),
+        spelling_ids=key_ids.reindex(spelling_keys).fillna(NO_PLAYER).to_numpy("int32"),
+        fuzzy_spelling_ids=key_ids.reindex(spelling_keys.replace(alias_keys)).fillna(NO_PLAYER).to_numpy("int32"),
+        unmatched=unmatched,
+        aliases=aliases,
+        index=index,
+    )
@@ -0,0 +1,134 @@
+"""
+Record the Google Sheets sources and replay them from a local HTTP server.
+
+Usage (from the conda-fantasy-football directory):
+
+    python -m src.replay_server record recordings/
+    python -m src.replay_server serve recordings/ --port 8600 --latency 0.3 --bandwidth 200000
+    CPR_DATA_SOURCE=http://127.0.0.1:8600 streamlit run app.py
+
+Recorded files can also be read directly without a server:
+
+    CPR_DATA_SOURCE=recordings/ streamlit run app.py
+"""
+
+import argparse
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from .config import CSV_URLS
+from .sources import read_body
+
+
+def record(dest_dir: Path) -> None:
+    """
+    Download every source in CSV_URLS into dest_dir as <SOURCE_KEY>.csv.
+
+    Args:
+        dest_dir: Directory to write the recorded CSVs to
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    for name, url in CSV_URLS.items():
+        body = read_body(url)
+        (dest_dir / f"{name}.csv").write_bytes(body.content)
+        print(f"Recorded {name} ({len(body.content):,} bytes)")
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serve recorded CSVs with simulated latency and bandwidth."""
+
+    def __init__(self, *args, root: Path, latency: float, bandwidth: Optional[int], **kwargs):
+        self.root = root
+        self.latency = latency
+        self.bandwidth = bandwidth
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        """Serve /<SOURCE_KEY>.csv from the recordings directory."""
+        path = (self.root / self.path.lstrip("/").split("?")[0]).resolve()
+        if path.parent != self.root or not path.is_file():
+            self.send_error(404)
+            return
+
+        content = path.read_bytes()
+        time.sleep(self.latency)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+
+        if not self.bandwidth:
+            self.wfile.write(content)
+            return
+
+        # Throttle to roughly `bandwidth` bytes per second in 10 ms slices
+        chunk_size = max(1, self.bandwidth // 100)
+        for start in range(0, len(content), chunk_size):
+            self.wfile.write(content[start:start + chunk_size])
+            time.sleep(0.01)
+
+    def log_message(self, format, *args):
+        """Keep request logging quiet during benchmarks."""
+
+
+def serve(
+    root: Path,
+    host: str = "127.0.0.1",
+    port: int = 8600,
+    latency: float = 0.0,
+    bandwidth: Optional[int] = None,
+) -> ThreadingHTTPServer:
+    """
+    Start a replay server for recorded CSVs on a background thread.
+
+    Args:
+        root: Directory of recorded <SOURCE_KEY>.csv files
+        host: Interface to bind to
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds to wait before answering each request
+        bandwidth: Maximum bytes per second per response (None for unlimited)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    handler = partial(ReplayHandler, root=root.resolve(), latency=latency, bandwidth=bandwidth)
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="replay-server", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Download all sources to a directory")
+    record_parser.add_argument("dest_dir", type=Path)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve recorded sources over HTTP")
+    serve_parser.add_argument("root", type=Path)
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8600)
+    serve_parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    serve_parser.add_argument("--bandwidth", type=int, default=None, help="Bytes per second")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.dest_dir)
+    else:
+        server = serve(args.root, args.host, args.port, args.latency, args.bandwidth)
+        print(f"Replaying {args.root} at http://{args.host}:{server.server_port}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
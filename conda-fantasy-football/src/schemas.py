@@ -0,0 +1,155 @@
+"""Typed CSV schemas for the generic-header sheets (Match Details, Bank Statement)."""
+
+import io
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import MATCH_COLUMNS, BANK_COLUMNS
+
+# Column kinds
+STRING = "string"
+NUMBER = "number"  # Plain or currency formatted (£, $, thousands separators)
+
+# Characters stripped from numeric cells before parsing (currency symbols, thousands separators)
+NUMBER_JUNK_PATTERN = r"[£$,]"
+
+
+def _column_index(name: str) -> int:
+    """Convert a generic column name like '_3' to its 0-based position."""
+    return int(name.lstrip("_")) - 1
+
+
+@dataclass(frozen=True)
+class CsvSchema:
+    """
+    Declared layout of a sheet read with generic '_1', '_2', ... headers.
+
+    Only the declared columns are parsed (with the pyarrow engine when possible).
+    NUMBER columns come back as float64 with NaN for blank or unparseable cells,
+    STRING columns as object with NaN for blanks, and the leading header rows are
+    dropped so every row is data.
+    """
+
+    source: str  # Key in CSV_URLS
+    header_rows: int
+    columns: Tuple[Tuple[str, str], ...]  # (column name, kind) in file order
+
+    @property
+    def names(self) -> List[str]:
+        """Declared column names in file order."""
+        return [name for name, _ in self.columns]
+
+    @property
+    def number_columns(self) -> List[str]:
+        """Names of NUMBER columns."""
+        return [name for name, kind in self.columns if kind == NUMBER]
+
+    def parse(self, content: bytes) -> pd.DataFrame:
+        """
+        Parse raw CSV bytes into a typed frame of the declared columns.
+
+        Args:
+            content: Raw CSV body
+
+        Returns:
+            DataFrame with one row per data row and one column per declared column
+        """
+        names = self.names
+        positions = [_column_index(name) for name in names]
+
+        try:
+            df = pd.read_csv(
+                io.BytesIO(content),
+                header=None,
+                usecols=positions,
+                dtype="string[pyarrow]",
+                engine="pyarrow",
+            )
+            df.columns = names
+        except (ValueError, KeyError):
+            # Ragged rows (ValueError) or missing columns (pyarrow's ArrowKeyError):
+            # fall back to the C parser and pad
+            df = pd.read_csv(io.BytesIO(content), header=None, dtype="string[pyarrow]")
+            df.columns = [f"_{i + 1}" for i in range(len(df.columns))]
+            df = df.reindex(columns=names)
+
+        df = df.iloc[self.header_rows:].reset_index(drop=True)
+
+        # Blanks come back as <NA>; keep read_csv's object/NaN convention
+        df = df.astype(object).where(df.notna(), np.nan)
+
+        for name in self.number_columns:
+            df[name] = pd.to_numeric(
+                df[name].str.replace(NUMBER_JUNK_PATTERN, "", regex=True), errors="coerce"
+            ).astype("float64")
+
+        return df
+
+    def project(self, df: pd.DataFrame, columns: Optional[Iterable[str]]) -> pd.DataFrame:
+        """
+        Select the columns a consumer needs from a parsed frame.
+
+        Args:
+            df: Frame produced by parse()
+            columns: Column names to keep (default: all declared columns)
+
+        Returns:
+            New DataFrame with only the requested columns, sharing df's values
+        """
+        if columns is None:
+            return df.copy(deep=False)
+        # Built from column views so no values are copied (df[list] would copy)
+        return pd.DataFrame({name: df[name] for name in columns}, copy=False)
+
+
+def _schema(source: str, header_rows: int, kinds: Dict[str, str]) -> CsvSchema:
+    """Build a schema with its columns sorted into file order."""
+    columns = tuple(sorted(kinds.items(), key=lambda item: _column_index(item[0])))
+    return CsvSchema(source=source, header_rows=header_rows, columns=columns)
+
+
+# Match Details: 3 header rows, then one row per player per match
+MATCH_SCHEMA = _schema(
+    "MATCH_DETAILS",
+    header_rows=3,
+    kinds={
+        MATCH_COLUMNS["DATE"]: STRING,
+        MATCH_COLUMNS["FEE"]: NUMBER,
+        MATCH_COLUMNS["GAMEWEEK"]: STRING,
+        MATCH_COLUMNS["GAME"]: STRING,
+        MATCH_COLUMNS["PLAYER"]: STRING,
+        MATCH_COLUMNS["APPEARANCE"]: NUMBER,
+        MATCH_COLUMNS["GOALS"]: NUMBER,
+        MATCH_COLUMNS["ASSISTS"]: NUMBER,
+        MATCH_COLUMNS["MOM"]: NUMBER,
+        MATCH_COLUMNS["MOM_2"]: NUMBER,
+        MATCH_COLUMNS["MOM_3"]: NUMBER,
+        MATCH_COLUMNS["DOD"]: NUMBER,
+        MATCH_COLUMNS["YELLOW_CARD"]: NUMBER,
+        MATCH_COLUMNS["RED_CARD"]: NUMBER,
+        MATCH_COLUMNS["CLEAN_SHEET"]: NUMBER,
+        MATCH_COLUMNS["TOTAL_POINTS"]: NUMBER,
+    },
+)
+
+# Bank Statement: no header rows are dropped here; a "Date" header row, if
+# present, is filtered out by the payments processor
+BANK_SCHEMA = _schema(
+    "BANK_STATEMENT",
+    header_rows=0,
+    kinds={
+        f"_{BANK_COLUMNS['DATE'] + 1}": STRING,
+        f"_{BANK_COLUMNS['DESCRIPTION'] + 1}": STRING,
+        f"_{BANK_COLUMNS['TYPE'] + 1}": STRING,
+        f"_{BANK_COLUMNS['CREDIT'] + 1}": NUMBER,
+        f"_{BANK_COLUMNS['DEBIT'] + 1}": NUMBER,
+        f"_{BANK_COLUMNS['BALANCE'] + 1}": NUMBER,
+        f"_{BANK_COLUMNS['PLAYER'] + 1}": STRING,
+    },
+)
+
+# Sources read through a typed schema, keyed by CSV_URLS key
+SCHEMAS = {schema.source: schema for schema in (MATCH_SCHEMA, BANK_SCHEMA)}
@@ -0,0 +1,158 @@
+"""Season model: every processed table, built once per version of the source data."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from .config import SEASON_SOURCES
+from .data_fetcher import fetch_fresh_snapshot, prefetch_all
+from .dtypes import memory_report
+from .player_registry import PlayerRegistry, build_player_registry
+from .single_flight import SingleFlight
+from .snapshot_cache import freeze
+
+@dataclass(frozen=True)
+class SeasonModel:
+    """
+    Processed tables for one version of the source sheets.
+
+    Tables are shared by every page and session and are frozen (see
+    snapshot_cache.freeze): in-place writes raise, and the get_* processor
+    functions hand out shallow copies.
+    Every table joins players on the IDs from one shared registry.
+    """
+
+    versions: Tuple[Tuple[str, str], ...]  # (source, snapshot version) pairs
+    registry: PlayerRegistry  # Player IDs for every name in the sources
+    player_stats: pd.DataFrame  # Leaderboard, see aggregate_player_stats
+    matches: pd.DataFrame  # One row per match, see build_match_tables
+    performances: pd.DataFrame  # One row per player appearance in a match
+    payments: pd.DataFrame  # See build_player_payments
+    fines: pd.DataFrame  # See build_player_fines
+    teams: pd.DataFrame  # Fantasy teams, see build_fantasy_tables
+    squads: pd.DataFrame  # Fantasy squads keyed by team_id
+
+    def tables(self) -> Dict[str, pd.DataFrame]:
+        """Every table in the model, keyed by field name."""
+        return {
+            "players": self.registry.players,
+            "player_stats": self.player_stats,
+            "matches": self.matches,
+            "performances": self.performances,
+            "payments": self.payments,
+            "fines": self.fines,
+            "teams": self.teams,
+            "squads": self.squads,
+        }
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        Memory used by each table, to track bytes per row as the data grows.
+
+        Returns:
+            DataFrame with table, rows, columns, bytes and bytes_per_row
+        """
+        return memory_report(self.tables())
+
+
+def build_season_model(
+    sources: Dict[str, pd.DataFrame], versions: Tuple[Tuple[str, str], ...] = ()
+) -> SeasonModel:
+    """
+    Build every processed table from the source frames.
+
+    Args:
+        sources: Frames keyed by source (see SEASON_SOURCES), read the way
+            fetch_source reads them; they are not modified
+        versions: Snapshot versions the frames came from
+
+    Returns:
+        SeasonModel with all tables
+    """
+    # Processors import this module for get_season_model, so import their builders here
+    from .data_processor import aggregate_player_stats
+    from .fantasy_processor import build_fantasy_tables
+    from .fines_processor import build_player_fines
+    from .match_processor import build_match_tables
+    from .payment_processor import build_player_payments
+
+    match_rows = sources["MATCH_DETAILS"]
+    player_data = sources["PLAYER_DATA"]
+    fines_data = sources["FINES"]
+
+    registry = build_player_registry(sources)
+    matches, performances = build_match_tables(match_rows)
+    teams, squads = build_fantasy_tables(sources["TEAM_SELECTION"])
+
+    # Tables are shared by every session, so make accidental writes raise
+    return SeasonModel(
+        versions=versions,
+        registry=registry,
+        player_stats=freeze(aggregate_player_stats(match_rows, player_data, registry)),
+        matches=freeze(matches),
+        performances=freeze(performances),
+        payments=freeze(
+            build_player_payments(player_data, match_rows, sources["BANK_STATEMENT"], fines_data, registry)
+        ),
+        fines=freeze(build_player_fines(fines_data, registry)),
+        teams=freeze(teams),
+        squads=freeze(squads),
+    )
+
+
+def load_fresh_season_model() -> SeasonModel:
+    """
+    Build a season model from sources downloaded now, bypassing the snapshot
+    cache and store, for builds that must not publish stale data.
+
+    Returns:
+        SeasonModel whose versions are the sources as they are right now
+    """
+    with ThreadPoolExecutor(max_workers=len(SEASON_SOURCES)) as executor:
+        snapshots = dict(zip(SEASON_SOURCES, executor.map(fetch_fresh_snapshot, SEASON_SOURCES)))
+    return build_season_model(
+        {source: snapshot.data for source, snapshot in snapshots.items()},
+        tuple((source, snapshot.version) for source, snapshot in snapshots.items()),
+    )
+
+
+_model: Optional[SeasonModel] = None
+_model_lock = threading.Lock()
+_builds = SingleFlight()
+
+
+def get_season_model() -> SeasonModel:
+    """
+    Get the season model for the current source snapshots.
+
+    The model is rebuilt only when one of the source snapshots has a new
+    version, so reruns and other pages reuse the same tables. Concurrent
+    sessions that need the same rebuild share a single build. Snapshots are
+    read through prefetch_all, so cold sources are downloaded concurrently.
+
+    Returns:
+        SeasonModel for the latest snapshots
+    """
+    global _model
+
+    snapshots = prefetch_all(SEASON_SOURCES)
+    versions = tuple((source, snapshot.version) for source, snapshot in snapshots.items())
+
+    with _model_lock:
+        model = _model
+    if model is not None and model.versions == versions:
+        return model
+
+    def build() -> SeasonModel:
+        global _model
+        built = build_season_model(
+            {source: snapshot.data for source, snapshot in snapshots.items()}, versions
+        )
+        with _model_lock:
+            _model = built
+        return built
+
+    return _builds.do(versions, build)
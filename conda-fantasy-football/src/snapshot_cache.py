@@ -0,0 +1,250 @@
+"""Process-wide stale-while-revalidate cache for fetched data snapshots."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from .snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+
+def freeze(obj: Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame, pd.Series]:
+    """
+    Make the numpy arrays behind a frame or series read-only.
+
+    This covers numpy-backed columns other than datetimes, and the codes and
+    categories of categorical columns (see dtypes.compact). Only public
+    pandas and numpy accessors are used.
+
+    Frames shared between sessions are frozen so that an accidental in-place
+    write (``df.loc[...] = ...``, ``series[0] = ...``) raises
+    "assignment destination is read-only" instead of changing every session's
+    data. Adding or replacing columns on a shallow copy is still fine.
+
+    Args:
+        obj: DataFrame or Series to freeze in place
+
+    Returns:
+        The same object
+    """
+    columns = obj.items() if isinstance(obj, pd.DataFrame) else [(obj.name, obj)]
+    for _, column in columns:
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Writes to a categorical column go to its codes; categories can be
+            # shared with other columns of the same dtype
+            _freeze_array(column.cat.codes.to_numpy())
+            _freeze_array(column.cat.categories.to_numpy())
+        elif isinstance(column.dtype, np.dtype) and column.dtype.kind not in "mM":
+            # Datetime columns are left writable: pandas 2 fails on a read-only
+            # one with an internal error rather than "read-only"
+            _freeze_array(column.to_numpy())
+    return obj
+
+
+def _freeze_array(values: np.ndarray) -> None:
+    """
+    Make an array and every array it is a view of read-only.
+
+    A column's array is usually a view of a block shared by several columns,
+    and pandas writes through the block, so the whole chain of bases is frozen.
+    """
+    while isinstance(values, np.ndarray):
+        values.flags.writeable = False
+        values = values.base
+
+
+@dataclass
+class Snapshot:
+    """
+    A fetched DataFrame plus when it was fetched and which body it came from.
+
+    The data is frozen (see freeze) because one snapshot is shared by every
+    session; hand out ``data.copy(deep=False)`` rather than deep copies.
+    """
+
+    data: pd.DataFrame
+    version: str
+    fetched_at: float  # time.time() of the last successful fetch or revalidation
+    # Values computed from `data` (e.g. coerced columns), valid for this version only
+    derived: Dict[Hashable, Any] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        freeze(self.data)
+
+    @property
+    def age(self) -> float:
+        """Seconds since this snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+
+# Loader signature: (key, previous snapshot or None) -> new snapshot
+Loader = Callable[[Hashable, Optional[Snapshot]], Snapshot]
+
+
+class SnapshotCache:
+    """
+    Serve the last good snapshot immediately and refresh it in the background.
+
+    Only the first request for a key blocks on the loader, and concurrent
+    requests for the same key share a single load. Afterwards, a snapshot
+    older than ``fresh_for`` is returned as-is while a background thread fetches a
+    replacement. If a snapshot ever gets older than ``max_staleness`` (for example
+    because refreshes keep failing), the next request blocks on a refresh instead,
+    falling back to the stale snapshot if that refresh fails too.
+
+    After a failed refresh, a key is not retried (blocking or in the
+    background) for ``retry_after`` seconds and its stale snapshot is served
+    as-is, so an outage costs one slow request per key rather than one per
+    request.
+
+    With a ``store``, snapshots are persisted after every load and a key with no
+    in-memory snapshot is first served from disk. Snapshots seeded from disk
+    are never blocked on for being older than ``max_staleness``; they are
+    refreshed in the background instead, so restarts do not block on the
+    network.
+    """
+
+    def __init__(
+        self,
+        loader: Loader,
+        fresh_for: float,
+        max_staleness: Optional[float] = None,
+        store: Optional["SnapshotStore"] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """
+        Args:
+            loader: Called as loader(key, previous snapshot or None) to fetch a key
+            fresh_for: Age in seconds after which a snapshot is refreshed in the background
+            max_staleness: Age in seconds after which a request waits for a refresh;
+                None never blocks once a snapshot exists
+            store: Optional persistent store to seed from and save to
+            retry_after: Seconds to wait after a failed refresh before retrying a
+                key; defaults to fresh_for
+        """
+        self._loader = loader
+        self._fresh_for = fresh_for
+        self._max_staleness = max_staleness
+        self._store = store
+        self._retry_after = fresh_for if retry_after is None else retry_after
+        self._snapshots: Dict[Hashable, Snapshot] = {}
+        self._refreshing: set = set()
+        # Keys whose current snapshot came from the store rather than the loader
+        self._seeded: set = set()
+        # time.time() of the last failed refresh per key, cleared on success
+        self._failed_at: Dict[Hashable, float] = {}
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Snapshot:
+        """Return the snapshot for a key, loading or scheduling a refresh as needed."""
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+
+        if snapshot is None:
+            snapshot = self._load_from_store(key)
+            if snapshot is None:
+                return self._refresh(key)
+
+        age = snapshot.age
+        if age <= self._fresh_for or self._backing_off(key):
+            return snapshot
+
+        with self._lock:
+            seeded = key in self._seeded
+        if self._max_staleness is not None and age > self._max_staleness and not seeded:
+            try:
+                return self._refresh(key)
+            except Exception as e:
+                logger.warning("Refresh failed for %s; serving stale snapshot: %s", key, e)
+                return snapshot
+
+        self._refresh_in_background(key)
+        return snapshot
+
+    def peek(self, key: Hashable) -> Optional[Snapshot]:
+        """Return the current snapshot for a key without loading or refreshing."""
+        with self._lock:
+            return self._snapshots.get(key)
+
+    def snapshots(self) -> Dict[Hashable, Snapshot]:
+        """Return a copy of all current snapshots."""
+        with self._lock:
+            return dict(self._snapshots)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        with self._lock:
+            self._snapshots.clear()
+            self._seeded.clear()
+            self._failed_at.clear()
+
+    def _backing_off(self, key: Hashable) -> bool:
+        """Whether a key's last refresh failed less than retry_after seconds ago."""
+        with self._lock:
+            failed_at = self._failed_at.get(key)
+        return failed_at is not None and time.time() - failed_at < self._retry_after
+
+    def _load_from_store(self, key: Hashable) -> Optional[Snapshot]:
+        """Seed the in-memory cache for a key from the persistent store."""
+        if self._store is None:
+            return None
+        snapshot = self._store.load(key)
+        if snapshot is None:
+            return None
+        with self._lock:
+            # Another thread may have loaded a newer snapshot meanwhile
+            if key not in self._snapshots:
+                self._snapshots[key] = snapshot
+                self._seeded.add(key)
+            return self._snapshots[key]
+
+    def _refresh(self, key: Hashable) -> Snapshot:
+        """Load a key synchronously, sharing any load already in flight for it."""
+
+        def load() -> Snapshot:
+            with self._lock:
+                previous = self._snapshots.get(key)
+            try:
+                snapshot = self._loader(key, previous)
+            except Exception:
+                with self._lock:
+                    self._failed_at[key] = time.time()
+                raise
+            with self._lock:
+                self._snapshots[key] = snapshot
+                self._seeded.discard(key)
+                self._failed_at.pop(key, None)
+            if self._store is not None:
+                self._store.save(key, snapshot)
+            return snapshot
+
+        return self._flights.do(key, load)
+
+    def _refresh_in_background(self, key: Hashable) -> None:
+        """Start a background refresh for a key unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._refresh(key)
+            except Exception:
+                # Keep serving the last good snapshot; a stale read retries after retry_after
+                logger.exception("Background refresh failed for %s", key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"snapshot-refresh-{key}", daemon=True).start()
@@ -0,0 +1,116 @@
+"""Persistent, versioned Feather snapshots of fetched CSV data."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Hashable, Optional
+
+import numpy as np
+import pyarrow.feather as feather
+
+from .snapshot_cache import Snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStore:
+    """
+    Keep every fetched source on disk as a versioned Feather file.
+
+    Each key gets its own directory holding one ``<version>.feather`` file per
+    distinct body seen, plus a manifest recording which version is current and
+    when it was last fetched. Files are written uncompressed so they can be
+    memory mapped on load, which makes a cold start after a restart
+    near-instant and lets the app run while the sheets endpoint is down.
+    """
+
+    def __init__(self, root: Path, history: int = 3):
+        self._root = root
+        self._history = history
+        self._lock = threading.Lock()
+
+    def _key_dir(self, key: Hashable) -> Path:
+        """Return the directory holding snapshots for a key."""
+        return self._root / hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+
+    def _read_manifest(self, key_dir: Path) -> Optional[Dict]:
+        """Read a key's manifest, or None if it is missing or corrupt."""
+        try:
+            return json.loads((key_dir / "manifest.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def load(self, key: Hashable) -> Optional[Snapshot]:
+        """
+        Load the current snapshot for a key from disk.
+
+        Args:
+            key: Cache key the snapshot was saved under
+
+        Returns:
+            The stored Snapshot, or None if there is no usable snapshot
+        """
+        key_dir = self._key_dir(key)
+        manifest = self._read_manifest(key_dir)
+        if manifest is None:
+            return None
+
+        try:
+            table = feather.read_table(key_dir / f"{manifest['version']}.feather", memory_map=True)
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning("Ignoring unreadable snapshot for %s: %s", key, e)
+            return None
+
+        data = table.to_pandas()
+        # Arrow stores missing strings as None; restore the NaN that read_csv produces
+        for column in data.columns[data.dtypes == object]:
+            data[column] = data[column].where(data[column].notna(), np.nan)
+
+        return Snapshot(data=data, version=manifest["version"], fetched_at=manifest["fetched_at"])
+
+    def save(self, key: Hashable, snapshot: Snapshot) -> None:
+        """
+        Save a snapshot for a key and make it the current version.
+
+        The Feather file is only written when the version is new; an unchanged
+        snapshot just updates the fetch time in the manifest.
+
+        Args:
+            key: Cache key to save the snapshot under
+            snapshot: Snapshot to persist
+        """
+        key_dir = self._key_dir(key)
+        data_path = key_dir / f"{snapshot.version}.feather"
+
+        with self._lock:
+            key_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                if not data_path.exists():
+                    tmp_path = data_path.with_suffix(f".{os.getpid()}.tmp")
+                    feather.write_feather(snapshot.data, tmp_path, compression="uncompressed")
+                    os.replace(tmp_path, data_path)
+
+                manifest_path = key_dir / "manifest.json"
+                tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(
+                    json.dumps(
+                        {"key": repr(key), "version": snapshot.version, "fetched_at": snapshot.fetched_at}
+                    )
+                )
+                os.replace(tmp_path, manifest_path)
+            except (OSError, ValueError, TypeError) as e:
+                # Mixed-type columns can fail to convert; the in-memory cache still works
+                logger.warning("Could not persist snapshot for %s: %s", key, e)
+                return
+
+            self._prune(key_dir, keep=data_path)
+
+    def _prune(self, key_dir: Path, keep: Path) -> None:
+        """Delete all but the most recent snapshot versions for a key."""
+        versions = sorted(key_dir.glob("*.feather"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in versions[self._history:]:
+            if path != keep:
+                path.unlink(missing_ok=True)
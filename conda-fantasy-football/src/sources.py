@@ -0,0 +1,79 @@
+"""Pluggable backends for reading raw CSV bytes from a source location."""
+
+import hashlib
+import mmap
+from pathlib import Path
+from typing import Callable, Dict
+from urllib.parse import unquote, urlparse
+
+from .http_cache import CachedBody, fetch_body
+from .single_flight import SingleFlight
+
+# Backend signature: location -> raw body
+Backend = Callable[[str], CachedBody]
+
+_backends: Dict[str, Backend] = {}
+
+# Coalesces concurrent downloads of the same URL into one request
+_downloads = SingleFlight()
+
+
+def register_backend(scheme: str, backend: Backend) -> None:
+    """
+    Register a reader for locations with the given URL scheme.
+
+    Args:
+        scheme: URL scheme such as "https" or "file" ("" for plain paths)
+        backend: Function returning the raw body for a location
+    """
+    _backends[scheme] = backend
+
+
+def read_body(location: str) -> CachedBody:
+    """
+    Read the raw CSV body for a source location using its scheme's backend.
+
+    Args:
+        location: HTTP(S) URL, file:// URL or local path
+
+    Returns:
+        CachedBody with the content and its version
+
+    Raises:
+        ValueError: If no backend is registered for the location's scheme
+    """
+    scheme = urlparse(location).scheme.lower()
+    # Treat Windows drive letters ("C:\\...") as plain paths
+    if len(scheme) == 1:
+        scheme = ""
+
+    backend = _backends.get(scheme)
+    if backend is None:
+        raise ValueError(f"No data source backend for scheme '{scheme}' ({location})")
+    return backend(location)
+
+
+def _read_http(url: str) -> CachedBody:
+    """Download a URL with conditional revalidation, coalescing concurrent calls."""
+    return _downloads.do(url, lambda: fetch_body(url))
+
+
+def _read_file(location: str) -> CachedBody:
+    """Read a local file through a read-only memory map."""
+    parsed = urlparse(location)
+    path = Path(unquote(parsed.path)) if parsed.scheme == "file" else Path(location)
+
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            content = b""
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = mapped[:]
+
+    return CachedBody(content=content, version=hashlib.sha256(content).hexdigest(), modified=True)
+
+
+register_backend("http", _read_http)
+register_backend("https", _read_http)
+register_backend("file", _read_file)
+register_backend("", _read_file)
@@ -1,11 +1,13 @@
 """Styling utilities for CPR Fantasy Football."""
 
-import streamlit as st
 from pathlib import Path
 
 
 def load_css():
     """Load and inject custom CSS to match Next.js app styling."""
+    # Imported here so src can be used without Streamlit (see batch_build)
+    import streamlit as st
+
     css_file = Path(__file__).parent.parent / ".streamlit" / "style.css"
 
     if css_file.exists():
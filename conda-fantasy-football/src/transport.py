@@ -0,0 +1,97 @@
+"""Pooled HTTP transport with timeouts and bounded retries for CSV downloads."""
+
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import CSV_URLS, HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_RETRY_BACKOFF, HTTP_TIMEOUTS
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared keep-alive session used for every CSV download.
+
+    Returns:
+        Process-wide requests.Session with a connection pool sized for prefetching
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate"})
+            _session = session
+        return _session
+
+
+def get_timeout(url: str) -> Tuple[float, float]:
+    """
+    Get the (connect, read) timeout for a URL.
+
+    Args:
+        url: URL being fetched; configured sources use their own entry in HTTP_TIMEOUTS
+
+    Returns:
+        Tuple of (connect timeout, read timeout) in seconds
+    """
+    for source, source_url in CSV_URLS.items():
+        if source_url == url and source in HTTP_TIMEOUTS:
+            return HTTP_TIMEOUTS[source]
+    return HTTP_TIMEOUTS["default"]
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter for a retry attempt (0-based)."""
+    return random.uniform(0, HTTP_RETRY_BACKOFF * (2 ** attempt))
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """
+    GET a URL on the shared session, retrying transient failures.
+
+    The response is opened in streaming mode; read it with ``iter_content`` so
+    the (gzip-decoded) body can be consumed as it arrives.
+
+    Args:
+        url: URL to fetch
+        headers: Extra request headers (e.g. conditional request validators)
+
+    Returns:
+        The final response; non-retryable HTTP errors are returned, not raised
+
+    Raises:
+        requests.RequestException: If every attempt failed with a network error
+    """
+    session = get_session()
+    timeout = get_timeout(url)
+    attempt = 0
+
+    while True:
+        try:
+            response = session.get(url, headers=headers, timeout=timeout, stream=True)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= HTTP_RETRIES:
+                return response
+            response.close()
+            logger.warning("HTTP %s from %s (attempt %d)", response.status_code, url, attempt + 1)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= HTTP_RETRIES:
+                raise
+            logger.warning("Request to %s failed (attempt %d): %s", url, attempt + 1, e)
+
+        time.sleep(_backoff(attempt))
+        attempt += 1
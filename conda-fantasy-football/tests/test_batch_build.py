@@ -0,0 +1,63 @@
+"""Tests for the headless batch build."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from src import season_model
+from src.batch_build import HTML_SECTIONS, build_views, write_views
+from src.schemas import SCHEMAS
+from src.snapshot_cache import Snapshot
+
+
+def test_batch_build_does_not_import_streamlit():
+    code = "import sys, src.batch_build; print('streamlit' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_write_views(tmp_path):
+    views = {
+        view: pd.DataFrame({"name": ["Alice"], "points": [0.6]})
+        for _, view, _ in HTML_SECTIONS
+    }
+    views["matches"] = pd.DataFrame({"date": ["01/09/2025"], "players": [[{"name": "Alice", "goals": 2}]]})
+
+    written = write_views(views, tmp_path / "site", (("FINES", "abc123"),))
+
+    assert {path.name for path in written} >= {"matches.json", "matches.parquet", "index.html", "manifest.json"}
+    assert json.loads((tmp_path / "site" / "player_stats.json").read_text()) == [{"name": "Alice", "points": 0.6}]
+    assert pd.read_parquet(tmp_path / "site" / "matches.parquet")["players"][0][0]["goals"] == 2
+    assert "<h2>Match Results</h2>" in (tmp_path / "site" / "index.html").read_text()
+    manifest = json.loads((tmp_path / "site" / "manifest.json").read_text())
+    assert manifest["sources"]["FINES"]["version"] == "abc123"
+    assert manifest["views"]["matches"]["rows"] == 1
+
+
+def test_views_come_from_one_freshly_loaded_model(monkeypatch):
+    sources = {source: pd.DataFrame() for source in season_model.SEASON_SOURCES}
+    sources.update({source: pd.DataFrame(columns=schema.names) for source, schema in SCHEMAS.items()})
+    sources["TEAM_SELECTION"] = pd.DataFrame(
+        {"Team Name": ["Reds"], "Manager": ["Ann"], "Players": ["Alice"], "Total-Points": [7.0]}
+    )
+
+    def stale(sources):
+        raise AssertionError("batch builds must not read the snapshot cache")
+
+    monkeypatch.setattr(season_model, "prefetch_all", stale)
+    monkeypatch.setattr(
+        season_model, "fetch_fresh_snapshot", lambda source: Snapshot(sources[source], f"{source}-v2", 0.0)
+    )
+
+    model = season_model.load_fresh_season_model()
+    views = build_views(model)
+
+    assert dict(model.versions)["TEAM_SELECTION"] == "TEAM_SELECTION-v2"
+    assert views["fantasy_standings"]["total_points"].tolist() == [7.0]
+    assert views["fines_summary"].empty
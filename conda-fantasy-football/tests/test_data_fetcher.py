@@ -0,0 +1,94 @@
+"""Tests for data fetching and parsing utilities."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import data_fetcher
+from src.data_fetcher import parse_number, parse_numbers
+from src.snapshot_cache import SnapshotCache
+
+
+def test_parse_numbers_matches_parse_number_per_cell():
+    values = pd.Series(["£6.00", "$1,050.50", " 3 ", "abc", "", np.nan, None, "-2.5", 7, 1.25], dtype=object)
+
+    expected = [parse_number(value) for value in values]
+
+    assert parse_numbers(values).tolist() == expected
+
+
+def test_parse_numbers_handles_numeric_columns_and_frames():
+    frame = pd.DataFrame({"fees": ["£6", np.nan], "apps": [1.0, np.nan]})
+
+    parsed = parse_numbers(frame)
+
+    assert parsed.dtypes.tolist() == [np.dtype("float64"), np.dtype("float64")]
+    assert parsed.to_dict("list") == {"fees": [6.0, 0.0], "apps": [1.0, 0.0]}
+
+
+def test_fetch_csv_shares_read_only_snapshot_data(monkeypatch, tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_text("Player,Fees\nAlice,£6\nBob,4\n")
+    monkeypatch.setattr(
+        data_fetcher, "_snapshot_cache", SnapshotCache(data_fetcher._load_snapshot, fresh_for=60)
+    )
+
+    first = data_fetcher.fetch_csv(str(path), numeric_columns=["Fees"])
+    second = data_fetcher.fetch_csv(str(path), numeric_columns=["Fees"])
+
+    assert first["Fees"].tolist() == [6.0, 4.0]
+    assert np.shares_memory(first["Fees"].to_numpy(), second["Fees"].to_numpy())
+    with pytest.raises(ValueError, match="read-only"):
+        first.loc[0, "Fees"] = 0.0
+
+    # Columns can still be added or replaced without touching the shared data
+    first["Fees"] = 0.0
+    assert second["Fees"].tolist() == [6.0, 4.0]
+
+
+def test_fetch_fresh_snapshot_bypasses_the_cache(monkeypatch, tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_text("Player\nAlice\n")
+    monkeypatch.setitem(data_fetcher.CSV_URLS, "PLAYER_DATA", str(path))
+    monkeypatch.setattr(
+        data_fetcher, "_snapshot_cache", SnapshotCache(data_fetcher._load_snapshot, fresh_for=60)
+    )
+    cached = data_fetcher.fetch_snapshot("PLAYER_DATA")
+
+    path.write_text("Player\nBob\n")
+
+    assert data_fetcher.fetch_snapshot("PLAYER_DATA") is cached
+    assert data_fetcher.fetch_fresh_snapshot("PLAYER_DATA").data["Player"].tolist() == ["Bob"]
+
+
+def test_prefetch_all_reads_season_sources_into_the_snapshot_cache(monkeypatch, tmp_path):
+    for source in data_fetcher.CSV_URLS:
+        path = tmp_path / f"{source}.csv"
+        path.write_text("Player\nAlice\n")
+        monkeypatch.setitem(data_fetcher.CSV_URLS, source, str(path))
+    cache = SnapshotCache(data_fetcher._load_snapshot, fresh_for=60)
+    monkeypatch.setattr(data_fetcher, "_snapshot_cache", cache)
+
+    snapshots = data_fetcher.prefetch_all()
+
+    assert list(snapshots) == list(data_fetcher.SEASON_SOURCES)
+    assert cache.peek(data_fetcher._source_key("SCORING_SYSTEM")) is None
+    for source, snapshot in snapshots.items():
+        assert data_fetcher.fetch_snapshot(source) is snapshot
+
+
+def test_prefetch_all_skips_the_thread_pool_when_warm(monkeypatch, tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_text("Player\nAlice\n")
+    monkeypatch.setitem(data_fetcher.CSV_URLS, "PLAYER_DATA", str(path))
+    monkeypatch.setattr(
+        data_fetcher, "_snapshot_cache", SnapshotCache(data_fetcher._load_snapshot, fresh_for=60)
+    )
+    cold = data_fetcher.prefetch_all(["PLAYER_DATA"])
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("warm snapshots must not start threads")
+
+    monkeypatch.setattr(data_fetcher, "ThreadPoolExecutor", no_pool)
+
+    assert data_fetcher.prefetch_all(["PLAYER_DATA"]) == cold
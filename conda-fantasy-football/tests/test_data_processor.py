@@ -0,0 +1,174 @@
+"""Tests for player statistics aggregation."""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import data_processor, season_model
+from src.config import MATCH_COLUMNS
+from src.data_fetcher import clean_player_name, parse_number
+from src.dtypes import compact
+from src.schemas import SCHEMAS
+from src.snapshot_cache import Snapshot
+
+
+def legacy_player_stats(data_rows: pd.DataFrame, player_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Row-by-row reference implementation that get_player_stats used to run.
+
+    Players are keyed on their normalized name, as the player registry does, and
+    shown with their Player Data spelling when they have one.
+    """
+    player_stats: Dict[str, Dict] = {}
+    player_data_names: Dict[str, str] = {}
+    for _, row in player_data.iterrows():
+        player_name = clean_player_name(row.get("Player", ""))
+        player_data_names.setdefault(player_name.lower(), player_name)
+
+    for _, row in data_rows.iterrows():
+        player_name = clean_player_name(row.get(MATCH_COLUMNS["PLAYER"], ""))
+        if not player_name:
+            continue
+
+        key = player_name.lower()
+        if key not in player_stats:
+            player_stats[key] = {
+                "name": player_data_names.get(key, player_name),
+                "appearances": 0,
+                "goals": 0,
+                "assists": 0,
+                "clean_sheets": 0,
+                "yellow_cards": 0,
+                "red_cards": 0,
+                "mom1": 0,
+                "mom2": 0,
+                "mom3": 0,
+                "dod": 0,
+                "fantasy_points": 0.0,
+            }
+        stats = player_stats[key]
+
+        positive_only = {
+            "appearances": "APPEARANCE",
+            "clean_sheets": "CLEAN_SHEET",
+            "yellow_cards": "YELLOW_CARD",
+            "red_cards": "RED_CARD",
+            "mom1": "MOM",
+            "mom2": "MOM_2",
+            "mom3": "MOM_3",
+            "dod": "DOD",
+        }
+        for output, key in positive_only.items():
+            value = parse_number(row.get(MATCH_COLUMNS[key], 0))
+            if value > 0:
+                stats[output] += int(value)
+
+        stats["goals"] += int(parse_number(row.get(MATCH_COLUMNS["GOALS"], 0)))
+        stats["assists"] += int(parse_number(row.get(MATCH_COLUMNS["ASSISTS"], 0)))
+        stats["fantasy_points"] += parse_number(row.get(MATCH_COLUMNS["TOTAL_POINTS"], 0))
+
+    for _, row in player_data.iterrows():
+        key = clean_player_name(row.get("Player", "")).lower()
+        if key in player_stats:
+            player_stats[key]["fantasy_points"] += parse_number(row.get("Misc-Points", 0))
+
+    df = pd.DataFrame.from_dict(player_stats, orient="index")
+    if df.empty:
+        return df
+    return df.sort_values("fantasy_points", ascending=False).reset_index(drop=True)
+
+
+def make_match_rows(seed: int, n_rows: int = 400) -> pd.DataFrame:
+    """Build random typed Match Details rows, including blanks and odd values."""
+    rng = np.random.default_rng(seed)
+    # "alice smith" is the same player as "Alice Smith" and is shown with the Player Data spelling
+    names = ["alice smith", "Alice Smith", " Bob Jones ", "Carl Doe", "Dan Brown", np.nan, ""]
+
+    def counts(choices):
+        values = rng.choice(np.array(choices, dtype=float), size=n_rows)
+        values[rng.random(n_rows) < 0.2] = np.nan
+        return values
+
+    rows = {MATCH_COLUMNS["PLAYER"]: rng.choice(np.array(names, dtype=object), size=n_rows)}
+    for key in ("APPEARANCE", "CLEAN_SHEET", "YELLOW_CARD", "RED_CARD", "MOM", "MOM_2", "MOM_3", "DOD"):
+        rows[MATCH_COLUMNS[key]] = counts([0, 1, 1, -1, 1.5])
+    for key in ("GOALS", "ASSISTS"):
+        rows[MATCH_COLUMNS[key]] = counts([0, 1, 2, -1, 2.7])
+    rows[MATCH_COLUMNS["TOTAL_POINTS"]] = np.round(rng.uniform(-3, 15, size=n_rows), 1)
+    return pd.DataFrame(rows)
+
+
+PLAYER_DATA = pd.DataFrame(
+    {
+        "Player": ["Alice Smith", "Bob Jones", "Carl Doe", "Alice Smith", "Nobody", np.nan],
+        "Misc-Points": ["2", "£1.5", "abc", -1, 3, 4],
+    }
+)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_aggregate_player_stats_matches_legacy_loop(seed):
+    data_rows = make_match_rows(seed)
+
+    expected = compact(legacy_player_stats(data_rows, PLAYER_DATA), data_processor.PLAYER_STATS_LAYOUT)
+    actual = data_processor.aggregate_player_stats(data_rows, PLAYER_DATA)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_aggregate_player_stats_without_players_is_empty():
+    data_rows = make_match_rows(0).iloc[:0]
+
+    assert data_processor.aggregate_player_stats(data_rows, PLAYER_DATA).empty
+
+
+def test_get_player_stats_reads_season_model(monkeypatch):
+    data_rows = make_match_rows(42)
+    sources = {source: pd.DataFrame() for source in season_model.SEASON_SOURCES}
+    # Typed sources always have their declared columns
+    sources.update({source: pd.DataFrame(columns=schema.names) for source, schema in SCHEMAS.items()})
+    sources.update(
+        MATCH_DETAILS=data_rows.reindex(columns=SCHEMAS["MATCH_DETAILS"].names), PLAYER_DATA=PLAYER_DATA
+    )
+    monkeypatch.setattr(season_model, "_model", None)
+    monkeypatch.setattr(
+        season_model,
+        "prefetch_all",
+        lambda names: {source: Snapshot(sources[source], "v1", 0.0) for source in names},
+    )
+
+    stats = data_processor.get_player_stats()
+
+    assert list(stats["name"]) == list(legacy_player_stats(data_rows, PLAYER_DATA)["name"])
+    assert stats["fantasy_points"].is_monotonic_decreasing
+
+
+def test_leaderboard_pages_match_a_full_sort():
+    stats = pd.DataFrame(
+        {
+            "name": ["Ann", "Ben", "Cat", "Dan", "Eve"],
+            **{output: [0, 0, 0, 0, 0] for output, _, _ in data_processor.STAT_AGGREGATIONS},
+            "fantasy_points": [9.0, 7.0, 5.0, 3.0, 1.0],
+        }
+    )
+    stats["goals"] = [1, 3, 0, 3, 2]
+    leaderboard = data_processor.Leaderboard(stats)
+
+    page = leaderboard.page("goals", ["goals", "name"], start=1, end=4)
+
+    assert list(page.columns) == ["rank", "name", "goals"]
+    assert list(page["name"]) == ["Dan", "Eve", "Ann"]
+    assert list(page["rank"]) == ["🥈", "🥉", "4"]
+    assert leaderboard.leaders("goals", 2).equals(stats.nlargest(2, "goals"))
+    assert leaderboard.totals["goals"] == 9
+
+
+def test_leaderboard_with_no_players():
+    leaderboard = data_processor.Leaderboard(pd.DataFrame())
+
+    assert len(leaderboard) == 0
+    assert leaderboard.totals["goals"] == 0
+    assert leaderboard.page("goals").empty
+    assert leaderboard.leaders("goals").empty
@@ -0,0 +1,57 @@
+"""Tests for memoizing results derived from the season model."""
+
+from types import SimpleNamespace
+
+from src import derived_cache
+from src.derived_cache import DerivedCache, derived
+
+
+def test_cache_evicts_least_recently_used():
+    cache = DerivedCache(max_entries=2)
+    calls = []
+
+    def compute(key):
+        calls.append(key)
+        return key.upper()
+
+    assert cache.get("a", lambda: compute("a")) == "A"
+    cache.get("b", lambda: compute("b"))
+    cache.get("a", lambda: compute("a"))  # Hit: "b" is now least recently used
+    cache.get("c", lambda: compute("c"))
+    cache.get("a", lambda: compute("a"))
+    cache.get("b", lambda: compute("b"))
+
+    assert calls == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_derived_is_keyed_on_versions_and_arguments(monkeypatch):
+    monkeypatch.setattr(derived_cache, "_cache", DerivedCache(max_entries=8))
+    model = SimpleNamespace(versions=(("FINES", "v1"),))
+    monkeypatch.setattr(derived_cache, "get_season_model", lambda: model)
+    calls = []
+
+    @derived
+    def summary(model, limit):
+        calls.append((model.versions, limit))
+        return len(calls)
+
+    assert summary(5.0) == summary(5.0) == 1
+    assert summary(10.0) == 2
+
+    model = SimpleNamespace(versions=(("FINES", "v2"),))
+    assert summary(5.0) == 3
+    assert calls[-1] == ((("FINES", "v2"),), 5.0)
+
+
+def test_derived_uses_a_given_model(monkeypatch):
+    monkeypatch.setattr(derived_cache, "_cache", DerivedCache(max_entries=8))
+    current = SimpleNamespace(versions=(("FINES", "v2"),))
+    monkeypatch.setattr(derived_cache, "get_season_model", lambda: current)
+
+    @derived
+    def version(model):
+        return model.versions
+
+    assert version(model=SimpleNamespace(versions=(("FINES", "v1"),))) == (("FINES", "v1"),)
+    assert version() == (("FINES", "v2"),)
@@ -0,0 +1,37 @@
+"""Tests for the compact dtype policy."""
+
+import numpy as np
+import pandas as pd
+
+from src.dtypes import COUNT, LABEL, POINTS, compact, memory_report
+
+
+def test_compact_applies_layout():
+    df = pd.DataFrame(
+        {
+            "name": ["Alice", "Bob", "Alice"],
+            "goals": [1.0, 2.7, 0.0],
+            "big": [0, 1000, 2],
+            "points": [1, 7.8, 3],
+        }
+    )
+    layout = {"name": LABEL, "goals": COUNT, "big": COUNT, "points": POINTS, "missing": LABEL}
+
+    compacted = compact(df, layout)
+
+    assert isinstance(compacted["name"].dtype, pd.CategoricalDtype)
+    assert compacted["goals"].tolist() == [1, 2, 0]
+    assert compacted.dtypes[["goals", "big", "points"]].tolist() == [np.int8, np.int16, np.float64]
+    # Points come back exactly as parsed, without float32 rounding noise
+    assert compacted["points"].tolist() == [1.0, 7.8, 3.0]
+    assert df["goals"].dtype == np.float64
+
+
+def test_memory_report_counts_bytes_per_row():
+    tables = {"people": pd.DataFrame({"age": np.arange(4, dtype="int64")}), "empty": pd.DataFrame()}
+
+    report = memory_report(tables).set_index("table")
+
+    assert report.loc["people", "rows"] == 4
+    assert report.loc["people", "bytes_per_row"] >= 8
+    assert report.loc["empty", "bytes_per_row"] == 0.0
@@ -0,0 +1,54 @@
+"""Tests for the fantasy teams and squads tables."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from src import derived_cache
+from src.derived_cache import DerivedCache
+from src.fantasy_processor import build_fantasy_tables, get_fantasy_standings, get_team_squad
+
+
+TEAM_DATA = pd.DataFrame(
+    {
+        "Team Name": ["Reds", "Reds", "Blues", "Blues", "Greens", np.nan],
+        "Manager": ["Ann", "Ann", "Ben", "Ben", "Cat", "Dan"],
+        "Players": ["Alice", "Bob", "Carl", "Dan", np.nan, "Eve"],
+        "Price": [6.0, 4.5, 5.0, 5.5, np.nan, 4.0],
+        "Position": ["DEF", "FWD", "MID", "DEF", np.nan, "GK"],
+        "Total-Points": [10.0, 30.0, 12.0, 50.0, np.nan, 9.0],
+        "Team-Points": [40.0, 40.0, 62.0, 62.0, np.nan, 9.0],
+    }
+)
+
+
+def test_build_fantasy_tables_ranks_teams_and_presorts_squads():
+    teams, squads = build_fantasy_tables(TEAM_DATA)
+
+    assert list(teams["team_name"]) == ["Blues", "Reds", "Greens"]
+    assert list(teams["total_points"]) == [62.0, 40.0, 0.0]
+    assert list(teams["rank"]) == [1, 2, 3]
+    assert isinstance(squads["position"].dtype, pd.CategoricalDtype)
+
+    squad_names = [list(get_team_squad(squads, team)["name"]) for _, team in teams.iterrows()]
+    assert squad_names == [["Dan", "Carl"], ["Bob", "Alice"], []]
+
+
+def test_get_team_squad_is_a_view():
+    teams, squads = build_fantasy_tables(TEAM_DATA)
+
+    squad = get_team_squad(squads, teams.iloc[0])
+
+    assert np.shares_memory(squad["points"].to_numpy(), squads["points"].to_numpy())
+
+
+def test_get_fantasy_standings(monkeypatch):
+    teams, _ = build_fantasy_tables(TEAM_DATA)
+    monkeypatch.setattr(derived_cache, "_cache", DerivedCache())
+    monkeypatch.setattr(derived_cache, "get_season_model", lambda: SimpleNamespace(versions=(), teams=teams))
+
+    standings = get_fantasy_standings()
+
+    assert list(standings["rank"]) == ["🥇", "🥈", "🥉"]
+    assert list(standings["players"]) == [2, 2, 0]
@@ -0,0 +1,60 @@
+"""Tests for threshold queries on fines."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fines_processor import FinesIndex, build_player_fines, calculate_filtered_fines
+from src.player_registry import build_player_registry
+
+
+PLAYERS = pd.DataFrame(
+    {
+        "name": ["Alice", "Bob", "Carl"],
+        "fine_details": [
+            [{"amount": 5.0}, {"amount": 2.5}, {"amount": 10.0}, {"amount": 1.0}],
+            [],
+            [{"amount": 20.0}],
+        ],
+    }
+)
+
+
+@pytest.mark.parametrize("max_amount", [0.0, 1.0, 2.5, 5.0, 7.5, 50.0])
+def test_summarize_matches_calculate_filtered_fines(max_amount):
+    summary = FinesIndex(PLAYERS).summarize(max_amount)
+
+    for idx, details in PLAYERS["fine_details"].items():
+        expected = calculate_filtered_fines(details, max_amount=max_amount)
+        assert summary.at[idx, "total"] == pytest.approx(expected["total"])
+        assert summary.at[idx, "count"] == expected["count"]
+        assert summary.at[idx, "average"] == pytest.approx(expected["average"])
+        miscellaneous = sum(f["amount"] for f in details if f["amount"] > max_amount)
+        assert summary.at[idx, "miscellaneous"] == pytest.approx(miscellaneous)
+
+
+def test_max_amount():
+    assert FinesIndex(PLAYERS).max_amount == 20.0
+    assert FinesIndex(PLAYERS.iloc[:0]).max_amount == 0.0
+
+
+def test_fines_are_named_as_in_player_data():
+    fines_data = pd.DataFrame(
+        {
+            "_2": [np.nan] * 4 + ["01/09/2025", "02/09/2025", "03/09/2025"],
+            "_3": [np.nan] * 4 + ["£2.00", "£1.50", "£3.00"],
+            "_4": [np.nan] * 4 + ["Late", "Kit", "Late"],
+            "_5": ["Fines", np.nan, np.nan, "Player", "Alice Smyth", "alice smith", "Zara Quill"],
+        }
+    )
+    registry = build_player_registry(
+        {"PLAYER_DATA": pd.DataFrame({"Player": ["Alice Smith"]}), "FINES": fines_data}
+    )
+
+    fines = build_player_fines(fines_data, registry)
+
+    # The near miss takes the Player Data name; the unmatched label is kept as written
+    assert fines[["name", "total_fines", "fine_count"]].astype({"name": str}).to_dict("records") == [
+        {"name": "Alice Smith", "total_fines": 3.5, "fine_count": 2},
+        {"name": "Zara Quill", "total_fines": 3.0, "fine_count": 1},
+    ]
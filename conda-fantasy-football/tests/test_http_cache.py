@@ -0,0 +1,66 @@
+"""Tests for conditional HTTP fetching."""
+
+import hashlib
+
+from src import http_cache
+from src.http_cache import fetch_body
+
+
+class FakeResponse:
+    """Streaming response stand-in usable as a context manager."""
+
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+
+def fake_transport(monkeypatch, responses):
+    """Answer transport.get with the given responses in order; return the request headers seen."""
+    sent = []
+
+    def get(url, headers=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(http_cache.transport, "get", get)
+    return sent
+
+
+def test_not_modified_reuses_the_cached_body_and_validators(monkeypatch, tmp_path):
+    body = b"Player\nAlice\n"
+    validators = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Sep 2025 10:00:00 GMT"}
+    sent = fake_transport(monkeypatch, [FakeResponse(200, body, validators), FakeResponse(304), FakeResponse(304)])
+
+    first = fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path)
+    second = fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path)
+    third = fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path)
+
+    assert first.modified and not second.modified and not third.modified
+    assert second.content == third.content == body
+    assert second.version == third.version == first.version == hashlib.sha256(body).hexdigest()
+    # The validators stored with the first body are sent on every revalidation
+    expected = {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Sep 2025 10:00:00 GMT"}
+    assert sent == [{}, expected, expected]
+
+
+def test_unchanged_body_without_validators_is_not_modified(monkeypatch, tmp_path):
+    fake_transport(monkeypatch, [FakeResponse(200, b"a,b\n"), FakeResponse(200, b"a,b\n"), FakeResponse(200, b"a,c\n")])
+
+    assert fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path).modified
+    assert not fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path).modified
+    assert fetch_body("https://example.com/sheet.csv", cache_dir=tmp_path).content == b"a,c\n"
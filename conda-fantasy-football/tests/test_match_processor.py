@@ -0,0 +1,65 @@
+"""Tests for match grouping and score parsing."""
+
+import numpy as np
+import pandas as pd
+
+from src.config import MATCH_COLUMNS
+from src.match_processor import MatchIndex, build_match_tables, parse_score, parse_scores
+from src.player_registry import build_player_registry
+from src.schemas import MATCH_SCHEMA
+
+
+def test_parse_scores_matches_parse_score():
+    descriptions = pd.Series(
+        ["CPR 3v2 Hackney FC", "CPRA 4v4 Arsenal Vets ", "cpra 1v0 Dalston", "CPR vs Somebody", "Friendly"]
+    )
+
+    expected = [parse_score(description) for description in descriptions]
+    actual = parse_scores(descriptions)
+
+    assert list(actual.itertuples(index=False, name=None)) == expected
+
+
+def test_build_match_tables_groups_players_and_sorts_by_date():
+    rows = pd.DataFrame({name: [np.nan] * 4 for name in MATCH_SCHEMA.names})
+    rows[MATCH_COLUMNS["DATE"]] = ["01/09/2025", "01/09/2025", "15/09/2025", "01/09/2025"]
+    rows[MATCH_COLUMNS["GAME"]] = ["CPR 2v1 Hackney", "CPR 2v1 Hackney", "CPRA 0v3 Stoke", "CPR 2v1 Hackney"]
+    rows[MATCH_COLUMNS["GAMEWEEK"]] = ["1", "1", "2", "1"]
+    rows[MATCH_COLUMNS["PLAYER"]] = ["Alice", "Bob", "Carl", "Dan"]
+    rows[MATCH_COLUMNS["GOALS"]] = [2.0, np.nan, 0.0, 0.0]
+
+    matches, performances = build_match_tables(rows)
+
+    assert list(matches["date"]) == ["15/09/2025", "01/09/2025"]
+    assert list(matches["score"]) == ["0-3", "2-1"]
+    hackney_id = matches.loc[matches["team"] == "CPR", "match_id"].item()
+    hackney = performances[performances["match_id"] == hackney_id]
+    assert list(hackney["name"]) == ["Alice", "Bob", "Dan"]
+    assert list(hackney["goals"]) == [2.0, 0.0, 0.0]
+
+
+def test_match_index_filters_tallies_and_presorts_players():
+    rows = pd.DataFrame({name: [np.nan] * 6 for name in MATCH_SCHEMA.names})
+    rows[MATCH_COLUMNS["DATE"]] = ["01/09/2025", "01/09/2025", "15/09/2025", "15/09/2025", "22/09/2025", "bad"]
+    rows[MATCH_COLUMNS["GAME"]] = [
+        "CPR 2v1 Hackney", "CPR 2v1 Hackney", "CPRA 0v3 Stoke", "CPRA 0v3 Stoke", "CPR 1v1 Stoke", "CPR 0v2 Hackney",
+    ]
+    rows[MATCH_COLUMNS["GAMEWEEK"]] = ["1", "1", "2", "2", "3", "4"]
+    rows[MATCH_COLUMNS["PLAYER"]] = ["Alice", "Bob", "alice", "Carl", "Bob", "Alice"]
+    rows[MATCH_COLUMNS["TOTAL_POINTS"]] = [2.0, 5.0, 1.0, 3.0, 4.0, 0.0]
+    matches, performances = build_match_tables(rows)
+    index = MatchIndex(matches, performances, build_player_registry({"MATCH_DETAILS": rows}))
+    alice = index.options("player_id")[0]
+
+    assert list(matches["opponent"].iloc[index.select(opponent="Stoke")[0]]) == ["Stoke", "Stoke"]
+    assert index.select(opponent="Stoke")[1] == (0, 1, 1)
+    assert index.select(team="CPR", player_id=alice)[1] == (1, 0, 1)
+    assert index.select(player_id=alice)[1] == (1, 0, 2)
+
+    positions, tally = index.select(start=pd.Timestamp("2025-09-10"), end=pd.Timestamp("2025-09-30"))
+    assert list(matches["gameweek"].iloc[positions]) == ["3", "2"]
+    assert tally == (0, 1, 1)
+    assert index.date_range() == (pd.Timestamp("2025-09-01"), pd.Timestamp("2025-09-22"))
+
+    hackney_id = matches.loc[matches["gameweek"] == "1", "match_id"].item()
+    assert list(index.players(hackney_id)["name"]) == ["Bob", "Alice"]
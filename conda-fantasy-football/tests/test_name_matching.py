@@ -0,0 +1,26 @@
+"""Tests for trigram name matching."""
+
+from src.name_matching import TrigramIndex, trigrams
+
+
+def test_identical_names_score_one():
+    index = TrigramIndex(["bob jones", "carl doe"])
+
+    assert index.best_match("bob jones") == (0, 1.0)
+
+
+def test_near_miss_prefers_closest_name():
+    index = TrigramIndex(["bob jones", "bob james", "carl doe"])
+
+    position, score = index.best_match("bob jnes")
+
+    assert index.names[position] == "bob jones"
+    assert 0 < score < 1
+
+
+def test_no_shared_trigrams_or_ties_are_not_matches():
+    index = TrigramIndex(["ann", "anne"])
+
+    assert index.best_match("xyz") is None
+    assert TrigramIndex(["ab", "ab"]).best_match("ab") is None
+    assert trigrams("ab") == {"  a", " ab", "ab "}
@@ -0,0 +1,17 @@
+"""Tests for table pagination."""
+
+from src.pagination import page_bounds, page_count
+
+
+def test_page_count_rounds_up_and_has_at_least_one_page():
+    assert page_count(0, 25) == 1
+    assert page_count(25, 25) == 1
+    assert page_count(26, 25) == 2
+
+
+def test_page_bounds_clamps_to_the_table():
+    assert page_bounds(1, 11, 4) == (0, 4)
+    assert page_bounds(3, 11, 4) == (8, 11)
+    assert page_bounds(9, 11, 4) == (8, 11)
+    assert page_bounds(0, 11, 4) == (0, 4)
+    assert page_bounds(1, 0, 4) == (0, 0)
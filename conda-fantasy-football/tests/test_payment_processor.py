@@ -0,0 +1,68 @@
+"""Tests for the payments join."""
+
+import numpy as np
+import pandas as pd
+
+from src.config import MATCH_COLUMNS
+from src.payment_processor import build_player_payments
+
+
+def make_inputs():
+    player_data = pd.DataFrame(
+        {
+            "Player": ["Alice", "Bob", "Carl", " alice "],
+            "Fees": [10.0, 5.0, 0.0, 20.0],
+            "Payments": [30.0, 0.0, 0.0, 40.0],
+            "Appearance": [4.0, 1.0, 0.0, 3.0],
+        }
+    )
+    match_rows = pd.DataFrame(
+        {
+            MATCH_COLUMNS["DATE"]: ["08/09/2025", "01/09/2025", "01/09/2025", np.nan],
+            MATCH_COLUMNS["FEE"]: [5.0, 5.0, 0.0, 5.0],
+            MATCH_COLUMNS["GAME"]: ["CPR 1v0 Stoke", "CPR 2v2 Hackney", "CPR 2v2 Hackney", "CPR 1v0 Stoke"],
+            MATCH_COLUMNS["PLAYER"]: ["ALICE", "Alice", "Bob", "Bob"],
+        }
+    )
+    bank_data = pd.DataFrame(
+        {
+            "_1": ["Date", "02/09/2025", "01/07/2025", "03/09/2025"],
+            "_2": ["Description", "Transfer", "Old transfer", "Transfer"],
+            "_4": [np.nan, 15.0, 10.0, 0.0],
+            "_7": ["Player", "alice", "Alice", "Bob"],
+        }
+    )
+    fines_data = pd.DataFrame(
+        {
+            "_2": [np.nan] * 4 + ["05/09/2025", "04/09/2025"],
+            "_3": [np.nan] * 4 + [2.5, 0.0],
+            "_4": [np.nan] * 4 + ["Late", "Warning"],
+            "_5": [np.nan] * 4 + ["Carl", "Bob"],
+        }
+    )
+    return player_data, match_rows, bank_data, fines_data
+
+
+def test_build_player_payments_joins_sources():
+    payments = build_player_payments(*make_inputs())
+
+    assert list(payments["name"]) == ["alice", "Bob", "Carl"]
+    alice = payments.set_index("name").loc["alice"]
+    # The later Player Data row wins but keeps the first row's position
+    assert alice["match_fees"] == 20.0
+    assert alice["season_fees"] == 50
+    assert alice["balance"] == 30.0
+    assert [detail["date"] for detail in alice["match_details"]] == ["01/09/2025", "08/09/2025"]
+    # Payments before PAYMENT_START_DATE are ignored
+    assert alice["payment_details"] == [{"date": "02/09/2025", "amount": 15.0, "description": "Transfer"}]
+
+    carl = payments.set_index("name").loc["Carl"]
+    assert carl["match_count"] == 0
+    assert carl["fines"] == 2.5
+    assert carl["balance"] == 0.0
+
+
+def test_build_player_payments_without_players_is_empty():
+    player_data, match_rows, bank_data, fines_data = make_inputs()
+
+    assert build_player_payments(player_data.iloc[:0], match_rows, bank_data, fines_data).empty
@@ -0,0 +1,72 @@
+"""Tests for the player ID registry."""
+
+import numpy as np
+import pandas as pd
+
+from src.config import MATCH_COLUMNS
+from src.player_registry import NO_PLAYER, build_player_registry
+
+
+SOURCES = {
+    "PLAYER_DATA": pd.DataFrame({"Player": ["Alice Smith", "Bob Jones", np.nan]}),
+    "MATCH_DETAILS": pd.DataFrame({MATCH_COLUMNS["PLAYER"]: [" alice smith", "Carl Doe", ""]}),
+    "BANK_STATEMENT": pd.DataFrame({"_1": ["Date", "01/09/2025"], "_7": ["Player", "BOB JONES"]}),
+    "FINES": pd.DataFrame({"_5": ["Fines", np.nan, np.nan, "Player", "Carl Doe", "Bob Jones"]}),
+}
+
+
+def test_spellings_share_one_id_per_player():
+    registry = build_player_registry(SOURCES)
+
+    names = pd.Series(["Alice Smith", " alice smith", "BOB JONES", "Carl Doe", "bob jones ", np.nan, "Nobody"])
+    ids = registry.ids(names)
+
+    assert list(ids) == [0, 0, 1, 2, 1, NO_PLAYER, NO_PLAYER]
+    assert list(registry.players["name"]) == ["Alice Smith", "Bob Jones", "Carl Doe"]
+    assert list(registry.players["in_player_data"]) == [True, True, False]
+
+
+def test_unmatched_names_are_reported_without_header_rows():
+    registry = build_player_registry(SOURCES)
+
+    assert registry.unmatched.to_dict("records") == [
+        {"source": "MATCH_DETAILS", "name": "Carl Doe", "rows": 1},
+        {"source": "FINES", "name": "Carl Doe", "rows": 1},
+    ]
+
+
+def test_near_miss_bank_and_fines_names_resolve_to_player_data():
+    sources = dict(SOURCES)
+    sources["BANK_STATEMENT"] = pd.DataFrame(
+        {"_1": ["01/09/2025", "02/09/2025"], "_7": ["Bob Jnes", "Zara Quill"]}
+    )
+    sources["FINES"] = pd.DataFrame({"_5": [np.nan] * 4 + ["alice smyth"]})
+
+    registry = build_player_registry(sources)
+
+    names = pd.Series(["Bob Jnes", "alice smyth", "Alice Smithe", "Zara Quill"])
+
+    assert list(registry.ids(names, fuzzy=True)) == [1, 0, 0, 3]
+    # Without fuzzy only exact keys match
+    assert list(registry.ids(names)) == [NO_PLAYER, NO_PLAYER, NO_PLAYER, 3]
+    assert registry.aliases[["alias", "name"]].to_dict("records") == [
+        {"alias": "bob jnes", "name": "Bob Jones"},
+        {"alias": "alice smyth", "name": "Alice Smith"},
+    ]
+    assert (registry.aliases["score"] >= 0.6).all()
+    assert list(registry.unmatched["name"]) == ["Carl Doe", "Zara Quill"]
+
+
+def test_match_details_names_are_not_resolved_by_bank_aliases():
+    sources = dict(SOURCES)
+    sources["MATCH_DETAILS"] = pd.DataFrame({MATCH_COLUMNS["PLAYER"]: ["Bob Jnes"]})
+    without_bank = build_player_registry({k: v for k, v in sources.items() if k != "BANK_STATEMENT"})
+    sources["BANK_STATEMENT"] = pd.DataFrame({"_1": ["01/09/2025"], "_7": ["Bob Jnes"]})
+    registry = build_player_registry(sources)
+
+    # The Match Details typo stays its own player whatever the bank sheet holds;
+    # the same spelling in the bank sheet resolves to Bob Jones
+    typo = pd.Series(["Bob Jnes"])
+    assert registry.ids(typo).item() == without_bank.ids(typo).item() == 2
+    assert registry.ids(typo, fuzzy=True).item() == 1
+    assert registry.players.loc[2, "name"] == "Bob Jnes"
@@ -0,0 +1,45 @@
+"""Tests for the typed CSV schemas."""
+
+import numpy as np
+
+from src.schemas import BANK_SCHEMA, MATCH_SCHEMA
+
+
+def test_number_columns_are_coerced_from_currency():
+    content = (
+        b'01/09/2025,Subs,CR,"\xc2\xa31,050.50",,$6,Alice\n'
+        b"02/09/2025,Kit,DR,,12,abc,Bob\n"
+    )
+
+    df = BANK_SCHEMA.parse(content)
+
+    assert list(df.columns) == BANK_SCHEMA.names
+    assert all(df[name].dtype == np.float64 for name in BANK_SCHEMA.number_columns)
+    assert df["_4"].tolist()[0] == 1050.5
+    assert np.isnan(df["_4"].tolist()[1])
+    assert df["_5"].tolist()[1] == 12.0
+    # Unparseable numbers are NaN, not errors
+    assert df["_6"].tolist()[0] == 6.0 and np.isnan(df["_6"].tolist()[1])
+    assert df["_7"].tolist() == ["Alice", "Bob"]
+
+
+def test_header_rows_are_dropped_and_blanks_are_nan():
+    header = b",".join([b"h"] * 29) + b"\n"
+    row = b"01/09/2025,6," + b",".join([b""] * 27) + b"\n"
+
+    df = MATCH_SCHEMA.parse(header * 3 + row)
+
+    assert len(df) == 1
+    assert df.at[0, "_1"] == "01/09/2025"
+    assert df.at[0, "_2"] == 6.0
+    assert np.isnan(df.at[0, "_5"]) and np.isnan(df.at[0, "_7"])
+
+
+def test_missing_columns_are_padded():
+    # Only the first 4 columns exist; the rest of the declared columns are NaN
+    df = BANK_SCHEMA.parse(b"01/09/2025,Subs,CR,5\n")
+
+    assert list(df.columns) == BANK_SCHEMA.names
+    assert df.at[0, "_4"] == 5.0
+    assert df[["_5", "_6", "_7"]].isna().all(axis=None)
+    assert df["_5"].dtype == np.float64
@@ -0,0 +1,45 @@
+"""Tests for building and reusing the season model."""
+
+import pandas as pd
+
+from src import season_model
+from src.schemas import SCHEMAS
+from src.snapshot_cache import Snapshot
+
+
+def fake_sources(monkeypatch, version):
+    sources = {source: pd.DataFrame() for source in season_model.SEASON_SOURCES}
+    # Typed sources always have their declared columns
+    sources.update({source: pd.DataFrame(columns=schema.names) for source, schema in SCHEMAS.items()})
+    sources["PLAYER_DATA"] = pd.DataFrame({"Player": ["Alice", " alice", "Bob", None]})
+    sources["TEAM_SELECTION"] = pd.DataFrame(
+        {"Team Name": ["Reds"], "Manager": ["Ann"], "Players": ["Alice"], "Total-Points": [3.0]}
+    )
+    monkeypatch.setattr(
+        season_model,
+        "prefetch_all",
+        lambda names: {source: Snapshot(sources[source], version, 0.0) for source in names},
+    )
+
+
+def test_model_is_reused_until_a_source_changes(monkeypatch):
+    monkeypatch.setattr(season_model, "_model", None)
+    fake_sources(monkeypatch, "v1")
+
+    first = season_model.get_season_model()
+    assert season_model.get_season_model() is first
+
+    fake_sources(monkeypatch, "v2")
+    second = season_model.get_season_model()
+    assert second is not first
+    assert dict(second.versions)["PLAYER_DATA"] == "v2"
+
+
+def test_model_shares_one_player_registry(monkeypatch):
+    monkeypatch.setattr(season_model, "_model", None)
+    fake_sources(monkeypatch, "v1")
+
+    model = season_model.get_season_model()
+
+    assert list(model.registry.players["name"]) == ["Alice", "Bob"]
+    assert list(model.teams["team_name"]) == ["Reds"]
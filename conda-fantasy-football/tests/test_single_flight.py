@@ -0,0 +1,77 @@
+"""Tests for coalescing concurrent calls."""
+
+import threading
+
+import pytest
+
+from src.single_flight import SingleFlight
+
+
+def run_concurrently(flight, fn, callers=8):
+    """Call flight.do("key", fn) from several threads at once; return results or errors."""
+    results = [None] * callers
+    start = threading.Barrier(callers)
+
+    def call(i):
+        start.wait()
+        try:
+            results[i] = flight.do("key", fn)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_misses_call_the_loader_once():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "body"
+
+    # Hold the leader until every follower has had time to join its call
+    threading.Timer(0.2, release.set).start()
+    results = run_concurrently(flight, load)
+
+    assert results == ["body"] * 8
+    assert len(calls) == 1
+
+
+def test_followers_get_the_leaders_error():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        raise ConnectionError("sheets down")
+
+    threading.Timer(0.2, release.set).start()
+    results = run_concurrently(flight, load)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert len(calls) == 1
+
+
+def test_nothing_is_cached_after_a_call_finishes():
+    flight = SingleFlight()
+    calls = []
+
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    assert flight.do("key", load) == 1
+    assert flight.do("key", load) == 2
+    with pytest.raises(ZeroDivisionError):
+        flight.do("key", lambda: 1 / 0)
+    assert flight.do("key", load) == 3
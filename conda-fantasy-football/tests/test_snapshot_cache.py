@@ -0,0 +1,136 @@
+"""Tests for the stale-while-revalidate snapshot cache."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.snapshot_cache import Snapshot, SnapshotCache, freeze
+from src.snapshot_store import SnapshotStore
+
+
+class Loader:
+    """Loader returning numbered snapshots, optionally failing."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.loaded = threading.Event()
+
+    def __call__(self, key, previous):
+        self.calls += 1
+        try:
+            if self.fail:
+                raise ConnectionError("sheets down")
+            return Snapshot(data=pd.DataFrame({"n": [self.calls]}), version=f"v{self.calls}", fetched_at=time.time())
+        finally:
+            self.loaded.set()
+
+
+def test_freeze_makes_categorical_columns_read_only():
+    df = freeze(pd.DataFrame({"name": pd.Categorical(["Alice", "Bob"]), "goals": [1, 2]}))
+    view = df.copy(deep=False)
+
+    with pytest.raises(ValueError, match="read-only"):
+        view.loc[0, "name"] = "Bob"
+    with pytest.raises(ValueError, match="read-only"):
+        view.loc[0, "goals"] = 5
+    assert df["name"].tolist() == ["Alice", "Bob"]
+    assert not df["name"].cat.categories.to_numpy().flags.writeable
+
+
+def test_freeze_guards_every_column_of_a_shared_block():
+    # freeze relies on pandas writing through the arrays it can reach; if a
+    # pandas upgrade changes that, these writes start succeeding
+    df = freeze(pd.DataFrame({"goals": [1, 2], "assists": [3, 4], "team": ["Reds", "Blues"]}))
+    view = df.copy(deep=False)
+
+    for column, value in [("goals", 5), ("assists", 5), ("team", "Greens")]:
+        with pytest.raises(ValueError, match="read-only"):
+            view.loc[0, column] = value
+    with pytest.raises(ValueError, match="read-only"):
+        view.iloc[1, 1] = 0
+    assert df.to_dict("list") == {"goals": [1, 2], "assists": [3, 4], "team": ["Reds", "Blues"]}
+
+
+def test_freeze_makes_series_read_only():
+    series = freeze(pd.Series([1.5, 2.5], name="points"))
+    view = series.copy(deep=False)
+
+    with pytest.raises(ValueError, match="read-only"):
+        series[0] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        view.iloc[1] = 0.0
+    assert series.tolist() == [1.5, 2.5]
+
+
+def age(cache, key, seconds):
+    """Backdate the cached snapshot for key by the given number of seconds."""
+    cache.peek(key).fetched_at -= seconds
+
+
+def test_fresh_snapshot_is_served_without_loading():
+    loader = Loader()
+    cache = SnapshotCache(loader, fresh_for=60)
+
+    assert cache.get("a").version == "v1"
+    assert cache.get("a").version == "v1"
+    assert loader.calls == 1
+
+
+def test_stale_snapshot_is_served_while_refreshing_in_background():
+    loader = Loader()
+    cache = SnapshotCache(loader, fresh_for=60, max_staleness=900)
+    cache.get("a")
+    age(cache, "a", 120)
+    loader.loaded.clear()
+
+    assert cache.get("a").version == "v1"
+    assert loader.loaded.wait(5)
+    for _ in range(50):
+        if cache.peek("a").version == "v2":
+            break
+        time.sleep(0.01)
+    assert cache.get("a").version == "v2"
+
+
+def test_snapshot_past_max_staleness_blocks_on_refresh():
+    loader = Loader()
+    cache = SnapshotCache(loader, fresh_for=60, max_staleness=900)
+    cache.get("a")
+    age(cache, "a", 1000)
+
+    assert cache.get("a").version == "v2"
+    assert loader.calls == 2
+
+
+def test_failed_refresh_backs_off_instead_of_blocking_every_request():
+    loader = Loader()
+    cache = SnapshotCache(loader, fresh_for=60, max_staleness=900, retry_after=30)
+    cache.get("a")
+    age(cache, "a", 1000)
+    loader.fail = True
+
+    assert [cache.get("a").version for _ in range(3)] == ["v1"] * 3
+    assert loader.calls == 2
+
+    # Once retry_after has passed the next request tries again
+    cache._failed_at["a"] -= 31
+    loader.fail = False
+    assert cache.get("a").version == "v3"
+
+
+def test_store_seeded_snapshot_past_max_staleness_is_served_without_blocking(tmp_path):
+    store = SnapshotStore(tmp_path)
+    old = Snapshot(data=pd.DataFrame({"n": [0]}), version="v0", fetched_at=time.time() - 3600)
+    store.save("a", old)
+
+    # A restart while offline: the stored snapshot is served and refreshed in the background
+    loader = Loader()
+    loader.fail = True
+    cache = SnapshotCache(loader, fresh_for=60, max_staleness=900, store=store)
+    assert cache.get("a").version == "v0"
+    assert loader.loaded.wait(5)
+    assert cache.get("a").version == "v0"
+    assert loader.calls == 1
@@ -0,0 +1,90 @@
+"""Tests for the on-disk Feather snapshot store."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.snapshot_cache import Snapshot
+from src.snapshot_store import SnapshotStore
+
+
+def snapshot(version, fetched_at=100.0, **columns):
+    data = pd.DataFrame(columns or {"n": [1]})
+    return Snapshot(data=data, version=version, fetched_at=fetched_at)
+
+
+def test_round_trip_keeps_data_version_and_fetch_time(tmp_path):
+    store = SnapshotStore(tmp_path)
+    saved = snapshot(
+        "abc123",
+        fetched_at=1234.5,
+        Player=["Alice", np.nan, "Bob"],
+        Goals=[1, 2, 3],
+        Fees=[6.0, np.nan, 4.5],
+    )
+
+    store.save(("url", "PLAYER_DATA"), saved)
+    loaded = SnapshotStore(tmp_path).load(("url", "PLAYER_DATA"))
+
+    assert (loaded.version, loaded.fetched_at) == ("abc123", 1234.5)
+    pd.testing.assert_frame_equal(loaded.data, saved.data)
+    # Missing strings come back as NaN, the way read_csv produces them, not None
+    missing = loaded.data["Player"].iloc[1]
+    assert missing is not None and pd.isna(missing)
+    with pytest.raises(ValueError, match="read-only"):
+        loaded.data.loc[0, "Goals"] = 0
+
+
+def test_unknown_or_corrupt_keys_load_as_none(tmp_path):
+    store = SnapshotStore(tmp_path)
+    assert store.load("missing") is None
+
+    store.save("a", snapshot("v1"))
+    (store._key_dir("a") / "manifest.json").write_text("{not json")
+    assert store.load("a") is None
+
+
+def test_saving_the_same_version_only_updates_the_fetch_time(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save("a", snapshot("v1", fetched_at=100.0))
+    data_path = store._key_dir("a") / "v1.feather"
+    os.utime(data_path, (1, 1))
+
+    store.save("a", snapshot("v1", fetched_at=200.0))
+
+    assert data_path.stat().st_mtime == 1
+    assert store.load("a").fetched_at == 200.0
+
+
+def test_prune_keeps_the_most_recent_history(tmp_path):
+    store = SnapshotStore(tmp_path, history=2)
+    key_dir = store._key_dir("a")
+    for i in range(1, 5):
+        store.save("a", snapshot(f"v{i}"))
+        # Distinct mtimes, oldest first, regardless of filesystem timestamp resolution
+        for j in range(1, i + 1):
+            path = key_dir / f"v{j}.feather"
+            if path.exists():
+                os.utime(path, (j, j))
+
+    assert sorted(path.name for path in key_dir.glob("*.feather")) == ["v3.feather", "v4.feather"]
+    assert store.load("a").version == "v4"
+
+
+def test_prune_never_deletes_the_current_version(tmp_path):
+    store = SnapshotStore(tmp_path, history=1)
+    key_dir = store._key_dir("a")
+    store.save("a", snapshot("v1"))
+    store.save("a", snapshot("v2"))
+    assert sorted(path.name for path in key_dir.glob("*.feather")) == ["v2.feather"]
+
+    # An older version that looks newer than the current one, e.g. after a clock change
+    (key_dir / "v0.feather").write_bytes((key_dir / "v2.feather").read_bytes())
+    os.utime(key_dir / "v0.feather", (200, 200))
+    os.utime(key_dir / "v2.feather", (100, 100))
+
+    store._prune(key_dir, keep=key_dir / "v2.feather")
+
+    assert store.load("a").version == "v2"
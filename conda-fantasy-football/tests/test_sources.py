@@ -0,0 +1,55 @@
+"""Tests for reading raw CSV bodies from source locations."""
+
+import hashlib
+import importlib
+
+import pytest
+
+from src import config
+from src.sources import read_body
+
+
+def test_reads_plain_paths_and_file_urls(tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_bytes(b"Player\nAlice\n")
+
+    by_path = read_body(str(path))
+    by_url = read_body(path.as_uri())
+
+    assert by_path.content == by_url.content == b"Player\nAlice\n"
+    assert by_path.version == by_url.version == hashlib.sha256(b"Player\nAlice\n").hexdigest()
+
+
+def test_reads_empty_files(tmp_path):
+    # mmap cannot map an empty file
+    path = tmp_path / "empty.csv"
+    path.write_bytes(b"")
+
+    assert read_body(str(path)).content == b""
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError, match="ftp"):
+        read_body("ftp://example.com/sheet.csv")
+
+
+@pytest.fixture
+def reload_config(monkeypatch):
+    """Reload config with CPR_DATA_SOURCE set, restoring the default afterwards."""
+
+    def reload(data_source):
+        monkeypatch.setenv("CPR_DATA_SOURCE", data_source)
+        return importlib.reload(config)
+
+    yield reload
+    monkeypatch.delenv("CPR_DATA_SOURCE", raising=False)
+    importlib.reload(config)
+
+
+def test_data_source_override_reads_recorded_csvs(tmp_path, reload_config):
+    (tmp_path / "FINES.csv").write_bytes(b"Fines\n")
+
+    reloaded = reload_config(tmp_path.as_uri() + "/")
+
+    assert reloaded.CSV_URLS["FINES"] == f"{tmp_path.as_uri()}/FINES.csv"
+    assert read_body(reloaded.CSV_URLS["FINES"]).content == b"Fines\n"
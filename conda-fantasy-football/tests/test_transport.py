@@ -0,0 +1,82 @@
+"""Tests for the retrying HTTP transport."""
+
+import pytest
+import requests
+
+from src import transport
+from src.config import CSV_URLS, HTTP_RETRIES, HTTP_TIMEOUTS
+
+
+class FakeSession:
+    """Session stand-in answering each GET with the next outcome (status code or exception)."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.calls.append({"url": url, "timeout": timeout, "stream": stream})
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Install a FakeSession as the shared session and skip backoff sleeps."""
+
+    def install(outcomes):
+        fake = FakeSession(outcomes)
+        monkeypatch.setattr(transport, "get_session", lambda: fake)
+        monkeypatch.setattr(transport, "_backoff", lambda attempt: 0)
+        return fake
+
+    return install
+
+
+def test_transient_errors_are_retried(session):
+    fake = session([503, requests.ConnectionError("reset"), 200])
+
+    assert transport.get("https://example.com/sheet.csv").status_code == 200
+    assert len(fake.calls) == 3
+
+
+def test_retries_stop_at_the_limit(session):
+    fake = session([503] * (HTTP_RETRIES + 2))
+
+    assert transport.get("https://example.com/sheet.csv").status_code == 503
+    assert len(fake.calls) == HTTP_RETRIES + 1
+
+
+def test_network_errors_are_raised_after_the_last_retry(session):
+    fake = session([requests.Timeout("slow")] * (HTTP_RETRIES + 2))
+
+    with pytest.raises(requests.Timeout):
+        transport.get("https://example.com/sheet.csv")
+    assert len(fake.calls) == HTTP_RETRIES + 1
+
+
+def test_client_errors_are_not_retried(session):
+    fake = session([404, 200])
+
+    assert transport.get("https://example.com/sheet.csv").status_code == 404
+    assert len(fake.calls) == 1
+
+
+def test_timeouts_are_passed_through_per_source(session):
+    fake = session([200, 200])
+
+    transport.get(CSV_URLS["MATCH_DETAILS"])
+    transport.get("https://example.com/other.csv")
+
+    assert [call["timeout"] for call in fake.calls] == [HTTP_TIMEOUTS["MATCH_DETAILS"], HTTP_TIMEOUTS["default"]]
+    assert all(call["stream"] for call in fake.calls)